@@ -0,0 +1,17 @@
+"""Offline evaluation of the strategies over recorded market data."""
+
+from .engine import (
+    BacktestResult,
+    MarketData,
+    load_market_data,
+    run_backtest,
+    summarize,
+)
+
+__all__ = [
+    "BacktestResult",
+    "MarketData",
+    "load_market_data",
+    "run_backtest",
+    "summarize",
+]
@@ -0,0 +1,359 @@
+"""Vectorized backtests of the basis and funding strategies.
+
+Recorded ticks are aligned on a regular time grid (last snapshot at or
+before each grid point) and the decision rules of ``BasisStrategy`` and
+``FundingStrategy`` are evaluated on whole arrays at once. Only the
+entry/exit bookkeeping, which is sequential by nature, walks the (sparse)
+list of signals.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from storage.ticks import BOOK, FUNDING, TickArchive
+
+SIDES = ("bid", "ask")
+
+
+@dataclass
+class MarketData:
+    """Both venues' books and funding rates aligned on one time grid.
+
+    Book arrays have shape ``(rows, levels)`` with NaN for missing levels;
+    a NaN size means the venue did not report one. Funding rates are
+    normalised the same way the strategies do it.
+    """
+
+    t: np.ndarray
+    drift_bid_px: np.ndarray
+    drift_bid_sz: np.ndarray
+    drift_ask_px: np.ndarray
+    drift_ask_sz: np.ndarray
+    hyper_bid_px: np.ndarray
+    hyper_bid_sz: np.ndarray
+    hyper_ask_px: np.ndarray
+    hyper_ask_sz: np.ndarray
+    rate_drift: np.ndarray
+    rate_hyper: np.ndarray
+    step_sec: float = 1.0
+
+    def __len__(self) -> int:
+        return len(self.t)
+
+    def save(self, path: str | Path) -> None:
+        """Write each array to ``<path>/<name>.npy`` for memory-mapped loading."""
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        for f in fields(self):
+            if f.name != "step_sec":
+                np.save(path / f"{f.name}.npy", getattr(self, f.name))
+        (path / "step_sec").write_text(repr(self.step_sec))
+
+    @classmethod
+    def load(cls, path: str | Path, mmap: bool = True) -> "MarketData":
+        path = Path(path)
+        mode = "r" if mmap else None
+        arrays = {
+            f.name: np.load(path / f"{f.name}.npy", mmap_mode=mode)
+            for f in fields(cls)
+            if f.name != "step_sec"
+        }
+        return cls(step_sec=float((path / "step_sec").read_text()), **arrays)
+
+
+def _book_matrix(cols: Dict[str, np.ndarray], side: str, kind: str) -> np.ndarray:
+    names = []
+    i = 0
+    while f"{side}_{kind}_{i}" in cols:
+        names.append(f"{side}_{kind}_{i}")
+        i += 1
+    if not names:
+        return np.full((len(cols["ts"]), 1), np.nan)
+    return np.stack([np.asarray(cols[n], dtype=float) for n in names], axis=1)
+
+
+def _asof(ts: np.ndarray, grid: np.ndarray) -> np.ndarray:
+    """Index of the last sample at or before each grid point (-1 if none)."""
+    return np.searchsorted(ts, grid, side="right") - 1
+
+
+def _take(values: np.ndarray, idx: np.ndarray) -> np.ndarray:
+    out = values[np.clip(idx, 0, None)]
+    out[idx < 0] = np.nan
+    return out
+
+
+def _first_rate(cols: Dict[str, np.ndarray], keys) -> np.ndarray:
+    """Vectorized ``f.get(keys[0]) or f.get(keys[1], 0)``."""
+    n = len(cols["ts"])
+    out = np.zeros(n)
+    for key in reversed(keys):
+        if key in cols:
+            col = np.asarray(cols[key], dtype=float)
+            use = np.isfinite(col) & (col != 0)
+            out = np.where(use, col, out)
+    return out
+
+
+def load_market_data(
+    archive: TickArchive,
+    drift_symbol: str,
+    hyper_symbol: str,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    step_sec: float = 1.0,
+) -> MarketData:
+    """Align both venues' recorded books and funding on a ``step_sec`` grid."""
+    books = {
+        "drift": archive.read("drift", drift_symbol, BOOK, start, end),
+        "hyper": archive.read("hyperliquid", hyper_symbol, BOOK, start, end),
+    }
+    funding = {
+        "drift": archive.read("drift", drift_symbol, FUNDING, start, end),
+        "hyper": archive.read("hyperliquid", hyper_symbol, FUNDING, start, end),
+    }
+    if not len(books["drift"]["ts"]) or not len(books["hyper"]["ts"]):
+        raise ValueError("no recorded books for both venues in the requested range")
+
+    t0 = max(books["drift"]["ts"][0], books["hyper"]["ts"][0])
+    t1 = min(books["drift"]["ts"][-1], books["hyper"]["ts"][-1])
+    grid = np.arange(t0, t1 + step_sec / 2, step_sec)
+
+    arrays: Dict[str, Any] = {"t": grid, "step_sec": step_sec}
+    for venue, cols in books.items():
+        idx = _asof(np.asarray(cols["ts"]), grid)
+        for side in SIDES:
+            for kind in ("px", "sz"):
+                arrays[f"{venue}_{side}_{kind}"] = _take(_book_matrix(cols, side, kind), idx)
+
+    rates = {
+        "drift": _first_rate(funding["drift"], ("last_funding_rate", "funding_rate")) / 1e9,
+        "hyper": _first_rate(funding["hyper"], ("funding_rate", "last_funding_rate")),
+    }
+    for venue, cols in funding.items():
+        idx = _asof(np.asarray(cols["ts"]), grid)
+        rate = _take(rates[venue], idx) if len(cols["ts"]) else np.zeros(len(grid))
+        arrays[f"rate_{venue}"] = np.nan_to_num(rate)
+    return MarketData(**arrays)
+
+
+def avg_fill_price(px: np.ndarray, sz: np.ndarray, amount: float) -> np.ndarray:
+    """Vectorized ``avg_price`` of the strategies for every row of a book side."""
+    present = np.isfinite(px)
+    size = np.where(np.isnan(sz), amount, sz)
+    size = np.where(present, size, 0.0)
+    filled_before = np.cumsum(size, axis=1) - size
+    take = np.clip(np.minimum(size, amount - filled_before), 0.0, None)
+    cost = np.where(take > 0, px, 0.0) * take
+    remain = amount - take.sum(axis=1)
+    last = present.shape[1] - 1 - np.argmax(present[:, ::-1], axis=1)
+    last_px = px[np.arange(len(px)), last]
+    return (cost.sum(axis=1) + np.where(remain > 0, last_px * remain, 0.0)) / amount
+
+
+def slippage_bps(px: np.ndarray, avg: np.ndarray) -> np.ndarray:
+    best = px[:, 0]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.abs((avg - best) / best * 10000)
+
+
+@dataclass
+class Signals:
+    """Entry decision per grid row; ``long_drift`` is meaningful where ``enter``."""
+
+    enter: np.ndarray
+    long_drift: np.ndarray
+    long_price: np.ndarray
+    short_price: np.ndarray
+    profit: np.ndarray
+
+
+def _sides(data: MarketData, amount: float) -> Dict[str, np.ndarray]:
+    out = {}
+    for venue in ("drift", "hyper"):
+        bid_px, bid_sz = getattr(data, f"{venue}_bid_px"), getattr(data, f"{venue}_bid_sz")
+        ask_px, ask_sz = getattr(data, f"{venue}_ask_px"), getattr(data, f"{venue}_ask_sz")
+        out[f"buy_{venue}"] = avg_fill_price(ask_px, ask_sz, amount)
+        out[f"sell_{venue}"] = avg_fill_price(bid_px, bid_sz, amount)
+        out[f"buy_{venue}_slip"] = slippage_bps(ask_px, out[f"buy_{venue}"])
+        out[f"sell_{venue}_slip"] = slippage_bps(bid_px, out[f"sell_{venue}"])
+        out[f"valid_{venue}"] = np.isfinite(bid_px[:, 0]) & np.isfinite(ask_px[:, 0])
+    return out
+
+
+def basis_signals(data: MarketData, params: Dict[str, Any]) -> Signals:
+    """``BasisStrategy.find_opportunity`` over every grid row."""
+    amount = float(params.get("amount", 0))
+    fee_d = float(params.get("fees", {}).get("drift", 0))
+    fee_h = float(params.get("fees", {}).get("hyperliquid", 0))
+    max_slip = float(params.get("max_slippage_bps", 0))
+    min_profit = float(params.get("min_profit_usd", 0))
+    s = _sides(data, amount)
+
+    with np.errstate(invalid="ignore"):
+        profit_dl = (s["sell_hyper"] - s["buy_drift"]) * amount - 2 * (
+            s["buy_drift"] * amount * fee_d + s["sell_hyper"] * amount * fee_h
+        )
+        profit_hl = (s["sell_drift"] - s["buy_hyper"]) * amount - 2 * (
+            s["buy_hyper"] * amount * fee_h + s["sell_drift"] * amount * fee_d
+        )
+        slip_dl = np.maximum(s["buy_drift_slip"], s["sell_hyper_slip"])
+        slip_hl = np.maximum(s["buy_hyper_slip"], s["sell_drift_slip"])
+        profit_dl = np.where(slip_dl > max_slip, -np.inf, profit_dl)
+        profit_hl = np.where(slip_hl > max_slip, -np.inf, profit_hl)
+
+        valid = s["valid_drift"] & s["valid_hyper"]
+        take_dl = valid & (profit_dl >= min_profit) & (profit_dl >= profit_hl)
+        take_hl = valid & ~take_dl & (profit_hl >= min_profit)
+
+    return Signals(
+        enter=take_dl | take_hl,
+        long_drift=take_dl,
+        long_price=np.where(take_dl, s["buy_drift"], s["buy_hyper"]),
+        short_price=np.where(take_dl, s["sell_hyper"], s["sell_drift"]),
+        profit=np.where(take_dl, profit_dl, profit_hl),
+    )
+
+
+def funding_signals(data: MarketData, params: Dict[str, Any]) -> Signals:
+    """``FundingStrategy.find_opportunity`` over every grid row."""
+    amount = float(params.get("amount", 0))
+    fee_d = float(params.get("fees", {}).get("drift", 0))
+    fee_h = float(params.get("fees", {}).get("hyperliquid", 0))
+    max_slip = float(params.get("max_slippage_bps", 0))
+    min_profit = float(params.get("min_profit_usd", 0))
+    hold_hours = float(params.get("hold_time_sec", 3600)) / 3600
+    s = _sides(data, amount)
+
+    with np.errstate(invalid="ignore"):
+        mid = ((s["buy_drift"] + s["sell_drift"]) / 2 + (s["buy_hyper"] + s["sell_hyper"]) / 2) / 2
+        spread = data.rate_drift - data.rate_hyper
+        gross = np.abs(spread) * mid * amount * hold_hours
+
+        # spread > 0: long hyperliquid at its best ask, short drift at its best bid
+        long_hyper = spread > 0
+        long_price = np.where(long_hyper, data.hyper_ask_px[:, 0], data.drift_ask_px[:, 0])
+        short_price = np.where(long_hyper, data.drift_bid_px[:, 0], data.hyper_bid_px[:, 0])
+        drift_slip = np.where(long_hyper, s["sell_drift_slip"], s["buy_drift_slip"])
+        hyper_slip = np.where(long_hyper, s["buy_hyper_slip"], s["sell_hyper_slip"])
+        fee_long = long_price * amount * np.where(long_hyper, fee_h, fee_d)
+        fee_short = short_price * amount * np.where(long_hyper, fee_d, fee_h)
+        profit = gross - 2 * (fee_long + fee_short)
+
+        enter = (
+            s["valid_drift"]
+            & s["valid_hyper"]
+            & (profit >= min_profit)
+            & (drift_slip <= max_slip)
+            & (hyper_slip <= max_slip)
+        )
+
+    return Signals(
+        enter=enter,
+        long_drift=~long_hyper,
+        long_price=long_price,
+        short_price=short_price,
+        profit=profit,
+    )
+
+
+SIGNALS = {"basis": basis_signals, "funding": funding_signals}
+
+
+@dataclass
+class BacktestResult:
+    """Per-trade columns and aggregate statistics of one backtest."""
+
+    trades: Dict[str, np.ndarray]
+    summary: Dict[str, float]
+
+
+def _entries(t: np.ndarray, enter: np.ndarray, hold_sec: float):
+    """Non-overlapping entry and exit rows: a new entry waits for the exit."""
+    signal_rows = np.flatnonzero(enter)
+    entries, exits = [], []
+    k = 0
+    while k < len(signal_rows):
+        i = signal_rows[k]
+        j = int(np.searchsorted(t, t[i] + hold_sec, side="left"))
+        if j >= len(t):
+            break
+        entries.append(i)
+        exits.append(j)
+        k = int(np.searchsorted(signal_rows, j, side="left"))
+    return np.asarray(entries, dtype=np.int64), np.asarray(exits, dtype=np.int64)
+
+
+def run_backtest(data: MarketData, params: Dict[str, Any], strategy: str = "basis") -> BacktestResult:
+    """Evaluate ``strategy`` on ``data`` and settle each trade after ``hold_time_sec``.
+
+    A trade is entered on the first signal while flat, held for
+    ``hold_time_sec`` and closed by crossing both books for ``amount``.
+    PnL covers the price change of both legs, taker fees on entry and exit
+    and the funding accrued by the hedged position while it is held.
+    """
+    amount = float(params.get("amount", 0))
+    fee_d = float(params.get("fees", {}).get("drift", 0))
+    fee_h = float(params.get("fees", {}).get("hyperliquid", 0))
+    hold_sec = float(params.get("hold_time_sec", 3600))
+
+    sig = SIGNALS[strategy](data, params)
+    entry, exit_ = _entries(data.t, sig.enter, hold_sec)
+    long_drift = sig.long_drift[entry]
+
+    s = _sides(data, amount)
+    exit_long = np.where(long_drift, s["sell_drift"][exit_], s["sell_hyper"][exit_])
+    exit_short = np.where(long_drift, s["buy_hyper"][exit_], s["buy_drift"][exit_])
+    entry_long = sig.long_price[entry]
+    entry_short = sig.short_price[entry]
+
+    fee_long = np.where(long_drift, fee_d, fee_h)
+    fee_short = np.where(long_drift, fee_h, fee_d)
+    fees = amount * (
+        (entry_long + exit_long) * fee_long + (entry_short + exit_short) * fee_short
+    )
+    price_pnl = (exit_long - entry_long) * amount + (entry_short - exit_short) * amount
+
+    # the short leg receives its venue's rate, the long leg pays its own
+    mid = (data.drift_bid_px[:, 0] + data.drift_ask_px[:, 0] + data.hyper_bid_px[:, 0] + data.hyper_ask_px[:, 0]) / 4
+    accrual = np.concatenate(
+        ([0.0], np.cumsum(np.nan_to_num((data.rate_drift - data.rate_hyper) * mid) * amount * data.step_sec / 3600))
+    )
+    funding_pnl = np.where(long_drift, -1.0, 1.0) * (accrual[exit_] - accrual[entry])
+
+    pnl = price_pnl + funding_pnl - fees
+    trades = {
+        "entry_ts": data.t[entry],
+        "exit_ts": data.t[exit_],
+        "long_exchange": np.where(long_drift, "drift", "hyperliquid"),
+        "entry_long": entry_long,
+        "entry_short": entry_short,
+        "exit_long": exit_long,
+        "exit_short": exit_short,
+        "expected_profit": sig.profit[entry],
+        "price_pnl": price_pnl,
+        "funding_pnl": funding_pnl,
+        "fees": fees,
+        "pnl": pnl,
+    }
+    return BacktestResult(trades=trades, summary=summarize(pnl, rows=len(data), signals=int(sig.enter.sum())))
+
+
+def summarize(pnl: np.ndarray, rows: int = 0, signals: int = 0) -> Dict[str, float]:
+    """Aggregate PnL, hit rate and maximum drawdown of a trade sequence."""
+    equity = np.cumsum(pnl)
+    peak = np.maximum.accumulate(np.concatenate(([0.0], equity)))[1:]
+    return {
+        "rows": rows,
+        "signals": signals,
+        "trades": int(len(pnl)),
+        "total_pnl": float(pnl.sum()) if len(pnl) else 0.0,
+        "avg_pnl": float(pnl.mean()) if len(pnl) else 0.0,
+        "hit_rate": float((pnl > 0).mean()) if len(pnl) else 0.0,
+        "max_drawdown": float((peak - equity).max()) if len(pnl) else 0.0,
+    }
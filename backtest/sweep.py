@@ -0,0 +1,109 @@
+"""Parallel parameter sweeps over recorded market data.
+
+The aligned ``MarketData`` is written once to ``.npy`` files in a
+temporary directory. Every worker process memory-maps the same files, so
+the arrays are shared through the page cache rather than pickled per
+task. Only parameter dicts and result summaries cross process boundaries.
+"""
+
+from __future__ import annotations
+
+import itertools
+import os
+import random
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from .engine import MarketData, run_backtest
+
+SWEEP_PARAMS = ("min_profit_usd", "max_slippage_bps", "amount", "hold_time_sec")
+
+Space = Dict[str, Union[Sequence[float], Tuple[float, float]]]
+
+_DATA: Optional[MarketData] = None
+
+
+def grid(space: Dict[str, Sequence[float]]) -> List[Dict[str, float]]:
+    """Every combination of the listed values."""
+    names = list(space)
+    return [dict(zip(names, values)) for values in itertools.product(*space.values())]
+
+
+def random_sample(space: Space, n: int, seed: Optional[int] = None) -> List[Dict[str, float]]:
+    """``n`` random points; a ``(low, high)`` tuple is sampled uniformly, a list by choice."""
+    rng = random.Random(seed)
+    points = []
+    for _ in range(n):
+        point = {}
+        for name, spec in space.items():
+            if isinstance(spec, tuple):
+                value = rng.uniform(*spec)
+                point[name] = round(value) if name == "hold_time_sec" else value
+            else:
+                point[name] = rng.choice(list(spec))
+        points.append(point)
+    return points
+
+
+def _init_worker(path: str) -> None:
+    global _DATA
+    _DATA = MarketData.load(path, mmap=True)
+
+
+def _evaluate(task: Tuple[Dict[str, Any], str, Dict[str, float]]) -> Dict[str, Any]:
+    base, strategy, overrides = task
+    result = run_backtest(_DATA, {**base, **overrides}, strategy)
+    return {**overrides, **result.summary}
+
+
+def run_sweep(
+    data: MarketData,
+    base_params: Dict[str, Any],
+    strategy: str,
+    candidates: Sequence[Dict[str, float]],
+    workers: Optional[int] = None,
+    sort_by: str = "total_pnl",
+) -> List[Dict[str, Any]]:
+    """Backtest every candidate across a process pool, best ``sort_by`` first."""
+    workers = workers or os.cpu_count() or 1
+    tasks = [(base_params, strategy, dict(c)) for c in candidates]
+    with tempfile.TemporaryDirectory(prefix="sweep-") as tmp:
+        data.save(tmp)
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(tmp,)
+        ) as pool:
+            chunksize = max(1, len(tasks) // (workers * 4))
+            rows = list(pool.map(_evaluate, tasks, chunksize=chunksize))
+    return sorted(rows, key=lambda r: r[sort_by], reverse=True)
+
+
+def format_table(rows: Sequence[Dict[str, Any]], limit: Optional[int] = None) -> str:
+    """Render sweep results as a fixed-width text table."""
+    rows = list(rows)[:limit] if limit else list(rows)
+    if not rows:
+        return "no results"
+    params = [p for p in SWEEP_PARAMS if p in rows[0]]
+    columns = ["rank", *params, "trades", "total_pnl", "hit_rate", "max_drawdown"]
+    lines = ["  ".join(f"{c:>16}" for c in columns)]
+    for rank, row in enumerate(rows, 1):
+        values = [rank, *(row[c] for c in columns[1:])]
+        lines.append(
+            "  ".join(f"{v:>16.4f}" if isinstance(v, float) else f"{v:>16}" for v in values)
+        )
+    return "\n".join(lines)
+
+
+def parse_space(specs: Sequence[str]) -> Space:
+    """Parse ``name=v1,v2,...`` (values) and ``name=low:high`` (range) specs."""
+    space: Space = {}
+    for spec in specs:
+        name, _, values = spec.partition("=")
+        if name not in SWEEP_PARAMS:
+            raise ValueError(f"unknown sweep parameter {name!r}; expected one of {SWEEP_PARAMS}")
+        if ":" in values:
+            low, high = values.split(":", 1)
+            space[name] = (float(low), float(high))
+        else:
+            space[name] = [float(v) for v in values.split(",") if v]
+    return space
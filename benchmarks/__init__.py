@@ -0,0 +1 @@
+"""Micro-benchmarks for the strategy, engine and logger hot paths; run with ``python -m benchmarks``."""
@@ -0,0 +1,45 @@
+import argparse
+import json
+import logging
+import sys
+
+from .harness import DEFAULT_BASELINE, compare, format_results, load_baseline, run_benchmarks, save_baseline
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Hot path micro-benchmarks")
+    parser.add_argument("-k", "--select", default=None, help="Only run cases whose name contains this")
+    parser.add_argument("--rounds", type=int, default=5, help="Timed rounds per case")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Minimum seconds per round")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="Baseline results file")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Slowdown vs baseline counted as a regression (0.25 = 25%%)")
+    parser.add_argument("--save", action="store_true", help="Store these results as the new baseline")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    # the strategies log every call; that is not what is measured
+    logging.disable(logging.ERROR)
+    try:
+        results = run_benchmarks(args.select, rounds=args.rounds, min_time=args.min_time)
+    finally:
+        logging.disable(logging.NOTSET)
+    comparison = compare(results, load_baseline(args.baseline), args.threshold)
+
+    if args.json:
+        print(json.dumps({"results": results, "comparison": comparison}, indent=2))
+    else:
+        print(format_results(results, comparison))
+
+    if args.save:
+        save_baseline(results, args.baseline)
+        print(f"Baseline saved to {args.baseline}", file=sys.stderr)
+        return 0
+    regressed = [name for name, c in comparison.items() if c["regressed"]]
+    if regressed:
+        print(f"{len(regressed)} regression(s) beyond {args.threshold:.0%}: {', '.join(regressed)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
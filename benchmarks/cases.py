@@ -0,0 +1,190 @@
+"""Benchmark cases for the strategy, engine and logger hot paths.
+
+Each case builds its objects once and returns a coroutine function doing one
+operation. Connectors are in-memory fakes answering instantly, so the
+numbers are the bot's own CPU cost per call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from connectors.base import ConnectorBase
+from execution.engine import ExecutionEngine
+from storage import logger
+from strategies import STRATEGY_MAP
+
+Op = Callable[[], Awaitable[Any]]
+
+BOOK_DEPTHS = (1, 10, 100)
+STRATEGY_COUNTS = (1, 8, 32)
+
+
+@dataclass
+class Case:
+    name: str
+    setup: Callable[[Path], Op]
+    teardown: Optional[Callable[[], None]] = None
+
+
+def make_book(depth: int, mid: float = 100.0, spread_bps: float = 2.0, size: float = 0.25) -> Dict[str, Any]:
+    """``depth`` levels per side, one basis point apart."""
+    half = mid * spread_bps / 20000
+    step = mid / 10000
+    return {
+        "bids": [{"price": mid - half - i * step, "size": size} for i in range(depth)],
+        "asks": [{"price": mid + half + i * step, "size": size} for i in range(depth)],
+    }
+
+
+class StaticConnector(ConnectorBase):
+    """Returns the same book and funding on every call."""
+
+    def __init__(self, book: Dict[str, Any], funding: Optional[Dict[str, Any]] = None):
+        super().__init__({})
+        self.book = book
+        self.funding = funding or {"funding_rate": 0.0}
+
+    async def fetch_book(self, symbol: str) -> Dict[str, Any]:
+        return self.book
+
+    async def fetch_funding(self, symbol: str) -> Dict[str, Any]:
+        return self.funding
+
+    async def place_order(self, symbol: str, side: str, amount: float, price: float) -> Any:
+        return 1
+
+    async def cancel_order(self, order_id: Any) -> None:
+        return None
+
+    async def get_position(self, symbol: str) -> Dict[str, Any]:
+        return {"base_asset_amount": 0}
+
+
+class InstantFillConnector(StaticConnector):
+    """Fills every order in full as it is placed."""
+
+    def __init__(self) -> None:
+        super().__init__(make_book(1))
+        self.base = 0.0
+        self.quote = 0.0
+        self.orders = 0
+
+    async def place_order(self, symbol: str, side: str, amount: float, price: float) -> Any:
+        sign = 1 if side == "buy" else -1
+        self.base += sign * amount
+        self.quote -= sign * amount * price
+        self.orders += 1
+        return self.orders
+
+    async def get_position(self, symbol: str) -> Dict[str, Any]:
+        return {"base_asset_amount": self.base, "quote_asset_amount": self.quote}
+
+
+def _strategy_config(**overrides: Any) -> Dict[str, Any]:
+    config = {
+        "market": "SOL-PERP",
+        "amount": 1.0,
+        "max_slippage_bps": 1000,
+        "min_profit_usd": 0.0,
+        "fees": {"drift": 0.0005, "hyperliquid": 0.0004},
+        "drift": {"market": "SOL-PERP"},
+        "hyperliquid": {"market": "SOL"},
+    }
+    config.update(overrides)
+    return config
+
+
+def _strategy(cls: type, depth: int, **overrides: Any) -> Any:
+    drift = StaticConnector(make_book(depth, mid=100.0), {"last_funding_rate": 2_000_000})
+    hyper = StaticConnector(make_book(depth, mid=100.5), {"funding_rate": 0.0001})
+    return cls(_strategy_config(**overrides), drift=drift, hyper=hyper)
+
+
+def _find(cls_path: str, depth: int) -> Callable[[Path], Op]:
+    def setup(tmp: Path) -> Op:
+        return _strategy(STRATEGY_MAP[cls_path], depth, strategy=cls_path).find_opportunity
+
+    return setup
+
+
+def _strategy_tick(count: int) -> Callable[[Path], Op]:
+    """One polling round of ``count`` strategies sharing two connectors."""
+
+    def setup(tmp: Path) -> Op:
+        drift = StaticConnector(make_book(10, mid=100.0), {"last_funding_rate": 2_000_000})
+        hyper = StaticConnector(make_book(10, mid=100.5), {"funding_rate": 0.0001})
+        names = list(STRATEGY_MAP)
+        strategies = [
+            STRATEGY_MAP[names[i % len(names)]](
+                _strategy_config(strategy=names[i % len(names)]), drift=drift, hyper=hyper
+            )
+            for i in range(count)
+        ]
+
+        async def tick() -> None:
+            await asyncio.gather(*(s.find_opportunity() for s in strategies))
+
+        return tick
+
+    return setup
+
+
+def _execute(tmp: Path) -> Op:
+    engine = ExecutionEngine(InstantFillConnector(), InstantFillConnector(), {"max_slippage_bps": 1000})
+
+    async def trade() -> bool:
+        # one round trip, open then close, so the risk limits never trip
+        await engine.execute_pair_trade("SOL", "SOL-PERP", "buy", "sell", 1.0, 100.0, 100.5)
+        return await engine.execute_pair_trade("SOL", "SOL-PERP", "sell", "buy", 1.0, 100.0, 100.5)
+
+    return trade
+
+
+_OPPORTUNITY = {
+    "type": "Price Arbitrage",
+    "strategy": "basis",
+    "market": "SOL-PERP",
+    "long_exchange": "drift",
+    "short_exchange": "hyperliquid",
+    "long_price": 100.01,
+    "short_price": 100.49,
+    "profit": 0.31,
+    "funding_rate_drift": 0.000002,
+    "funding_rate_hyperliquid": 0.0001,
+}
+
+
+def _log_opportunity(batched: bool) -> Callable[[Path], Op]:
+    def setup(tmp: Path) -> Op:
+        if batched:
+            logger.start_writer({"storage": {"async_writer": True}})
+        path = tmp / "opportunities.jsonl"
+
+        async def log() -> None:
+            logger.log_opportunity(_OPPORTUNITY, file_path=path)
+
+        return log
+
+    return setup
+
+
+def _stop_writer() -> None:
+    logger.stop_writer()
+
+
+def all_cases() -> List[Case]:
+    cases: List[Case] = []
+    for depth in BOOK_DEPTHS:
+        cases.append(Case(f"basis.find_opportunity[depth={depth}]", _find("basis", depth)))
+    for depth in BOOK_DEPTHS:
+        cases.append(Case(f"funding.find_opportunity[depth={depth}]", _find("funding", depth)))
+    for count in STRATEGY_COUNTS:
+        cases.append(Case(f"strategies.tick[count={count}]", _strategy_tick(count)))
+    cases.append(Case("engine.execute_pair_trade[instant]", _execute))
+    cases.append(Case("logger.log_opportunity[sync]", _log_opportunity(False)))
+    cases.append(Case("logger.log_opportunity[batched]", _log_opportunity(True), _stop_writer))
+    return cases
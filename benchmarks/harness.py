@@ -0,0 +1,134 @@
+"""Timing loop, baseline storage and regression check."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import platform
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from .cases import Case, all_cases
+
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+
+
+async def _time_case(case: Case, tmp: Path, rounds: int, min_time: float) -> Dict[str, Any]:
+    op = case.setup(tmp)
+    try:
+        # calibrate: grow the batch until one round takes ``min_time``
+        number = 1
+        while True:
+            start = time.perf_counter()
+            for _ in range(number):
+                await op()
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time or number >= 1 << 20:
+                break
+            number *= 2 if elapsed <= 0 else max(2, min(10, int(min_time / elapsed) + 1))
+
+        per_op: List[float] = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            for _ in range(number):
+                await op()
+            per_op.append((time.perf_counter() - start) / number)
+    finally:
+        if case.teardown is not None:
+            case.teardown()
+    return {
+        "median_us": statistics.median(per_op) * 1e6,
+        "min_us": min(per_op) * 1e6,
+        "ops_per_round": number,
+        "rounds": rounds,
+    }
+
+
+def run_benchmarks(
+    select: Optional[str] = None,
+    rounds: int = 5,
+    min_time: float = 0.2,
+    cases: Optional[Sequence[Case]] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """Run every case whose name contains ``select``.
+
+    The cases run from a scratch working directory, so the files the engine
+    and logger write land there instead of in ``storage/``.
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="bench-") as tmp:
+        os.chdir(tmp)
+        try:
+            for case in cases if cases is not None else all_cases():
+                if select and select not in case.name:
+                    continue
+                results[case.name] = asyncio.run(_time_case(case, Path(tmp), rounds, min_time))
+        finally:
+            os.chdir(cwd)
+    return results
+
+
+def load_baseline(path: Path = DEFAULT_BASELINE) -> Dict[str, Dict[str, Any]]:
+    path = Path(path)
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text()).get("results", {})
+
+
+def save_baseline(results: Dict[str, Dict[str, Any]], path: Path = DEFAULT_BASELINE) -> None:
+    """Merge ``results`` into the baseline file, keeping cases not re-run."""
+    path = Path(path)
+    merged = {**load_baseline(path), **results}
+    path.write_text(
+        json.dumps(
+            {
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "saved_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "results": dict(sorted(merged.items())),
+            },
+            indent=2,
+        )
+        + "\n"
+    )
+
+
+def compare(
+    results: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    threshold: float = 0.25,
+) -> Dict[str, Dict[str, Any]]:
+    """Relative change of each case's median against the baseline.
+
+    A case regressed when its median is more than ``threshold`` (a fraction)
+    slower than the baseline median.
+    """
+    out: Dict[str, Dict[str, Any]] = {}
+    for name, res in results.items():
+        base = baseline.get(name)
+        if not base or not base.get("median_us"):
+            out[name] = {"change": None, "regressed": False}
+            continue
+        change = res["median_us"] / base["median_us"] - 1
+        out[name] = {"change": change, "regressed": change > threshold}
+    return out
+
+
+def format_results(results: Dict[str, Dict[str, Any]], comparison: Dict[str, Dict[str, Any]]) -> str:
+    width = max((len(n) for n in results), default=10)
+    lines = [f"{'case':<{width}}  {'median':>12}  {'min':>12}  {'vs baseline':>12}"]
+    for name, res in results.items():
+        cmp = comparison.get(name, {})
+        change = cmp.get("change")
+        vs = "-" if change is None else f"{change:+.1%}"
+        if cmp.get("regressed"):
+            vs += " REGRESSED"
+        lines.append(
+            f"{name:<{width}}  {res['median_us']:>10.2f}us  {res['min_us']:>10.2f}us  {vs:>12}"
+        )
+    return "\n".join(lines)
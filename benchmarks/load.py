@@ -0,0 +1,306 @@
+"""Offline load test of ``MultiStrategyRunner`` on simulated venues.
+
+Every market gets a pair of ``SimulatedVenue`` connectors and its own
+runner, all on one ``VirtualClock``. Simulated venue latency therefore costs
+no wall time, and the measured rate is what one process can evaluate when
+it is CPU bound. Run with ``python -m benchmarks.load``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from connectors.simulator import SimulatedVenue
+from execution.clock import VirtualClock
+from monitoring.startup import rss_bytes
+from storage import logger
+from strategies.runner import MultiStrategyRunner
+
+
+@dataclass
+class LoadProfile:
+    markets: int = 4
+    strategies: Sequence[str] = ("basis", "funding")
+    update_interval_sec: float = 0.1
+    poll_interval_sec: float = 0.1
+    latency_ms: float = 5.0
+    jitter_ms: float = 2.0
+    duration_sec: float = 60.0
+    warmup_fraction: float = 0.1
+    live: bool = True
+    async_writer: bool = True
+    trace_malloc: bool = False
+    seed: int = 1
+    extra_config: Dict[str, Any] = field(default_factory=dict)
+
+
+def _process_write_bytes() -> Optional[int]:
+    try:
+        with open("/proc/self/io") as f:
+            for line in f:
+                if line.startswith("wchar:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def _file_sizes(root: Path) -> Dict[str, int]:
+    return {str(p.relative_to(root)): p.stat().st_size for p in sorted(root.rglob("*")) if p.is_file()}
+
+
+def _percentiles(values: List[float]) -> Dict[str, float]:
+    if not values:
+        return {}
+    values = sorted(values)
+
+    def pct(q: float) -> float:
+        return values[min(len(values) - 1, int(q * len(values)))]
+
+    return {
+        "p50": pct(0.50),
+        "p90": pct(0.90),
+        "p99": pct(0.99),
+        "max": values[-1],
+        "mean": statistics.fmean(values),
+    }
+
+
+def _market_config(profile: LoadProfile, index: int) -> Dict[str, Any]:
+    market = f"M{index}"
+    return {
+        "market": f"{market}-PERP",
+        "amount": 1.0,
+        "max_slippage_bps": 50,
+        "min_profit_usd": 0.0,
+        "poll_interval_sec": profile.poll_interval_sec,
+        "fees": {"drift": 0.0001, "hyperliquid": 0.0001},
+        "drift": {"market": f"{market}-PERP"},
+        "hyperliquid": {"market": market},
+        "strategies": {name: {"enabled": True} for name in profile.strategies},
+        **profile.extra_config,
+    }
+
+
+def _venue(profile: LoadProfile, clock: VirtualClock, mid: float, seed: int) -> SimulatedVenue:
+    return SimulatedVenue(
+        {
+            "mid": mid,
+            "levels": 10,
+            "level_size": 5.0,
+            "volatility_bps": 3.0,
+            "update_interval_sec": profile.update_interval_sec,
+            "funding_rate": 0.0,
+            "latency": {"kind": "normal", "mean_ms": profile.latency_ms, "jitter_ms": profile.jitter_ms},
+            "seed": seed,
+        },
+        clock=clock,
+    )
+
+
+async def _run(profile: LoadProfile, workdir: Path) -> Dict[str, Any]:
+    clock = VirtualClock()
+    runners: List[MultiStrategyRunner] = []
+    venues: List[SimulatedVenue] = []
+    for i in range(profile.markets):
+        mid = 100.0 * (i + 1)
+        drift = _venue(profile, clock, mid, profile.seed * 1000 + 2 * i)
+        hyper = _venue(profile, clock, mid, profile.seed * 1000 + 2 * i + 1)
+        venues += [drift, hyper]
+        runners.append(MultiStrategyRunner(_market_config(profile, i), drift, hyper, clock=clock))
+    strategies = [s for r in runners for s in r.strategies]
+
+    wall: List[float] = []
+    virtual: List[float] = []
+    warm = {"done": False}
+
+    for strategy in strategies:
+        inner = strategy.find_opportunity
+
+        async def timed(inner=inner) -> Optional[Dict[str, Any]]:
+            start, vstart = time.perf_counter(), clock.time()
+            try:
+                return await inner()
+            finally:
+                if warm["done"]:
+                    wall.append(time.perf_counter() - start)
+                    virtual.append(clock.time() - vstart)
+
+        strategy.find_opportunity = timed
+
+    marks: Dict[str, Any] = {}
+
+    async def control() -> None:
+        await clock.sleep(profile.duration_sec * profile.warmup_fraction)
+        warm["done"] = True
+        marks["start"] = time.perf_counter()
+        marks["vstart"] = clock.time()
+        marks["rss"] = rss_bytes()
+        marks["wchar"] = _process_write_bytes()
+        marks["files"] = _file_sizes(workdir)
+        if profile.trace_malloc:
+            marks["heap"] = tracemalloc.get_traced_memory()[0]
+        await clock.sleep(profile.duration_sec * (1 - profile.warmup_fraction))
+        marks["end"] = time.perf_counter()
+        marks["vend"] = clock.time()
+        for strategy in strategies:
+            strategy.stop()
+
+    if profile.async_writer:
+        logger.start_writer({"storage": {"async_writer": True}})
+    if profile.trace_malloc:
+        tracemalloc.start()
+    try:
+        await asyncio.gather(control(), *(r.run(live=profile.live) for r in runners))
+        heap_end = tracemalloc.get_traced_memory() if profile.trace_malloc else None
+    finally:
+        if profile.trace_malloc:
+            tracemalloc.stop()
+        writer = logger.writer_stats()
+        logger.stop_writer()
+
+    elapsed = marks["end"] - marks["start"]
+    wchar_end = _process_write_bytes()
+    # bytes the measured window added; rotation is off, files only grow
+    files = {
+        name: size - marks["files"].get(name, 0) for name, size in _file_sizes(workdir).items()
+    }
+    jobs = [r.scheduler.metrics() for r in runners]
+    report: Dict[str, Any] = {
+        "profile": {k: v for k, v in asdict(profile).items() if k != "extra_config"},
+        "strategies": len(strategies),
+        "wall_sec": elapsed,
+        "simulated_sec": marks["vend"] - marks["vstart"],
+        "ticks": len(wall),
+        "ticks_per_sec": len(wall) / elapsed if elapsed > 0 else 0.0,
+        "eval_wall_ms": {k: v * 1000 for k, v in _percentiles(wall).items()},
+        "eval_simulated_ms": {k: v * 1000 for k, v in _percentiles(virtual).items()},
+        "trades": {
+            "submitted": sum(j["submitted"] for j in jobs),
+            "completed": sum(j["completed"] for j in jobs),
+            "expired": sum(j["expired"] for j in jobs),
+            "venue_orders": sum(v.stats["orders"] for v in venues),
+        },
+        "memory": {
+            "rss_start": marks["rss"],
+            "rss_end": rss_bytes(),
+            "rss_growth": rss_bytes() - marks["rss"],
+        },
+        "io": {
+            "files": files,
+            "log_bytes": sum(files.values()),
+            "log_bytes_per_sec": sum(files.values()) / elapsed if elapsed > 0 else 0.0,
+            "writer_dropped": writer.get("dropped", 0),
+        },
+    }
+    if heap_end is not None:
+        report["memory"].update(heap_growth=heap_end[0] - marks["heap"], heap_peak=heap_end[1])
+    if marks["wchar"] is not None and wchar_end is not None:
+        # everything the process wrote, sockets and pipes included
+        report["io"]["process_write_bytes"] = wchar_end - marks["wchar"]
+    return report
+
+
+def run_load(profile: LoadProfile) -> Dict[str, Any]:
+    """Run ``profile`` in a scratch directory and return the measurements.
+
+    The strategies, engine and logger write their usual files relative to
+    the working directory; they land in the scratch directory and are
+    counted as the run's file I/O.
+    """
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="load-") as tmp:
+        os.chdir(tmp)
+        try:
+            return asyncio.run(_run(profile, Path(tmp)))
+        finally:
+            os.chdir(cwd)
+
+
+def format_load_report(report: Dict[str, Any]) -> str:
+    p = report["profile"]
+    wall, sim, mem, io = report["eval_wall_ms"], report["eval_simulated_ms"], report["memory"], report["io"]
+    lines = [
+        f"{p['markets']} markets x {len(p['strategies'])} strategies, "
+        f"poll {p['poll_interval_sec']}s, book updates {p['update_interval_sec']}s, "
+        f"latency {p['latency_ms']}±{p['jitter_ms']}ms",
+        f"simulated {report['simulated_sec']:.0f}s in {report['wall_sec']:.2f}s wall",
+        f"ticks: {report['ticks']} ({report['ticks_per_sec']:.0f}/s)",
+    ]
+    if wall:
+        lines.append(
+            f"evaluation wall ms: p50 {wall['p50']:.3f}  p90 {wall['p90']:.3f}  p99 {wall['p99']:.3f}  max {wall['max']:.3f}"
+        )
+        lines.append(
+            f"evaluation simulated ms: p50 {sim['p50']:.1f}  p99 {sim['p99']:.1f}  max {sim['max']:.1f}"
+        )
+    t = report["trades"]
+    lines.append(
+        f"trades: {t['submitted']} submitted, {t['completed']} completed, {t['expired']} expired, "
+        f"{t['venue_orders']} venue orders"
+    )
+    mem_line = f"memory: rss {mem['rss_end'] / 2**20:.1f} MiB, growth {mem['rss_growth'] / 2**20:+.2f} MiB"
+    if "heap_growth" in mem:
+        mem_line += f", python heap growth {mem['heap_growth'] / 2**20:+.2f} MiB"
+    lines.append(mem_line)
+    lines.append(
+        f"file i/o: {io['log_bytes'] / 2**10:.1f} KiB ({io['log_bytes_per_sec'] / 2**10:.1f} KiB/s), "
+        f"writer dropped {io['writer_dropped']}"
+    )
+    for name, size in io["files"].items():
+        lines.append(f"  {name}: {size / 2**10:.1f} KiB")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.load", description="MultiStrategyRunner load test")
+    parser.add_argument("--markets", type=int, default=4, help="Number of markets, each with its own runner")
+    parser.add_argument("--strategies", default="basis,funding", help="Comma separated strategies per market")
+    parser.add_argument("--update-ms", type=float, default=100, help="Simulated book update interval")
+    parser.add_argument("--poll-ms", type=float, default=100, help="Strategy poll interval")
+    parser.add_argument("--latency-ms", type=float, default=5, help="Mean simulated venue latency")
+    parser.add_argument("--jitter-ms", type=float, default=2, help="Venue latency standard deviation")
+    parser.add_argument("--duration", type=float, default=60, help="Simulated seconds to run")
+    parser.add_argument("--dry-run", action="store_true", help="Evaluate only, do not execute trades")
+    parser.add_argument("--sync-writes", action="store_true", help="Write logs on the loop instead of the background writer")
+    parser.add_argument("--tracemalloc", action="store_true", help="Also measure Python heap growth (slower)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args(argv)
+
+    profile = LoadProfile(
+        markets=args.markets,
+        strategies=tuple(s for s in args.strategies.split(",") if s),
+        update_interval_sec=args.update_ms / 1000,
+        poll_interval_sec=args.poll_ms / 1000,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        duration_sec=args.duration,
+        live=not args.dry_run,
+        async_writer=not args.sync_writes,
+        trace_malloc=args.tracemalloc,
+        seed=args.seed,
+    )
+    logging.disable(logging.ERROR)
+    try:
+        report = run_load(profile)
+    finally:
+        logging.disable(logging.NOTSET)
+    print(json.dumps(report, indent=2) if args.json else format_load_report(report))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
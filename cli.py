@@ -1,8 +1,15 @@
+import time
+
+_STARTED = time.perf_counter()  # cold start reference for the startup report
+
 import argparse
 import asyncio
 import os
+import sys
+from datetime import datetime, timezone
+
 import certifi
-from connectors import DriftConnector, HyperliquidConnector
+import yaml
 from config import ConfigLoader
 import logging
 
@@ -25,26 +32,40 @@ async def async_main() -> None:
     parser.add_argument("--safe-mode", action="store_true", help="Force enable safe mode")
     parser.add_argument("--log-level", default="INFO", help="Override logging level")
     parser.add_argument("--config", required=False, default="config/main.yaml", help="Path to config YAML file")
+    parser.add_argument("--replay", default=None, help="Replay a tick archive directory instead of connecting to the venues")
+    parser.add_argument("--replay-speed", type=float, default=0.0, help="Replay speed factor (0 = as fast as possible on a virtual clock)")
+    parser.add_argument("--replay-start", default=None, help="Replay from this ISO timestamp (UTC)")
+    parser.add_argument("--replay-end", default=None, help="Replay up to this ISO timestamp (UTC)")
+    parser.add_argument("--metrics-port", type=int, default=None, help="Serve Prometheus metrics on this local port")
+    parser.add_argument("--trace", action="store_true", help="Write per-opportunity lifecycle traces")
+    parser.add_argument("--profiler", action="store_true", help="Allow starting a sampling profiler with SIGUSR1 or /profile/start")
+    parser.add_argument("--rate-limit", action="store_true", help="Queue connector calls within each venue's request weight budget")
+    parser.add_argument("--loop-lag-ms", type=float, default=None, help="Monitor event loop lag and log stacks of stalls longer than this")
     args = parser.parse_args()
 
-    loader = ConfigLoader(args.config)
-    cfg_model = loader.load()
-    config = cfg_model.model_dump()
+    from monitoring.startup import STARTUP
 
-    drift_conn = DriftConnector(config.get("drift", {}))
-    await drift_conn.async_init()
+    STARTUP.reset(_STARTED)
+    STARTUP.record("imports", time.perf_counter() - _STARTED, 0.0)
+
+    with STARTUP.phase("config"):
+        loader = ConfigLoader(args.config)
+        cfg_model = loader.load()
+        config = cfg_model.model_dump()
 
     logger = logging.getLogger(__name__)
 
-    hyper_conn = HyperliquidConnector(config.get("hyperliquid", {}))
-    if hasattr(hyper_conn, "async_init"):
-        await hyper_conn.async_init()
-    
+    replay_finished: tuple = ()  # nothing to catch unless replaying
+    if args.replay:
+        from connectors.replay_connector import ReplayFinished
 
+        replay_finished = (ReplayFinished,)
+        with STARTUP.phase("replay_init"):
+            drift_conn, hyper_conn = _replay_connectors(args, config)
+    else:
+        drift_conn, hyper_conn = await _live_connectors(config, STARTUP)
 
-    from storage.logger import setup_logging
-    from strategies import STRATEGY_MAP
-    from strategies.runner import MultiStrategyRunner
+    from storage.logger import setup_logging, start_journal, start_writer, stop_journal, stop_writer
 
     if args.mode is not None:
         config["mode"] = args.mode
@@ -54,8 +75,160 @@ async def async_main() -> None:
         config["safe_mode"] = True
     if args.log_level:
         config.setdefault("logging", {})["level"] = args.log_level
+    if args.metrics_port is not None:
+        config.setdefault("monitoring", {}).update(enabled=True, port=args.metrics_port)
+    if args.trace:
+        config.setdefault("tracing", {})["enabled"] = True
+    if args.profiler:
+        config.setdefault("monitoring", {}).setdefault("profiler", {})["enabled"] = True
+    if args.rate_limit:
+        config.setdefault("rate_limits", {})["enabled"] = True
+    if args.loop_lag_ms is not None:
+        config.setdefault("monitoring", {}).setdefault("loop_lag", {}).update(
+            enabled=True, threshold_sec=args.loop_lag_ms / 1000
+        )
+
+    with STARTUP.phase("storage"):
+        setup_logging(config)
+        start_writer(config)
+        start_journal(config)
+
+    metrics_server = None
+    mon_cfg = config.get("monitoring", {}) or {}
+    if mon_cfg.get("enabled"):
+        from monitoring import InstrumentedConnector, MetricsServer, register_rpc_pool_metrics
+
+        rpc_pool = getattr(drift_conn, "rpc_pool", None)
+        if rpc_pool is not None:
+            register_rpc_pool_metrics(rpc_pool)
+
+        if mon_cfg.get("instrument_connectors", True):
+            drift_conn = InstrumentedConnector(drift_conn, "drift")
+            hyper_conn = InstrumentedConnector(hyper_conn, "hyperliquid")
+        metrics_server = MetricsServer(host=mon_cfg.get("host", "127.0.0.1"), port=int(mon_cfg.get("port", 9108)))
+        await metrics_server.start()
+
+    if (config.get("rate_limits", {}) or {}).get("enabled") and not args.replay:
+        from connectors.rate_limit import RateLimitedConnector
+
+        # outside the instrumentation, which keeps timing venue calls only
+        drift_conn = RateLimitedConnector.from_config(drift_conn, "drift", config)
+        hyper_conn = RateLimitedConnector.from_config(hyper_conn, "hyperliquid", config)
+        if metrics_server is not None:
+            from monitoring import register_rate_limit_metrics
+
+            register_rate_limit_metrics({"drift": drift_conn, "hyperliquid": hyper_conn})
+
+    from monitoring.loop_lag import LoopLagMonitor
+
+    lag_monitor = LoopLagMonitor.from_config(config)
+    if lag_monitor is not None:
+        lag_monitor.start()
+
+    from monitoring.profiler import SamplingProfiler, add_profiler_routes, install_signal_toggle
+
+    profiler = SamplingProfiler.from_config(config)
+    if profiler is not None:
+        install_signal_toggle(profiler)
+        if metrics_server is not None:
+            add_profiler_routes(metrics_server, profiler)
+
+    recorder = None
+    rec_cfg = config.get("recording", {}) or {}
+    if rec_cfg.get("enabled"):
+        from connectors.recording import RecordingConnector
+        from storage.ticks import TickRecorder
+
+        recorder = TickRecorder(
+            rec_cfg.get("path", "storage/ticks"),
+            levels=int(rec_cfg.get("levels", 5)),
+            chunk_rows=int(rec_cfg.get("chunk_rows", 1024)),
+        )
+        drift_conn = RecordingConnector(drift_conn, recorder, "drift")
+        hyper_conn = RecordingConnector(hyper_conn, recorder, "hyperliquid")
+
+    if (config.get("tracing", {}) or {}).get("enabled"):
+        from monitoring import tracing
 
-    setup_logging(config)
+        tracing.configure(config)
+        drift_conn = tracing.TracedConnector(drift_conn, "drift")
+        hyper_conn = tracing.TracedConnector(hyper_conn, "hyperliquid")
+
+    try:
+        await _run_strategies(args, config, drift_conn, hyper_conn)
+    except replay_finished:
+        logger.info("Replay finished")
+    finally:
+        if profiler is not None:
+            profiler.stop()
+        if lag_monitor is not None:
+            await lag_monitor.stop()
+        if metrics_server is not None:
+            await metrics_server.stop()
+        if recorder is not None:
+            recorder.close()
+        stop_journal()
+        stop_writer()
+
+
+def _parse_ts(value):
+    if value is None:
+        return None
+    ts = datetime.fromisoformat(value)
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts.timestamp()
+
+
+async def _live_connectors(config, startup):
+    """Initialize both venues concurrently."""
+    from connectors import DriftConnector, HyperliquidConnector
+
+    async def _drift():
+        with startup.phase("drift_init"):
+            conn = DriftConnector(config.get("drift", {}))
+            await conn.async_init()
+        for step, seconds in getattr(conn, "init_timings", {}).items():
+            startup.record(f"drift_init.{step}", seconds)
+        return conn
+
+    async def _hyper():
+        with startup.phase("hyperliquid_init"):
+            # the SDK fetches exchange metadata in its constructor
+            conn = await asyncio.to_thread(HyperliquidConnector, config.get("hyperliquid", {}))
+            if hasattr(conn, "async_init"):
+                await conn.async_init()
+        return conn
+
+    with startup.phase("connectors"):
+        drift, hyper = await asyncio.gather(_drift(), _hyper())
+    return drift, hyper
+
+
+def _replay_connectors(args, config):
+    """Build connectors that replay a recorded tick archive."""
+    from connectors.replay_connector import ReplayConnector, ReplayPacer
+    from storage.ticks import TickArchive
+
+    archive = TickArchive(args.replay)
+    start, end = _parse_ts(args.replay_start), _parse_ts(args.replay_end)
+    if args.replay_speed:
+        pacer = ReplayPacer(speed=args.replay_speed, start=start)
+    else:
+        # keep the recorded timing, but on simulated time that never waits
+        from execution.clock import VirtualClock, set_clock
+
+        set_clock(VirtualClock())
+        pacer = ReplayPacer(speed=1.0, start=start)
+    drift = ReplayConnector(archive, "drift", start, end, pacer, config.get("drift", {}))
+    hyper = ReplayConnector(archive, "hyperliquid", start, end, pacer, config.get("hyperliquid", {}))
+    return drift, hyper
+
+
+async def _run_strategies(args, config, drift_conn, hyper_conn) -> None:
+    """Run the selected strategy, or all enabled ones concurrently."""
+    from strategies import STRATEGY_MAP
+    from strategies.runner import MultiStrategyRunner
 
     strategies_cfg = config.get("strategies", {})
 
@@ -66,6 +239,10 @@ async def async_main() -> None:
 
     if not args.strategy and len(enabled) > 1:
         runner = MultiStrategyRunner(config, drift=drift_conn, hyper=hyper_conn)
+        if (config.get("monitoring", {}) or {}).get("enabled"):
+            from monitoring import register_bot_metrics
+
+            register_bot_metrics(runner.scheduler.engine, runner.scheduler)
         live = config.get("mode", "live") == "live"
         await runner.run(live=live)
         return
@@ -78,13 +255,209 @@ async def async_main() -> None:
 
     strategy_cls = STRATEGY_MAP[strategy_name]
     strategy = strategy_cls(config, drift=drift_conn, hyper=hyper_conn)
+    if (config.get("monitoring", {}) or {}).get("enabled"):
+        from monitoring import register_bot_metrics
+
+        register_bot_metrics(strategy.engine)
 
     live = config.get("mode", "live") == "live"
+    if live:
+        await strategy.engine.seed_risk(strategy.hyper_symbol, strategy.drift_symbol)
     await strategy.run(live=live)
 
 
+def _strategy_params(path: str, strategy: str) -> dict:
+    """Read strategy parameters from YAML without requiring venue secrets."""
+    with open(path, "r", encoding="utf-8") as f:
+        data = yaml.safe_load(f) or {}
+    strat_cfg = (data.get("strategies") or {}).get(strategy)
+    if isinstance(strat_cfg, dict):
+        data = {**data, **strat_cfg}
+    return data
+
+
+def _add_market_data_args(parser) -> None:
+    parser.add_argument("--archive", default="storage/ticks", help="Tick archive directory")
+    parser.add_argument("--config", default="config/main.yaml", help="Path to config YAML file")
+    parser.add_argument("--strategy", choices=STRATEGY_CHOICES, default="basis", help="Strategy to evaluate")
+    parser.add_argument("--start", default=None, help="Start ISO timestamp (UTC)")
+    parser.add_argument("--end", default=None, help="End ISO timestamp (UTC)")
+    parser.add_argument("--step", type=float, default=1.0, help="Grid resolution in seconds")
+
+
+def _market_data(args, params):
+    """Load the aligned market data selected by ``_add_market_data_args``."""
+    from backtest import load_market_data
+    from storage.ticks import TickArchive
+
+    return load_market_data(
+        TickArchive(args.archive),
+        params.get("drift", {}).get("market", params.get("market")),
+        params.get("hyperliquid", {}).get("market", params.get("market")),
+        _parse_ts(args.start),
+        _parse_ts(args.end),
+        args.step,
+    )
+
+
+def backtest_main(argv) -> None:
+    """Run a vectorized backtest over a recorded tick archive."""
+    from backtest import run_backtest
+
+    parser = argparse.ArgumentParser(prog="cli.py backtest", description="Backtest a strategy on recorded ticks")
+    _add_market_data_args(parser)
+    parser.add_argument("--trades-out", default=None, help="Write per-trade results to this CSV file")
+    args = parser.parse_args(argv)
+
+    params = _strategy_params(args.config, args.strategy)
+    data = _market_data(args, params)
+    result = run_backtest(data, params, args.strategy)
+
+    for key, value in result.summary.items():
+        print(f"{key:>14}: {value}")
+    if args.trades_out:
+        names = list(result.trades)
+        with open(args.trades_out, "w", encoding="utf-8") as f:
+            f.write(",".join(names) + "\n")
+            for row in zip(*(result.trades[n] for n in names)):
+                f.write(",".join(str(v) for v in row) + "\n")
+
+
+def sweep_main(argv) -> None:
+    """Rank strategy parameters by backtesting them in parallel."""
+    from backtest.sweep import format_table, grid, parse_space, random_sample, run_sweep
+
+    parser = argparse.ArgumentParser(prog="cli.py sweep", description="Parameter sweep over recorded ticks")
+    _add_market_data_args(parser)
+    parser.add_argument(
+        "--param",
+        action="append",
+        default=[],
+        help="name=v1,v2,... or name=low:high (ranges need --samples); repeat per parameter",
+    )
+    parser.add_argument("--samples", type=int, default=0, help="Random samples instead of the full grid")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for --samples")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--sort-by", default="total_pnl", help="Summary field to rank by")
+    parser.add_argument("--top", type=int, default=20, help="Rows to print")
+    args = parser.parse_args(argv)
+
+    space = parse_space(args.param)
+    if args.samples:
+        candidates = random_sample(space, args.samples, args.seed)
+    elif any(isinstance(v, tuple) for v in space.values()):
+        parser.error("ranges (low:high) require --samples")
+    else:
+        candidates = grid(space)
+
+    params = _strategy_params(args.config, args.strategy)
+    data = _market_data(args, params)
+    rows = run_sweep(data, params, args.strategy, candidates, args.workers, args.sort_by)
+    print(format_table(rows, args.top))
+
+
+def journal_main(argv) -> None:
+    """Import JSONL logs into the SQLite journal or summarize it."""
+    from storage.journal import Journal
+
+    parser = argparse.ArgumentParser(prog="cli.py journal", description="Trade and opportunity journal")
+    parser.add_argument("--db", default="storage/journal.db", help="Journal database")
+    parser.add_argument("--import", dest="imports", nargs="+", default=[], help="JSONL files to import")
+    parser.add_argument("--market", default=None, help="Only this market")
+    parser.add_argument("--strategy", default=None, help="Only this strategy")
+    parser.add_argument("--start", default=None, help="Start ISO timestamp (UTC)")
+    parser.add_argument("--end", default=None, help="End ISO timestamp (UTC)")
+    args = parser.parse_args(argv)
+
+    journal = Journal(args.db)
+    for path in args.imports:
+        print(f"{path}: imported {journal.import_jsonl(path)} records")
+    if args.imports:
+        return
+
+    filters = dict(market=args.market, strategy=args.strategy, start=_parse_ts(args.start), end=_parse_ts(args.end))
+    for key, value in journal.trade_summary(**filters).items():
+        print(f"{key:>16}: {value}")
+    for direction, stats in journal.opportunity_counts("direction", **filters).items():
+        print(f"{direction or '-':>30}: {stats['count']} opportunities, avg profit {stats['avg_profit'] or 0:.4f}")
+
+
+def _duration(value: str) -> float:
+    """Seconds in ``90``, ``15m``, ``1h`` or ``1d``."""
+    units = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+    if value and value[-1] in units:
+        return float(value[:-1]) * units[value[-1]]
+    return float(value)
+
+
+def report_main(argv) -> None:
+    """Summarize the trade and opportunity logs."""
+    import json
+
+    from storage.report import build_report, format_report
+
+    parser = argparse.ArgumentParser(prog="cli.py report", description="Streaming report over the JSONL logs")
+    parser.add_argument("--trades", default="storage/trades.jsonl", help="Trade log")
+    parser.add_argument("--opportunities", default="storage/opportunities.jsonl", help="Opportunity log")
+    parser.add_argument("--start", default=None, help="Start ISO timestamp (UTC)")
+    parser.add_argument("--end", default=None, help="End ISO timestamp (UTC)")
+    parser.add_argument("--bucket", type=_duration, default=3600.0, help="Rollup bucket, e.g. 15m, 1h, 1d")
+    parser.add_argument("--profit-bin", type=float, default=1.0, help="Opportunity profit histogram bin (USD)")
+    parser.add_argument("--slippage-bin", type=float, default=1.0, help="Slippage histogram bin (bps)")
+    parser.add_argument("--no-index", action="store_true", help="Scan from the start instead of using the offset index")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args(argv)
+
+    report = build_report(
+        args.trades,
+        args.opportunities,
+        _parse_ts(args.start),
+        _parse_ts(args.end),
+        bucket_sec=args.bucket,
+        profit_bin=args.profit_bin,
+        slippage_bin=args.slippage_bin,
+        use_index=not args.no_index,
+    )
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+
+
+def traces_main(argv) -> None:
+    """Break decision-to-ack and decision-to-fill latency down per venue."""
+    import json
+
+    from monitoring.tracing import latency_breakdown
+
+    parser = argparse.ArgumentParser(prog="cli.py traces", description="Latency breakdown of the lifecycle traces")
+    parser.add_argument("--file", default="storage/traces.jsonl", help="Trace file")
+    parser.add_argument("--json", action="store_true", help="Print the breakdown as JSON")
+    args = parser.parse_args(argv)
+
+    breakdown = latency_breakdown(args.file)
+    if args.json:
+        print(json.dumps(breakdown, indent=2))
+        return
+    for venue, kinds in breakdown.items():
+        for kind, stats in kinds.items():
+            print(
+                f"{venue:<12} {kind:<18} n={stats['count']:<6} "
+                f"p50={stats['p50']:.1f}ms p95={stats['p95']:.1f}ms max={stats['max']:.1f}ms"
+            )
+
+
+SUBCOMMANDS = {
+    "backtest": backtest_main,
+    "sweep": sweep_main,
+    "journal": journal_main,
+    "report": report_main,
+    "traces": traces_main,
+}
+
+
 def main() -> None:
     """Synchronous wrapper for ``async_main``."""
+    if len(sys.argv) > 1 and sys.argv[1] in SUBCOMMANDS:
+        SUBCOMMANDS[sys.argv[1]](sys.argv[2:])
+        return
     asyncio.run(async_main())
 
 
@@ -2,12 +2,30 @@ from __future__ import annotations
 
 from pathlib import Path
 import os
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, List
 
 import yaml
 from pydantic import BaseModel, ConfigDict, field_validator
 
 
+class RpcEndpointConfig(BaseModel):
+    rpc_url: str
+    ws_url: Optional[str] = None
+    name: Optional[str] = None  # label in logs and metrics, defaults to the host
+
+
+class RpcPoolConfig(BaseModel):
+    """Probing and failover of the Drift RPC endpoints."""
+
+    probe_interval_sec: float = 10.0
+    probe_timeout_sec: float = 2.0
+    max_slot_lag: int = 50
+    max_failures: int = 2
+    switch_margin: float = 0.3
+    connect_attempts: int = 5
+    retry_delay_sec: float = 2.0
+
+
 class DriftConfig(BaseModel):
     """Settings for Drift exchange."""
 
@@ -16,6 +34,14 @@ class DriftConfig(BaseModel):
     ws_url: Optional[str] = None
     sub_account_id: int = 0
     market: Optional[str] = None
+    market_data: str = "usermap"  # usermap | dlob_server
+    dlob_url: Optional[str] = None
+    dlob_depth: int = 10
+    # limit the client's account subscriptions to these perp markets
+    perp_market_indexes: Optional[List[int]] = None
+    # failover endpoints, tried after rpc_url/ws_url
+    rpc_endpoints: List[RpcEndpointConfig] = []
+    rpc_pool: RpcPoolConfig = RpcPoolConfig()
 
 
 class HyperliquidConfig(BaseModel):
@@ -33,11 +59,136 @@ class LoggingConfig(BaseModel):
     log_file: Optional[str] = None
 
 
+class RotationConfig(BaseModel):
+    """Log rotation; no rotation unless a size or interval is set."""
+
+    max_bytes: Optional[int] = None
+    interval_sec: Optional[float] = None
+    compress: bool = True
+    keep: Optional[int] = None
+
+
+class StorageConfig(BaseModel):
+    """Background writer settings for the JSONL and event logs."""
+
+    async_writer: bool = True
+    queue_size: int = 10000
+    batch_size: int = 256
+    flush_interval_sec: float = 1.0
+    rotation: RotationConfig = RotationConfig()
+
+
+class JournalConfig(BaseModel):
+    """SQLite journal of trades and opportunities."""
+
+    enabled: bool = False
+    path: str = "storage/journal.db"
+    jsonl: bool = True
+    batch_size: int = 500
+    flush_interval_sec: float = 1.0
+    queue_size: int = 100000
+
+
+class RecordingConfig(BaseModel):
+    """Tick archive of every book and funding snapshot."""
+
+    enabled: bool = False
+    path: str = "storage/ticks"
+    levels: int = 5
+    chunk_rows: int = 1024
+
+
+class LoopLagConfig(BaseModel):
+    """Event loop lag sampling and blocking-stack capture."""
+
+    enabled: bool = False
+    interval_sec: float = 0.1
+    threshold_sec: float = 0.25
+    stall_file: str = "storage/loop_stalls.log"
+
+
+class ProfilerConfig(BaseModel):
+    """On-demand sampling profiler toggled by SIGUSR1 or the metrics endpoint."""
+
+    enabled: bool = False
+    interval_sec: float = 0.01
+    default_duration_sec: float = 30.0
+    max_duration_sec: float = 300.0
+    output_dir: str = "storage/profiles"
+
+
+class MonitoringConfig(BaseModel):
+    """Local metrics endpoint and connector instrumentation."""
+
+    enabled: bool = False
+    host: str = "127.0.0.1"
+    port: int = 9108
+    instrument_connectors: bool = True
+    loop_lag: LoopLagConfig = LoopLagConfig()
+    profiler: ProfilerConfig = ProfilerConfig()
+
+
+class TracingConfig(BaseModel):
+    """Per-opportunity lifecycle traces written to a local JSONL file."""
+
+    enabled: bool = False
+    path: str = "storage/traces.jsonl"
+    sample: str = "opportunities"  # opportunities | all
+
+
 class TimeoutsConfig(BaseModel):
     order_submit_sec: int = 10
     order_cancel_sec: int = 5
 
 
+class ExecutionConfig(BaseModel):
+    """Order execution mode and slicing parameters."""
+
+    mode: str = "single"
+    depth_fraction: float = 0.5
+    max_slices: int = 10
+    min_slice: float = 0.0
+    slice_interval_sec: float = 1.0
+    max_slice_interval_sec: float = 10.0
+    refill_ratio: float = 0.8
+    unwind_slippage_bps: float = 50.0
+
+
+class SchedulerConfig(BaseModel):
+    """Account-level execution scheduler limits."""
+
+    max_concurrent_per_venue: int = 1
+    max_wait_sec: float = 2.0
+
+
+class RiskConfig(BaseModel):
+    """Pre-trade limits; unset limits are not enforced."""
+
+    max_net_delta: Optional[float] = None
+    max_gross_notional: Optional[float] = None
+    max_open_orders: Optional[int] = None
+    max_daily_loss_usd: Optional[float] = None
+
+
+class VenueRateLimitConfig(BaseModel):
+    """Request weight budget of one venue."""
+
+    capacity: float = 100.0
+    refill_per_sec: float = 10.0
+    # share of the budget book and funding polls leave for orders
+    reserve_fraction: float = 0.1
+    # per-call overrides of the connector's REQUEST_WEIGHTS
+    weights: Dict[str, float] = {}
+
+
+class RateLimitConfig(BaseModel):
+    """Per-venue token buckets in front of the connectors."""
+
+    enabled: bool = False
+    hyperliquid: VenueRateLimitConfig = VenueRateLimitConfig(capacity=1200.0, refill_per_sec=20.0)
+    drift: VenueRateLimitConfig = VenueRateLimitConfig()
+
+
 class BotConfig(BaseModel):
     """Top level application configuration."""
 
@@ -52,8 +203,17 @@ class BotConfig(BaseModel):
     drift: DriftConfig
     hyperliquid: HyperliquidConfig
     logging: LoggingConfig = LoggingConfig()
+    storage: StorageConfig = StorageConfig()
+    journal: JournalConfig = JournalConfig()
+    recording: RecordingConfig = RecordingConfig()
     safe_mode: bool = False
     timeouts: TimeoutsConfig = TimeoutsConfig()
+    execution: ExecutionConfig = ExecutionConfig()
+    scheduler: SchedulerConfig = SchedulerConfig()
+    risk: RiskConfig = RiskConfig()
+    monitoring: MonitoringConfig = MonitoringConfig()
+    tracing: TracingConfig = TracingConfig()
+    rate_limits: RateLimitConfig = RateLimitConfig()
 
     model_config = ConfigDict(extra="allow")
 
@@ -3,9 +3,9 @@
 from importlib import import_module
 from typing import TYPE_CHECKING
 
-from .base import ConnectorBase
+from .base import ConnectorBase, ConnectorWrapper
 
-__all__ = ["ConnectorBase", "DriftConnector", "HyperliquidConnector"]
+__all__ = ["ConnectorBase", "ConnectorWrapper", "DriftConnector", "HyperliquidConnector"]
 
 
 def __getattr__(name: str):
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 class ConnectorBase(ABC):
     """Base connector interface for exchanges."""
@@ -23,6 +23,18 @@ class ConnectorBase(ABC):
     ) -> Any:
         """Place an order and return exchange-specific id."""
 
+    async def place_orders(self, orders: List[Dict[str, Any]]) -> List[Any]:
+        """Place several orders and return their ids in the same order.
+
+        Each order is a dict with ``symbol``, ``side``, ``amount`` and
+        ``price`` keys. Connectors with a native bulk endpoint override this
+        to submit everything in a single round-trip.
+        """
+        return [
+            await self.place_order(o["symbol"], o["side"], o["amount"], o["price"])
+            for o in orders
+        ]
+
     @abstractmethod
     async def cancel_order(self, order_id: Any) -> None:
         """Cancel an existing order."""
@@ -30,3 +42,40 @@ class ConnectorBase(ABC):
     @abstractmethod
     async def get_position(self, symbol: str) -> Dict[str, Any]:
         """Return current position information."""
+
+
+class ConnectorWrapper(ConnectorBase):
+    """Connector that forwards every call to ``inner``.
+
+    Subclasses override the calls they need to observe or alter; any other
+    attribute (``async_init``, ``client``...) is looked up on ``inner``.
+    """
+
+    def __init__(self, inner: ConnectorBase):
+        super().__init__(inner.config)
+        self.inner = inner
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "inner":
+            raise AttributeError(name)
+        return getattr(self.inner, name)
+
+    async def fetch_book(self, symbol: str) -> Dict[str, Any]:
+        return await self.inner.fetch_book(symbol)
+
+    async def fetch_funding(self, symbol: str) -> Dict[str, Any]:
+        return await self.inner.fetch_funding(symbol)
+
+    async def place_order(
+        self, symbol: str, side: str, amount: float, price: float
+    ) -> Any:
+        return await self.inner.place_order(symbol, side, amount, price)
+
+    async def place_orders(self, orders: List[Dict[str, Any]]) -> List[Any]:
+        return await self.inner.place_orders(orders)
+
+    async def cancel_order(self, order_id: Any) -> None:
+        await self.inner.cancel_order(order_id)
+
+    async def get_position(self, symbol: str) -> Dict[str, Any]:
+        return await self.inner.get_position(symbol)
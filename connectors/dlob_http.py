@@ -0,0 +1,57 @@
+from typing import Any, Dict, List
+
+try:  # pragma: no cover - optional heavy deps
+    import httpx
+except Exception:  # pragma: no cover - installed with solana
+    httpx = None  # type: ignore
+
+PRICE_PRECISION = 10**6
+BASE_PRECISION = 10**9
+
+
+class DLOBHttpSource:
+    """L2 books from a Drift DLOB server (``GET /l2``).
+
+    The server aggregates resting orders and vAMM liquidity, so the bot
+    needs neither a ``UserMap`` of every account nor a local DLOB. Prices
+    and sizes come back as integers in Drift precision and are converted to
+    floats.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        depth: int = 10,
+        timeout: float = 2.0,
+        client: Any = None,
+    ) -> None:
+        if client is None:
+            if httpx is None:
+                raise ImportError("httpx is required for drift.market_data: dlob_server")
+            client = httpx.AsyncClient(timeout=timeout)
+        self.url = url.rstrip("/")
+        self.depth = depth
+        self.client = client
+
+    @staticmethod
+    def _levels(raw: List[Dict[str, Any]]) -> List[Dict[str, float]]:
+        return [
+            {
+                "price": int(lvl["price"]) / PRICE_PRECISION,
+                "size": int(lvl["size"]) / BASE_PRECISION,
+            }
+            for lvl in raw
+        ]
+
+    async def l2(self, market_name: str) -> Dict[str, Any]:
+        resp = await self.client.get(
+            f"{self.url}/l2",
+            params={"marketName": market_name, "depth": self.depth, "includeVamm": "true"},
+        )
+        resp.raise_for_status()
+        data = resp.json()
+        return {
+            "bids": self._levels(data.get("bids") or []),
+            "asks": self._levels(data.get("asks") or []),
+            "slot": data.get("slot"),
+        }
@@ -1,9 +1,10 @@
 import asyncio
 import logging
+import time
 
 logging.getLogger("websockets").setLevel(logging.WARNING)
 logging.getLogger("httpx").setLevel(logging.WARNING)
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 
 try:  # pragma: no cover - optional heavy deps
     from solders.keypair import Keypair
@@ -28,14 +29,65 @@ except Exception:  # pragma: no cover - modules may be missing during tests
     BASE_PRECISION = 10**9
     PRICE_PRECISION = 10**6
 
+from execution.clock import Clock, get_clock
+from monitoring.startup import rss_bytes
+
 from .base import ConnectorBase
+from .dlob_http import DLOBHttpSource
+from .rpc_pool import Endpoint, RpcPool
+
+MARKET_DATA_MODES = ("usermap", "dlob_server")
+# attributes replaced together when moving to another RPC endpoint
+_STATE = ("connection", "wallet", "client", "user_map", "slot_subscriber", "_dlob")
+# websocket URL of every configured RPC endpoint, looked up by driftpy
+_WS_URLS: Dict[str, str] = {}
+_ws_routing_installed = False
+
+
+def _install_ws_routing() -> None:
+    """Make driftpy resolve websocket URLs through ``_WS_URLS``, once per process."""
+    global _ws_routing_installed
+    if _ws_routing_installed:
+        return
+    try:
+        from driftpy import types as drift_types
+    except Exception:
+        return
+    original = drift_types.get_ws_url
+    drift_types.get_ws_url = lambda url: _WS_URLS.get(url) or original(url)
+    _ws_routing_installed = True
 
 
 class DriftConnector(ConnectorBase):
-    """Connector implementation using DriftPy SDK."""
+    """Connector implementation using DriftPy SDK.
+
+    ``market_data`` selects where books come from. ``usermap`` (the default)
+    subscribes to every user account and builds the DLOB locally, which is
+    the slow and memory hungry part of startup. ``dlob_server`` skips the
+    UserMap and DLOB entirely and polls L2 from ``dlob_url``. In both modes
+    ``perp_market_indexes`` narrows the client's own account subscription to
+    the configured markets.
+
+    ``rpc_url`` and any ``rpc_endpoints`` form an ``RpcPool``. Connects go to
+    the best ranked endpoint and fail over to the next one. With more than
+    one endpoint the pool is probed every ``rpc_pool.probe_interval_sec``
+    and the subscription moves to another endpoint when the active one
+    becomes unhealthy or is clearly slower.
+    """
+
+    # RPC requests per call; funding and positions read subscribed accounts
+    REQUEST_WEIGHTS = {
+        "fetch_book": 0,
+        "fetch_funding": 0,
+        "get_position": 0,
+        "place_order": 1,
+        "place_orders": 1,
+        "cancel_order": 1,
+    }
 
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], clock: Optional[Clock] = None):
         super().__init__(config)
+        self.clock = clock or get_clock()
         self.connection = None
         self.wallet = None
         self.client = None
@@ -43,92 +95,242 @@ class DriftConnector(ConnectorBase):
         self.slot_subscriber = None
         self._dlob = None
         self.ws_error_reported = False
+        self._l2: Optional[DLOBHttpSource] = None
+        self.market_data = self.config.get("market_data", "usermap")
+        if self.market_data not in MARKET_DATA_MODES:
+            raise ValueError(f"Unknown drift market_data mode: {self.market_data}")
+        if self.market_data == "dlob_server":
+            # each book is a request to the DLOB server
+            self.REQUEST_WEIGHTS = {**self.REQUEST_WEIGHTS, "fetch_book": 1}
+        # seconds spent in each step of the last successful async_init
+        self.init_timings: Dict[str, float] = {}
+        # time to first book and resident memory, for comparing the modes
+        self.market_data_stats: Dict[str, Any] = {"mode": self.market_data}
+        self._init_started: Optional[float] = None
+        self.rpc_pool: Optional[RpcPool] = None
+        self._monitor_task: Optional[asyncio.Task] = None
 
     async def async_init(self) -> None:
         logger = logging.getLogger(__name__)
-        rpc_url = self.config.get("rpc_url")
-        if not rpc_url:
+        if not self.config.get("rpc_url") and not self.config.get("rpc_endpoints"):
             raise RuntimeError("'rpc_url' must be provided in config")
+        if self.market_data == "dlob_server":
+            if not self.config.get("dlob_url"):
+                raise RuntimeError("'dlob_url' must be provided for market_data: dlob_server")
+            if self._l2 is None:
+                # books come from the DLOB server: no UserMap, no local DLOB
+                self._l2 = DLOBHttpSource(self.config["dlob_url"], depth=self.config.get("dlob_depth", 10))
 
-        ws_url = self.config.get("ws_url")
-        if ws_url:
-            try:
-                from driftpy import types as drift_types
-
-                drift_types.get_ws_url = lambda _url: ws_url
-            except Exception:
-                pass
-
-        async def _connect(url: str):
-            conn = AsyncClient(url)
-            await asyncio.wait_for(conn.get_slot(), timeout=5)
-            wallet = Keypair.from_base58_string(self.config["private_key"])
-            client = DriftClient(
-                conn,
-                wallet,
-                env="mainnet",
-                active_sub_account_id=self.config.get("sub_account_id", 0),
-            )
-            return conn, wallet, client
-
-        max_attempts = 5
+        self.rpc_pool = RpcPool.from_config(self.config, lambda url: AsyncClient(url))
+        self._route_ws_urls()
+        failover = len(self.rpc_pool.endpoints) > 1
+        if failover:
+            await self.rpc_pool.probe_all()
 
+        pool_cfg = self.config.get("rpc_pool", {}) or {}
+        max_attempts = int(pool_cfg.get("connect_attempts", 5))
+        retry_delay = float(pool_cfg.get("retry_delay_sec", 2.0))
+        self._init_started = time.perf_counter()
 
         for attempt in range(1, max_attempts + 1):
+            endpoint = self.rpc_pool.best()
             try:
-                self.connection, self.wallet, self.client = await _connect(rpc_url)
-                try:
-                    await self.client.subscribe()
-
-                    user_map_config = UserMapConfig(self.client, WebsocketConfig())
-                    self.user_map = UserMap(user_map_config)
-                    await self.user_map.subscribe()
-
-                    self.slot_subscriber = SlotSubscriber(self.client)
-                    await self.slot_subscriber.subscribe()
-
-                    dlob_config = DLOBClientConfig(
-                        self.client,
-                        self.user_map,
-                        self.slot_subscriber,
-                        1000,
-                    )
-                    self._dlob = DLOBSubscriber(config=dlob_config)
-                    await self._dlob.subscribe()
-                except Exception as e_sub:
-                    logger.error("client.subscribe() failed with error: %s", e_sub)
-                    raise
-                if self.ws_error_reported:
-                    logger.info("Reconnected to Drift")
-                    self.ws_error_reported = False
-                logger.info(
-                    "DriftConnector initialized and subscribed to %s", rpc_url
-                )
-                break
+                state, timings = await self._open(endpoint.url)
             except Exception as e:
+                self.rpc_pool.record_failure(endpoint, e)
                 if not self.ws_error_reported:
                     logger.warning("Drift WebSocket disconnected")
                     self.ws_error_reported = True
                 logger.warning(
-                    "[DriftConnector] RPC connect error: %s (attempt %s/%s)",
-                    e,
+                    "[DriftConnector] RPC connect error on %s: %s (attempt %s/%s)",
+                    endpoint.name,
+                    self.rpc_pool.redact(e),
                     attempt,
                     max_attempts,
                 )
                 if attempt < max_attempts:
-                    await asyncio.sleep(2)
-                else:
-                    raise RuntimeError(
-                        f"Unable to connect to RPC endpoint {rpc_url} after {max_attempts} attempts: {e}"
-                    )
+                    # fail over at once while another endpoint looks healthy
+                    if not self.rpc_pool.has_alternative(endpoint):
+                        await self.clock.sleep(retry_delay)
+                    continue
+                names = ", ".join(ep.name for ep in self.rpc_pool.endpoints)
+                raise RuntimeError(
+                    f"Unable to connect to RPC endpoint {names} after {max_attempts} attempts: "
+                    f"{self.rpc_pool.redact(e)}"
+                )
+            self._adopt(state, endpoint)
+            if self.ws_error_reported:
+                logger.info("Reconnected to Drift")
+                self.ws_error_reported = False
+            self.init_timings = timings
+            self.market_data_stats.update(
+                init_sec=time.perf_counter() - self._init_started,
+                rss_after_init=rss_bytes(),
+            )
+            logger.info(
+                "DriftConnector initialized and subscribed to %s (%s market data; %s)",
+                endpoint.name,
+                self.market_data,
+                ", ".join(f"{k} {v:.2f}s" for k, v in timings.items()),
+            )
+            break
+
+        if failover and self.rpc_pool.probe_interval_sec > 0 and self._monitor_task is None:
+            self._monitor_task = asyncio.get_running_loop().create_task(self._monitor())
+
+    def _route_ws_urls(self) -> None:
+        """Point driftpy at each endpoint's own websocket URL."""
+        ws_urls = {e.url: e.ws_url for e in self.rpc_pool.endpoints if e.ws_url}
+        if ws_urls:
+            _WS_URLS.update(ws_urls)
+            _install_ws_routing()
+
+    async def _open(self, url: str) -> Tuple[Dict[str, Any], Dict[str, float]]:
+        """Connect and subscribe on ``url`` without touching the live state.
+
+        Returns the new connection, client and subscribers, and the seconds
+        spent in each step.
+        """
+        logger = logging.getLogger(__name__)
+        timings: Dict[str, float] = {}
+        state: Dict[str, Any] = dict.fromkeys(_STATE)
+        markets: Dict[str, Any] = {}
+        if self.config.get("perp_market_indexes"):
+            # quote collateral (USDC, spot 0) is always needed for margin
+            markets = {
+                "perp_market_indexes": list(self.config["perp_market_indexes"]),
+                "spot_market_indexes": [0],
+            }
+
+        start = time.perf_counter()
+        conn = state["connection"] = AsyncClient(url)
+        await asyncio.wait_for(conn.get_slot(), timeout=5)
+        state["wallet"] = Keypair.from_base58_string(self.config["private_key"])
+        client = state["client"] = DriftClient(
+            conn,
+            state["wallet"],
+            env="mainnet",
+            active_sub_account_id=self.config.get("sub_account_id", 0),
+            **markets,
+        )
+        timings["connect"] = time.perf_counter() - start
+        try:
+            start = time.perf_counter()
+            await client.subscribe()
+            timings["client_subscribe"] = time.perf_counter() - start
+
+            if self.market_data != "dlob_server":
+                user_map = state["user_map"] = UserMap(UserMapConfig(client, WebsocketConfig()))
+                slot_subscriber = state["slot_subscriber"] = SlotSubscriber(client)
+                # both only need the subscribed client: load them together
+                start = time.perf_counter()
+                await asyncio.gather(user_map.subscribe(), slot_subscriber.subscribe())
+                timings["user_map_and_slot_subscribe"] = time.perf_counter() - start
+
+                start = time.perf_counter()
+                dlob_config = DLOBClientConfig(client, user_map, slot_subscriber, 1000)
+                state["_dlob"] = DLOBSubscriber(config=dlob_config)
+                await state["_dlob"].subscribe()
+                timings["dlob_subscribe"] = time.perf_counter() - start
+        except Exception as e_sub:
+            error = self.rpc_pool.redact(e_sub) if self.rpc_pool else e_sub
+            logger.error("client.subscribe() failed with error: %s", error)
+            await self._close(state)
+            raise
+        return state, timings
+
+    def _adopt(self, state: Dict[str, Any], endpoint: Endpoint) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+        self.rpc_pool.active = endpoint
+
+    @staticmethod
+    async def _close(state: Dict[str, Any]) -> None:
+        """Best effort unsubscribe of a replaced or half built subscription."""
+        for name in ("_dlob", "slot_subscriber", "user_map", "client", "connection"):
+            obj = state.get(name)
+            close = getattr(obj, "close" if name == "connection" else "unsubscribe", None)
+            if close is None:
+                continue
+            try:
+                res = close()
+                if asyncio.iscoroutine(res):
+                    await res
+            except Exception:  # pragma: no cover - the old endpoint may be gone
+                pass
+
+    async def swap_endpoint(self, endpoint: Endpoint) -> None:
+        """Move the live subscription to ``endpoint``.
+
+        The current subscription keeps serving until the new one is fully
+        subscribed; only then are the two exchanged and the old one closed.
+        """
+        logger = logging.getLogger(__name__)
+        previous = self.rpc_pool.active
+        try:
+            state, timings = await self._open(endpoint.url)
+        except Exception as e:
+            self.rpc_pool.record_failure(endpoint, e)
+            raise
+        old = {name: getattr(self, name) for name in _STATE}
+        self._adopt(state, endpoint)
+        self.rpc_pool.swaps += 1
+        logger.info(
+            "Drift RPC switched from %s to %s (%s)",
+            previous.name if previous else None,
+            endpoint.name,
+            ", ".join(f"{k} {v:.2f}s" for k, v in timings.items()),
+        )
+        await self._close(old)
+
+    async def _monitor(self) -> None:
+        """Probe the pool and move off endpoints that degrade."""
+        logger = logging.getLogger(__name__)
+        while True:
+            await self.clock.sleep(self.rpc_pool.probe_interval_sec)
+            try:
+                await self.rpc_pool.probe_all()
+                target = self.rpc_pool.switch_target(self.rpc_pool.active)
+                if target is not None:
+                    await self.swap_endpoint(target)
+            except Exception as e:
+                logger.warning(
+                    "[DriftConnector] RPC pool check failed: %s", self.rpc_pool.redact(e)
+                )
 
     def _market_id(self, symbol: str) -> MarketId:
         idx, mtype = self.client.get_market_index_and_type(symbol)
         return MarketId(index=idx, kind=mtype)
 
+    def _first_book(self) -> None:
+        if "first_book_sec" in self.market_data_stats or self._init_started is None:
+            return
+        self.market_data_stats.update(
+            first_book_sec=time.perf_counter() - self._init_started,
+            rss_at_first_book=rss_bytes(),
+        )
+        stats = self.market_data_stats
+        logging.getLogger(__name__).info(
+            "Drift first book %.2fs after init start (%s market data, rss %.0f MiB)",
+            stats["first_book_sec"],
+            stats["mode"],
+            stats["rss_at_first_book"] / 2**20,
+        )
+
     async def fetch_book(self, symbol: str) -> Dict[str, Any]:
-        """Return best bid/ask using the DLOB API."""
+        """Return best bid/ask using the DLOB API.
+
+        With ``market_data: dlob_server`` the server's L2 is returned to
+        ``dlob_depth`` levels instead.
+        """
         try:
+            if self._l2 is not None:
+                l2 = await self._l2.l2(symbol)
+                book = {"bids": l2["bids"], "asks": l2["asks"]}
+                if book["bids"] or book["asks"]:
+                    self._first_book()
+                return book
+
             if not self._dlob:
                 dlob_url = self.config.get("dlob_url")
                 self._dlob = DLOBSubscriber(url=dlob_url)
@@ -137,6 +339,8 @@ class DriftConnector(ConnectorBase):
             ob = self._dlob.get_l2_orderbook_sync(market_name=symbol)
             best_bid = ob.bids[0] if ob.bids else None
             best_ask = ob.asks[0] if ob.asks else None
+            if best_bid or best_ask:
+                self._first_book()
             return {
                 "bids": (
                     [
@@ -183,9 +387,9 @@ class DriftConnector(ConnectorBase):
             ),
         }
 
-    async def place_order(
+    def _order_params(
         self, symbol: str, side: str, amount: float, price: float
-    ) -> Any:
+    ) -> OrderParams:
         idx, _ = self.client.get_market_index_and_type(symbol)
         direction = (
             PositionDirection.Long()
@@ -211,8 +415,26 @@ class DriftConnector(ConnectorBase):
             market_type=MarketType.Perp(),
             price=int(price * price_prec),
         )
+        return order
+
+    async def place_order(
+        self, symbol: str, side: str, amount: float, price: float
+    ) -> Any:
+        order = self._order_params(symbol, side, amount, price)
         return await self.client.place_perp_order(order)
 
+    async def place_orders(self, orders: List[Dict[str, Any]]) -> List[Any]:
+        """Pack one place-order instruction per order into a single transaction."""
+        ixs = [
+            self.client.get_place_perp_order_ix(
+                self._order_params(o["symbol"], o["side"], o["amount"], o["price"])
+            )
+            for o in orders
+        ]
+        res = await self.client.send_ixs(ixs)
+        sig = getattr(res, "tx_sig", res)
+        return [sig] * len(orders)
+
     async def cancel_order(self, order_id: Any) -> None:
         await self.client.cancel_order(order_id)
 
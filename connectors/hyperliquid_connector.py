@@ -3,7 +3,7 @@ import logging
 
 logging.getLogger("websockets").setLevel(logging.WARNING)
 logging.getLogger("httpx").setLevel(logging.WARNING)
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 try:  # pragma: no cover - optional heavy deps
     from eth_account import Account
@@ -17,6 +17,18 @@ from .base import ConnectorBase
 class HyperliquidConnector(ConnectorBase):
     """Connector implementation using Hyperliquid SDK."""
 
+    # API weight per call, against Hyperliquid's 1200 per minute per IP:
+    # metaAndAssetCtxs counts 20, clearinghouseState 2, and an exchange
+    # action 1 (+1 per 40 orders in a batch)
+    REQUEST_WEIGHTS = {
+        "fetch_book": 20,
+        "fetch_funding": 20,
+        "get_position": 2,
+        "place_order": 1,
+        "place_orders": 1,
+        "cancel_order": 1,
+    }
+
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.api_url = config.get("api_url")
@@ -36,7 +48,9 @@ class HyperliquidConnector(ConnectorBase):
         if self.info is None:
             raise ImportError("hyperliquid package is required")
         try:
-            result = self.info.meta_and_asset_ctxs()
+            # the SDK call is a blocking HTTP request: keep it off the loop so
+            # Drift can initialize meanwhile
+            result = await asyncio.to_thread(self.info.meta_and_asset_ctxs)
             if asyncio.iscoroutine(result):
                 await asyncio.wait_for(result, timeout=5)
             else:
@@ -98,10 +112,41 @@ class HyperliquidConnector(ConnectorBase):
             {"limit": {"tif": "Gtc"}},
         )
         try:
-            return res["response"]["data"]["statuses"][0]["resting"]["oid"]
+            return self._status_oid(res["response"]["data"]["statuses"][0])
         except Exception:
             return None
 
+    async def place_orders(self, orders: List[Dict[str, Any]]) -> List[Any]:
+        """Place several limit orders with a single bulk order action."""
+        if self.exchange is None:
+            raise ImportError("hyperliquid package is required")
+        requests = [
+            {
+                "coin": o["symbol"],
+                "is_buy": o["side"].lower() == "buy",
+                "sz": o["amount"],
+                "limit_px": o["price"],
+                "order_type": {"limit": {"tif": "Gtc"}},
+                "reduce_only": False,
+            }
+            for o in orders
+        ]
+        res = await self.exchange.bulk_orders(requests)
+        try:
+            statuses = res["response"]["data"]["statuses"]
+        except Exception:
+            statuses = []
+        oids = [self._status_oid(st) for st in statuses]
+        return oids + [None] * (len(orders) - len(oids))
+
+    @staticmethod
+    def _status_oid(status: Dict[str, Any]) -> Any:
+        """Extract the order id from a resting or immediately filled status."""
+        for key in ("resting", "filled"):
+            if key in status:
+                return status[key].get("oid")
+        return None
+
     async def cancel_order(self, order_id: Any) -> None:
         """Cancel an existing order via the Exchange API."""
         if self.exchange is None:
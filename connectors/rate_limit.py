@@ -0,0 +1,188 @@
+"""Per-venue request weight budgets for connector calls."""
+
+import asyncio
+import heapq
+import itertools
+from typing import Any, Dict, List, Optional, Tuple
+
+from execution.clock import Clock, get_clock
+
+from .base import ConnectorBase, ConnectorWrapper
+
+ORDER = 0
+MARKET_DATA = 1
+CLASSES = {ORDER: "order", MARKET_DATA: "market_data"}
+PRIORITIES = {
+    "place_order": ORDER,
+    "place_orders": ORDER,
+    "cancel_order": ORDER,
+    "get_position": ORDER,
+    "fetch_book": MARKET_DATA,
+    "fetch_funding": MARKET_DATA,
+}
+
+
+class TokenBucket:
+    """Weight budget that refills continuously and is handed out by priority.
+
+    Callers queue by priority, then by arrival. Only the head of the queue
+    may take tokens, so market data never overtakes a waiting order. Market
+    data also leaves ``reserve`` tokens in the bucket, so an order arriving
+    while the budget is low does not have to wait for a refill.
+    """
+
+    def __init__(
+        self,
+        capacity: float,
+        refill_per_sec: float,
+        reserve: float = 0.0,
+        clock: Optional[Clock] = None,
+    ) -> None:
+        if capacity <= 0 or refill_per_sec <= 0:
+            raise ValueError("capacity and refill_per_sec must be positive")
+        self.capacity = float(capacity)
+        self.refill_per_sec = float(refill_per_sec)
+        self.reserve = min(float(reserve), self.capacity)
+        self.clock = clock or get_clock()
+        self.tokens = self.capacity
+        self._updated: Optional[float] = None
+        self._queue: List[Tuple[int, int]] = []
+        self._seq = itertools.count()
+        self._changed = asyncio.Event()
+
+    def _refill(self) -> None:
+        now = self.clock.time()
+        if self._updated is not None:
+            self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.refill_per_sec)
+        self._updated = now
+
+    def queued(self) -> Dict[str, int]:
+        out = {name: 0 for name in CLASSES.values()}
+        for priority, _ in self._queue:
+            out[CLASSES[priority]] += 1
+        return out
+
+    async def acquire(self, weight: float, priority: int = ORDER) -> float:
+        """Take ``weight`` tokens once allowed; return the seconds waited."""
+        weight = min(float(weight), self.capacity)
+        need = weight if priority == ORDER else min(weight + self.reserve, self.capacity)
+        entry = (priority, next(self._seq))
+        heapq.heappush(self._queue, entry)
+        start = self.clock.time()
+        try:
+            while True:
+                self._refill()
+                if self._queue[0] != entry:
+                    await self._changed.wait()
+                elif self.tokens + 1e-9 >= need:
+                    self.tokens -= weight
+                    return self.clock.time() - start
+                else:
+                    await self.clock.sleep((need - self.tokens) / self.refill_per_sec)
+        finally:
+            self._queue.remove(entry)
+            heapq.heapify(self._queue)
+            # wake the rest to find the new head
+            self._changed.set()
+            self._changed = asyncio.Event()
+
+
+class RateLimitedConnector(ConnectorWrapper):
+    """Spend each call's API weight from a ``TokenBucket`` before making it.
+
+    Weights come from the inner connector's ``REQUEST_WEIGHTS``, overridden
+    by ``weights``; calls without a weight count 1 and zero weight calls
+    pass straight through. Orders, cancels and position reads go ahead of
+    book and funding polls. A book or funding request for a symbol that is
+    already queued or in flight waits for that request and shares its
+    result instead of spending the budget again.
+    """
+
+    def __init__(
+        self,
+        inner: ConnectorBase,
+        venue: str,
+        bucket: TokenBucket,
+        weights: Optional[Dict[str, float]] = None,
+    ) -> None:
+        super().__init__(inner)
+        self.venue = venue
+        self.bucket = bucket
+        self.weights = {**getattr(inner, "REQUEST_WEIGHTS", {}), **(weights or {})}
+        self.stats = {
+            name: {"requests": 0, "weight": 0.0, "wait_sec": 0.0, "coalesced": 0}
+            for name in CLASSES.values()
+        }
+        self._inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+
+    @classmethod
+    def from_config(
+        cls, inner: ConnectorBase, venue: str, config: Dict[str, Any], clock: Optional[Clock] = None
+    ) -> "RateLimitedConnector":
+        """Wrap ``inner`` with the budget in ``rate_limits.<venue>``."""
+        cfg = ((config.get("rate_limits", {}) or {}).get(venue, {})) or {}
+        capacity = float(cfg.get("capacity", 100))
+        bucket = TokenBucket(
+            capacity,
+            float(cfg.get("refill_per_sec", 10)),
+            reserve=capacity * float(cfg.get("reserve_fraction", 0.1)),
+            clock=clock,
+        )
+        return cls(inner, venue, bucket, cfg.get("weights"))
+
+    async def _spend(self, method: str) -> None:
+        weight = self.weights.get(method, 1)
+        if weight <= 0:
+            return
+        priority = PRIORITIES[method]
+        waited = await self.bucket.acquire(weight, priority)
+        stats = self.stats[CLASSES[priority]]
+        stats["requests"] += 1
+        stats["weight"] += weight
+        stats["wait_sec"] += waited
+
+    async def _limited(self, method: str, call: Any) -> Any:
+        try:
+            await self._spend(method)
+        except BaseException:
+            call.close()
+            raise
+        return await call
+
+    async def _market_data(self, method: str, symbol: str) -> Dict[str, Any]:
+        key = (method, symbol)
+        pending = self._inflight.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._limited(method, getattr(self.inner, method)(symbol)))
+            self._inflight[key] = pending
+            pending.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.stats["market_data"]["coalesced"] += 1
+        return await asyncio.shield(pending)
+
+    def usage(self) -> Dict[str, Any]:
+        """Budget left, queue depth and spend per request class since start."""
+        return {
+            "tokens": self.bucket.tokens,
+            "capacity": self.bucket.capacity,
+            "queued": self.bucket.queued(),
+            "classes": {name: dict(s) for name, s in self.stats.items()},
+        }
+
+    async def fetch_book(self, symbol: str) -> Dict[str, Any]:
+        return await self._market_data("fetch_book", symbol)
+
+    async def fetch_funding(self, symbol: str) -> Dict[str, Any]:
+        return await self._market_data("fetch_funding", symbol)
+
+    async def place_order(self, symbol: str, side: str, amount: float, price: float) -> Any:
+        return await self._limited("place_order", self.inner.place_order(symbol, side, amount, price))
+
+    async def place_orders(self, orders: List[Dict[str, Any]]) -> List[Any]:
+        return await self._limited("place_orders", self.inner.place_orders(orders))
+
+    async def cancel_order(self, order_id: Any) -> None:
+        await self._limited("cancel_order", self.inner.cancel_order(order_id))
+
+    async def get_position(self, symbol: str) -> Dict[str, Any]:
+        return await self._limited("get_position", self.inner.get_position(symbol))
@@ -0,0 +1,24 @@
+from typing import Any, Dict
+
+from storage.ticks import TickRecorder
+
+from .base import ConnectorBase, ConnectorWrapper
+
+
+class RecordingConnector(ConnectorWrapper):
+    """Connector wrapper that archives every book and funding snapshot."""
+
+    def __init__(self, inner: ConnectorBase, recorder: TickRecorder, venue: str):
+        super().__init__(inner)
+        self.recorder = recorder
+        self.venue = venue
+
+    async def fetch_book(self, symbol: str) -> Dict[str, Any]:
+        book = await self.inner.fetch_book(symbol)
+        self.recorder.record_book(self.venue, symbol, book)
+        return book
+
+    async def fetch_funding(self, symbol: str) -> Dict[str, Any]:
+        funding = await self.inner.fetch_funding(symbol)
+        self.recorder.record_funding(self.venue, symbol, funding)
+        return funding
@@ -0,0 +1,127 @@
+import itertools
+from typing import Any, Dict, List, Optional, Tuple
+
+from execution.clock import Clock, get_clock
+from storage.ticks import BOOK, FUNDING, TickArchive, row_to_book, row_to_funding
+
+from .base import ConnectorBase
+
+
+class ReplayFinished(BaseException):
+    """Raised once a replayed stream has no snapshots left.
+
+    Derives from ``BaseException`` so the ``except Exception`` fallbacks in
+    the strategies do not mistake the end of the data for a venue error.
+    """
+
+
+class ReplayPacer:
+    """Map recorded timestamps onto a clock.
+
+    The first snapshot served anchors recorded time to clock time; later
+    snapshots are held back until ``(ts - ts0) / speed`` has elapsed. A
+    ``speed`` of ``None`` or ``0`` replays as fast as possible. On a
+    ``VirtualClock`` the original timing is kept without waiting.
+    """
+
+    def __init__(
+        self,
+        speed: Optional[float] = 1.0,
+        start: Optional[float] = None,
+        clock: Optional[Clock] = None,
+    ) -> None:
+        self.speed = speed or None
+        self.clock = clock or get_clock()
+        self._ts0 = start
+        self._t0: Optional[float] = None
+
+    async def wait_until(self, ts: float) -> None:
+        if self.speed is None:
+            return
+        if self._t0 is None:
+            self._t0 = self.clock.time()
+            if self._ts0 is None:
+                self._ts0 = ts
+        delay = self._t0 + (ts - self._ts0) / self.speed - self.clock.time()
+        if delay > 0:
+            await self.clock.sleep(delay)
+
+
+class ReplayConnector(ConnectorBase):
+    """Serve recorded book and funding snapshots of one venue.
+
+    Every ``fetch_book``/``fetch_funding`` call for a symbol returns the next
+    snapshot recorded for it, in recording order, so a strategy that makes
+    the same calls as during recording sees exactly the same data. Orders
+    fill immediately at their limit price and are tracked in a Drift style
+    position.
+    """
+
+    def __init__(
+        self,
+        archive: TickArchive,
+        venue: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        pacer: Optional[ReplayPacer] = None,
+        config: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        super().__init__(config or {})
+        self.archive = archive
+        self.venue = venue
+        self.start = start
+        self.end = end
+        self.pacer = pacer or ReplayPacer(speed=None)
+        self._streams: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._cursors: Dict[Tuple[str, str], int] = {}
+        self._positions: Dict[str, Dict[str, float]] = {}
+        self._order_ids = itertools.count(1)
+        self.orders: List[Dict[str, Any]] = []
+
+    async def async_init(self) -> None:
+        return None
+
+    async def _next(self, kind: str, symbol: str) -> Tuple[Dict[str, Any], int]:
+        key = (kind, symbol)
+        cols = self._streams.get(key)
+        if cols is None:
+            cols = self._streams[key] = self.archive.read(
+                self.venue, symbol, kind, self.start, self.end
+            )
+        index = self._cursors.get(key, 0)
+        if index >= len(cols["ts"]):
+            raise ReplayFinished(f"{self.venue} {symbol} {kind} exhausted")
+        self._cursors[key] = index + 1
+        await self.pacer.wait_until(float(cols["ts"][index]))
+        return cols, index
+
+    async def fetch_book(self, symbol: str) -> Dict[str, Any]:
+        cols, index = await self._next(BOOK, symbol)
+        return row_to_book(cols, index)
+
+    async def fetch_funding(self, symbol: str) -> Dict[str, Any]:
+        cols, index = await self._next(FUNDING, symbol)
+        return row_to_funding(cols, index)
+
+    async def place_order(
+        self, symbol: str, side: str, amount: float, price: float
+    ) -> Any:
+        oid = next(self._order_ids)
+        sign = 1 if side.lower() == "buy" else -1
+        pos = self._positions.setdefault(
+            symbol, {"base_asset_amount": 0.0, "quote_asset_amount": 0.0}
+        )
+        pos["base_asset_amount"] += sign * amount
+        pos["quote_asset_amount"] -= sign * amount * price
+        self.orders.append(
+            {"oid": oid, "symbol": symbol, "side": side, "amount": amount, "price": price}
+        )
+        return oid
+
+    async def cancel_order(self, order_id: Any) -> None:
+        return None
+
+    async def get_position(self, symbol: str) -> Dict[str, Any]:
+        return dict(
+            self._positions.get(symbol, {"base_asset_amount": 0.0, "quote_asset_amount": 0.0})
+        )
@@ -0,0 +1,211 @@
+"""Drift RPC endpoints ranked by probed latency and slot lag."""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlsplit
+
+
+@dataclass
+class Endpoint:
+    url: str
+    ws_url: Optional[str] = None
+    name: str = ""
+    index: int = 0
+    # moving average of get_slot round trips
+    latency_sec: Optional[float] = None
+    slot: Optional[int] = None
+    slot_lag: int = 0
+    # consecutive failed probes or connects; reset by a good probe
+    failures: int = 0
+    probes: int = 0
+    errors: int = 0
+    last_error: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        if not self.name:
+            # never the full URL: providers put API keys in it
+            self.name = urlsplit(self.url).hostname or f"rpc{self.index}"
+
+    def redact(self, error: Any) -> str:
+        """``str(error)`` with this endpoint's URLs replaced by its name."""
+        text = str(error) or type(error).__name__
+        for url in (self.url, self.ws_url):
+            if url:
+                text = text.replace(url, self.name)
+        return text
+
+
+class RpcPool:
+    """Endpoints the Drift connector can use, best first.
+
+    ``probe_all`` times ``get_slot`` on every endpoint. The slot lag of an
+    endpoint is how far its slot is behind the highest slot seen in that
+    round. An endpoint is healthy while it has fewer than ``max_failures``
+    consecutive failures and lags by at most ``max_slot_lag`` slots.
+    ``ranked`` orders healthy endpoints by latency, then the rest;
+    unprobed endpoints keep their configured order. Endpoints sharing a
+    name, such as two keys on one provider host, get their position in the
+    pool appended so logs and metrics tell them apart.
+    """
+
+    def __init__(
+        self,
+        endpoints: List[Endpoint],
+        client_factory: Optional[Callable[[str], Any]] = None,
+        probe_interval_sec: float = 10.0,
+        probe_timeout_sec: float = 2.0,
+        max_slot_lag: int = 50,
+        max_failures: int = 2,
+        switch_margin: float = 0.3,
+        alpha: float = 0.3,
+    ) -> None:
+        if not endpoints:
+            raise ValueError("RpcPool needs at least one endpoint")
+        names = set()
+        for i, endpoint in enumerate(endpoints):
+            name, n = endpoint.name, i
+            while name in names:
+                name, n = f"{endpoint.name}-{n}", n + 1
+            endpoint.name = name
+            names.add(name)
+        self.endpoints = endpoints
+        self.client_factory = client_factory
+        self.probe_interval_sec = float(probe_interval_sec)
+        self.probe_timeout_sec = float(probe_timeout_sec)
+        self.max_slot_lag = int(max_slot_lag)
+        self.max_failures = int(max_failures)
+        self.switch_margin = float(switch_margin)
+        self.alpha = float(alpha)
+        self.active: Optional[Endpoint] = None
+        self.swaps = 0
+        self._clients: Dict[str, Any] = {}
+
+    @classmethod
+    def from_config(
+        cls, config: Dict[str, Any], client_factory: Optional[Callable[[str], Any]] = None
+    ) -> "RpcPool":
+        """Pool of ``rpc_url``/``ws_url`` followed by ``rpc_endpoints``.
+
+        Entries of ``rpc_endpoints`` are URLs or mappings with ``rpc_url``
+        and optional ``ws_url`` and ``name``. Tuning is read from
+        ``rpc_pool``.
+        """
+        entries: List[Dict[str, Any]] = []
+        if config.get("rpc_url"):
+            entries.append({"rpc_url": config["rpc_url"], "ws_url": config.get("ws_url")})
+        for entry in config.get("rpc_endpoints") or []:
+            entry = {"rpc_url": entry} if isinstance(entry, str) else dict(entry)
+            if entry.get("rpc_url") and entry["rpc_url"] not in {e["rpc_url"] for e in entries}:
+                entries.append(entry)
+        endpoints = [
+            Endpoint(e["rpc_url"], e.get("ws_url"), e.get("name") or "", index=i)
+            for i, e in enumerate(entries)
+        ]
+        cfg = config.get("rpc_pool", {}) or {}
+        return cls(
+            endpoints,
+            client_factory=client_factory,
+            probe_interval_sec=cfg.get("probe_interval_sec", 10.0),
+            probe_timeout_sec=cfg.get("probe_timeout_sec", 2.0),
+            max_slot_lag=cfg.get("max_slot_lag", 50),
+            max_failures=cfg.get("max_failures", 2),
+            switch_margin=cfg.get("switch_margin", 0.3),
+        )
+
+    def redact(self, error: Any) -> str:
+        """``str(error)`` with the URL of every endpoint replaced by its name."""
+        text = str(error) or type(error).__name__
+        for endpoint in self.endpoints:
+            text = endpoint.redact(text)
+        return text
+
+    def healthy(self, endpoint: Endpoint) -> bool:
+        return endpoint.failures < self.max_failures and endpoint.slot_lag <= self.max_slot_lag
+
+    def ranked(self) -> List[Endpoint]:
+        def key(e: Endpoint):
+            healthy = self.healthy(e)
+            latency = e.latency_sec if e.latency_sec is not None else float("inf")
+            # unhealthy ones last, the least failed first
+            return (not healthy, 0 if healthy else e.failures, latency, e.index)
+
+        return sorted(self.endpoints, key=key)
+
+    def best(self) -> Endpoint:
+        return self.ranked()[0]
+
+    def has_alternative(self, endpoint: Endpoint) -> bool:
+        """Whether a healthy endpoint other than ``endpoint`` is available."""
+        return any(e is not endpoint and self.healthy(e) for e in self.endpoints)
+
+    def record_failure(self, endpoint: Endpoint, error: Any) -> None:
+        """A connect on ``endpoint`` failed: take it out of rotation until a good probe."""
+        endpoint.failures = max(endpoint.failures + 1, self.max_failures)
+        endpoint.errors += 1
+        endpoint.last_error = endpoint.redact(error)
+
+    def switch_target(self, current: Optional[Endpoint]) -> Optional[Endpoint]:
+        """Endpoint to move ``current`` to, or ``None`` to stay.
+
+        Leave an unhealthy endpoint for any healthy one. Between healthy
+        endpoints, only move when the latency gain exceeds ``switch_margin``
+        so that probe noise does not cause flapping.
+        """
+        best = self.best()
+        if current is None or best is current or not self.healthy(best):
+            return None
+        if not self.healthy(current):
+            return best
+        if current.latency_sec is None or best.latency_sec is None:
+            return None
+        if best.latency_sec < current.latency_sec * (1 - self.switch_margin):
+            return best
+        return None
+
+    def _client(self, endpoint: Endpoint) -> Any:
+        client = self._clients.get(endpoint.url)
+        if client is None:
+            client = self._clients[endpoint.url] = self.client_factory(endpoint.url)
+        return client
+
+    async def probe(self, endpoint: Endpoint) -> None:
+        endpoint.probes += 1
+        start = time.perf_counter()
+        try:
+            slot = await asyncio.wait_for(self._client(endpoint).get_slot(), self.probe_timeout_sec)
+        except Exception as e:
+            endpoint.failures += 1
+            endpoint.errors += 1
+            endpoint.last_error = endpoint.redact(e)
+            return
+        elapsed = time.perf_counter() - start
+        endpoint.slot = int(getattr(slot, "value", slot))
+        endpoint.failures = 0
+        endpoint.latency_sec = (
+            elapsed
+            if endpoint.latency_sec is None
+            else self.alpha * elapsed + (1 - self.alpha) * endpoint.latency_sec
+        )
+
+    async def probe_all(self) -> None:
+        await asyncio.gather(*(self.probe(e) for e in self.endpoints))
+        slots = [e.slot for e in self.endpoints if e.slot is not None]
+        top = max(slots, default=0)
+        for e in self.endpoints:
+            e.slot_lag = top - e.slot if e.slot is not None else 0
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Per-endpoint health, keyed by stat then endpoint name."""
+        out: Dict[str, Dict[str, float]] = {
+            k: {} for k in ("latency_sec", "slot_lag", "healthy", "active", "failures", "errors")
+        }
+        for e in self.endpoints:
+            out["latency_sec"][e.name] = e.latency_sec
+            out["slot_lag"][e.name] = e.slot_lag
+            out["healthy"][e.name] = float(self.healthy(e))
+            out["active"][e.name] = float(e is self.active)
+            out["failures"][e.name] = e.failures
+            out["errors"][e.name] = e.errors
+        return out
@@ -0,0 +1,247 @@
+import itertools
+import math
+import random
+from typing import Any, Dict, List, Optional
+
+from execution.clock import Clock, get_clock
+
+from .base import ConnectorBase
+
+
+class OrderRejected(Exception):
+    """Raised by the simulator when it rejects an order."""
+
+
+class LatencyModel:
+    """Random one-way network latency in seconds.
+
+    ``kind`` is ``constant``, ``uniform`` (``mean_ms`` +/- ``jitter_ms``),
+    ``normal`` (std ``jitter_ms``, clipped at zero) or ``lognormal``
+    (median ``mean_ms``, shape ``sigma``).
+    """
+
+    def __init__(
+        self,
+        kind: str = "constant",
+        mean_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        sigma: float = 0.5,
+    ) -> None:
+        if kind not in ("constant", "uniform", "normal", "lognormal"):
+            raise ValueError(f"unknown latency model {kind!r}")
+        self.kind = kind
+        self.mean_ms = mean_ms
+        self.jitter_ms = jitter_ms
+        self.sigma = sigma
+
+    @classmethod
+    def from_config(cls, cfg: Optional[Dict[str, Any]]) -> "LatencyModel":
+        return cls(**(cfg or {}))
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "constant":
+            ms = self.mean_ms
+        elif self.kind == "uniform":
+            ms = rng.uniform(self.mean_ms - self.jitter_ms, self.mean_ms + self.jitter_ms)
+        elif self.kind == "normal":
+            ms = rng.gauss(self.mean_ms, self.jitter_ms)
+        else:
+            ms = self.mean_ms * math.exp(rng.gauss(0.0, self.sigma)) if self.mean_ms else 0.0
+        return max(0.0, ms) / 1000
+
+
+class SimulatedVenue(ConnectorBase):
+    """Local exchange simulator implementing ``ConnectorBase``.
+
+    The book comes from ``source`` (for example a ``ReplayConnector``) or
+    from a synthetic random walk that starts every symbol at ``mid``. Either
+    way a symbol's book moves at most once per ``update_interval_sec`` of
+    ``clock`` time, so polling positions while waiting for a fill does not
+    use up source snapshots. Orders are matched against the opposite side up
+    to their limit price and consume the visible size. Depending on
+    configuration they are rejected, partially filled or left resting;
+    resting orders are matched again whenever the book moves. Every call
+    waits a latency sampled from ``latency`` on ``clock``. Positions use the
+    Drift layout (``base_asset_amount``/``quote_asset_amount``).
+
+    Config keys: ``mid``, ``spread_bps``, ``levels``, ``level_size``,
+    ``tick_bps``, ``volatility_bps``, ``update_interval_sec``,
+    ``funding_rate``, ``latency``, ``reject_prob``, ``partial_fill_prob``,
+    ``partial_fill_ratio`` and ``seed``.
+    """
+
+    def __init__(
+        self,
+        config: Optional[Dict[str, Any]] = None,
+        source: Optional[ConnectorBase] = None,
+        clock: Optional[Clock] = None,
+    ) -> None:
+        super().__init__(config or {})
+        cfg = self.config
+        self.source = source
+        self.clock = clock or get_clock()
+        self.rng = random.Random(cfg.get("seed"))
+        self.latency = LatencyModel.from_config(cfg.get("latency"))
+        self.reject_prob = float(cfg.get("reject_prob", 0.0))
+        self.partial_fill_prob = float(cfg.get("partial_fill_prob", 0.0))
+        self.partial_fill_ratio = tuple(cfg.get("partial_fill_ratio", (0.2, 0.8)))
+
+        self.mid = float(cfg.get("mid", 100.0))
+        self.spread_bps = float(cfg.get("spread_bps", 2.0))
+        self.levels = int(cfg.get("levels", 5))
+        self.level_size = float(cfg.get("level_size", 10.0))
+        self.tick_bps = float(cfg.get("tick_bps", 1.0))
+        self.volatility_bps = float(cfg.get("volatility_bps", 1.0))
+        self.update_interval_sec = float(cfg.get("update_interval_sec", 1.0))
+        self.funding_rate = cfg.get("funding_rate", 0.0)
+
+        self._books: Dict[str, Dict[str, List[Dict[str, float]]]] = {}
+        self._mids: Dict[str, float] = {}
+        self._last_update: Dict[str, float] = {}
+        self._positions: Dict[str, Dict[str, float]] = {}
+        self._resting: Dict[int, Dict[str, Any]] = {}
+        self._order_ids = itertools.count(1)
+        self.stats = {"orders": 0, "rejects": 0, "partial_fills": 0, "fills": 0, "cancels": 0}
+
+    async def async_init(self) -> None:
+        return None
+
+    async def _network(self) -> None:
+        delay = self.latency.sample(self.rng)
+        if delay:
+            await self.clock.sleep(delay)
+
+    def _synthetic_book(self, mid: float) -> Dict[str, List[Dict[str, float]]]:
+        half = mid * self.spread_bps / 20000
+        tick = mid * self.tick_bps / 10000
+        return {
+            "bids": [
+                {"price": mid - half - i * tick, "size": self.level_size}
+                for i in range(self.levels)
+            ],
+            "asks": [
+                {"price": mid + half + i * tick, "size": self.level_size}
+                for i in range(self.levels)
+            ],
+        }
+
+    async def _refresh(self, symbol: str) -> Dict[str, List[Dict[str, float]]]:
+        """Move the book forward and match resting orders against it."""
+        now = self.clock.time()
+        last = self._last_update.get(symbol)
+        steps = 1 if last is None else int((now - last) / self.update_interval_sec)
+        if steps <= 0 and symbol in self._books:
+            return self._books[symbol]
+        self._last_update[symbol] = now
+        if self.source is not None:
+            book = await self.source.fetch_book(symbol)
+            # connectors report unknown depth as size 0: treat it as unlimited
+            book = {
+                side: [
+                    {"price": float(lvl["price"]), "size": float(lvl.get("size") or math.inf)}
+                    for lvl in book.get(side) or []
+                ]
+                for side in ("bids", "asks")
+            }
+        else:
+            mid = self._mids.get(symbol, self.mid)
+            if last is not None:
+                for _ in range(steps):
+                    mid *= 1 + self.rng.gauss(0.0, self.volatility_bps / 10000)
+            self._mids[symbol] = mid
+            book = self._synthetic_book(mid)
+        self._books[symbol] = book
+        for oid, order in list(self._resting.items()):
+            if order["symbol"] == symbol:
+                self._match(order)
+                if order["remaining"] <= 1e-12:
+                    del self._resting[oid]
+        return book
+
+    def _match(self, order: Dict[str, Any], max_qty: Optional[float] = None) -> float:
+        """Fill ``order`` against the current book; return the filled quantity."""
+        book = self._books[order["symbol"]]
+        buy = order["side"] == "buy"
+        levels = book["asks" if buy else "bids"]
+        want = order["remaining"] if max_qty is None else min(max_qty, order["remaining"])
+        filled = cost = 0.0
+        for lvl in levels:
+            if want - filled <= 1e-12:
+                break
+            if (buy and lvl["price"] > order["price"]) or (not buy and lvl["price"] < order["price"]):
+                break
+            take = min(want - filled, lvl["size"])
+            lvl["size"] -= take
+            filled += take
+            cost += take * lvl["price"]
+        book["asks" if buy else "bids"] = [lvl for lvl in levels if lvl["size"] > 1e-12]
+        if filled > 0:
+            sign = 1 if buy else -1
+            pos = self._positions.setdefault(
+                order["symbol"], {"base_asset_amount": 0.0, "quote_asset_amount": 0.0}
+            )
+            pos["base_asset_amount"] += sign * filled
+            pos["quote_asset_amount"] -= sign * cost
+            order["remaining"] -= filled
+            self.stats["fills"] += 1
+        return filled
+
+    async def fetch_book(self, symbol: str) -> Dict[str, Any]:
+        await self._network()
+        book = await self._refresh(symbol)
+        return {
+            side: [
+                {"price": lvl["price"], "size": 0 if math.isinf(lvl["size"]) else lvl["size"]}
+                for lvl in levels
+            ]
+            for side, levels in book.items()
+        }
+
+    async def fetch_funding(self, symbol: str) -> Dict[str, Any]:
+        await self._network()
+        if self.source is not None:
+            return await self.source.fetch_funding(symbol)
+        return {"funding_rate": self.funding_rate}
+
+    async def place_order(
+        self, symbol: str, side: str, amount: float, price: float
+    ) -> Any:
+        await self._network()
+        self.stats["orders"] += 1
+        if self.reject_prob and self.rng.random() < self.reject_prob:
+            self.stats["rejects"] += 1
+            raise OrderRejected(f"simulated reject of {side} {amount} {symbol} @ {price}")
+
+        oid = next(self._order_ids)
+        order = {
+            "oid": oid,
+            "symbol": symbol,
+            "side": side.lower(),
+            "price": price,
+            "remaining": amount,
+        }
+        if symbol not in self._books:
+            await self._refresh(symbol)
+        max_qty = None
+        if self.partial_fill_prob and self.rng.random() < self.partial_fill_prob:
+            max_qty = amount * self.rng.uniform(*self.partial_fill_ratio)
+            self.stats["partial_fills"] += 1
+        self._match(order, max_qty)
+        if order["remaining"] > 1e-12:
+            self._resting[oid] = order
+        return oid
+
+    async def cancel_order(self, order_id: Any) -> None:
+        await self._network()
+        if self._resting.pop(order_id, None) is not None:
+            self.stats["cancels"] += 1
+
+    async def get_position(self, symbol: str) -> Dict[str, Any]:
+        await self._network()
+        await self._refresh(symbol)
+        return dict(
+            self._positions.get(symbol, {"base_asset_amount": 0.0, "quote_asset_amount": 0.0})
+        )
+
+    def open_orders(self) -> List[Dict[str, Any]]:
+        return [dict(o) for o in self._resting.values()]
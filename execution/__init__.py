@@ -1,5 +1,7 @@
 """Execution utilities and engine."""
 
 from .engine import ExecutionEngine
+from .risk import RiskEngine
+from .scheduler import ExecutionScheduler
 
-__all__ = ["ExecutionEngine"]
+__all__ = ["ExecutionEngine", "ExecutionScheduler", "RiskEngine"]
@@ -0,0 +1,135 @@
+"""Injectable time source for the engine, scheduler and strategy loops.
+
+Live trading uses ``Clock``, which is the event loop's monotonic clock and
+``asyncio.sleep``. Simulations, replays and tests use ``VirtualClock``,
+whose time only moves when every task is waiting on it: it then jumps
+straight to the next timer. A 10 second fill timeout costs no wall time.
+
+Components take an optional ``clock`` argument and fall back to the process
+default from ``get_clock()``, which ``set_clock()`` replaces.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Any, Awaitable, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class Clock:
+    """Real time: the running loop's clock and ``asyncio.sleep``."""
+
+    def time(self) -> float:
+        return asyncio.get_running_loop().time()
+
+    def wall_time(self) -> float:
+        """Epoch seconds, for calendar boundaries such as the UTC day."""
+        return time.time()
+
+    async def sleep(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+
+    async def wait_for(self, aw: Awaitable[T], timeout: Optional[float]) -> T:
+        return await asyncio.wait_for(aw, timeout)
+
+
+class VirtualClock(Clock):
+    """Simulated time that advances to the next timer once the loop is idle.
+
+    ``sleep`` registers a timer instead of waiting. A driver task lets every
+    runnable callback run first, then moves ``time()`` to the earliest
+    deadline and wakes its sleepers. Code waiting on real I/O or real
+    ``asyncio`` timers does not hold virtual time back.
+    """
+
+    # yields per step on loops that do not expose their ready queue
+    _FALLBACK_YIELDS = 50
+
+    def __init__(self, start: float = 0.0) -> None:
+        self._now = start
+        self._timers: List[Tuple[float, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._driver: Optional[asyncio.Task] = None
+
+    def time(self) -> float:
+        return self._now
+
+    def wall_time(self) -> float:
+        # virtual time doubles as epoch seconds; ``start`` sets the date
+        return self._now
+
+    async def sleep(self, delay: float) -> None:
+        loop = asyncio.get_running_loop()
+        if delay <= 0:
+            await asyncio.sleep(0)
+            return
+        fut = loop.create_future()
+        heapq.heappush(self._timers, (self._now + delay, next(self._seq), fut))
+        if self._driver is None or self._driver.done():
+            self._driver = loop.create_task(self._drive())
+        await fut
+
+    async def wait_for(self, aw: Awaitable[T], timeout: Optional[float]) -> T:
+        if timeout is None:
+            return await aw
+        task = asyncio.ensure_future(aw)
+        timer = asyncio.ensure_future(self.sleep(timeout))
+        try:
+            await asyncio.wait({task, timer}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            timer.cancel()
+            timed_out = not task.done()
+            if timed_out:
+                task.cancel()
+        if timed_out:
+            # a cancelled coroutine only stops once it has run again
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            raise asyncio.TimeoutError
+        return task.result()
+
+    async def _settle(self) -> None:
+        """Yield until no other callback is ready to run."""
+        ready: Any = getattr(asyncio.get_running_loop(), "_ready", None)
+        if ready is None:
+            for _ in range(self._FALLBACK_YIELDS):
+                await asyncio.sleep(0)
+            return
+        await asyncio.sleep(0)
+        while ready:
+            await asyncio.sleep(0)
+
+    async def _drive(self) -> None:
+        while self._timers:
+            await self._settle()
+            # drop sleepers that were cancelled meanwhile
+            while self._timers and self._timers[0][2].done():
+                heapq.heappop(self._timers)
+            if not self._timers:
+                break
+            self._now = max(self._now, self._timers[0][0])
+            while self._timers and self._timers[0][0] <= self._now:
+                _, _, fut = heapq.heappop(self._timers)
+                if not fut.done():
+                    fut.set_result(None)
+
+
+_default: Clock = Clock()
+
+
+def get_clock() -> Clock:
+    """Return the process-wide default clock."""
+    return _default
+
+
+def set_clock(clock: Clock) -> Clock:
+    """Install ``clock`` as the default and return the previous one."""
+    global _default
+    previous, _default = _default, clock
+    return previous
@@ -2,25 +2,79 @@ from __future__ import annotations
 
 import logging
 import asyncio
-from typing import Any, Dict, Awaitable, Callable, Optional
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Awaitable, Callable, List, Optional, Tuple
 
 from connectors import ConnectorBase
+from monitoring import tracing
+from monitoring.metrics import REGISTRY
 from storage.logger import log_event, log_trade
 
+from .clock import Clock, get_clock
+from .risk import RiskEngine
+
+_PHASES = REGISTRY.histogram(
+    "execution_phase_seconds", "Duration of pair trade execution phases", ("phase",)
+)
+_PHASE = {
+    phase: _PHASES.labels(phase)
+    for phase in ("risk_check", "positions", "submit", "fill_wait", "confirm", "log", "unwind")
+}
+_EXECUTIONS = REGISTRY.histogram(
+    "execution_seconds", "Duration of whole pair trades", ("outcome",)
+)
+
+# config keys a strategy may override for its own trades on a shared engine
+EXECUTION_SETTINGS = ("max_slippage_bps", "timeouts", "safe_mode", "execution")
+_settings: contextvars.ContextVar[Optional[Dict[str, Any]]] = contextvars.ContextVar(
+    "execution_settings", default=None
+)
+
 
 class ExecutionEngine:
     """Coordinate order execution across two exchanges."""
 
-    def __init__(self, connector_a: ConnectorBase, connector_b: ConnectorBase, config: Dict[str, Any]):
+    def __init__(
+        self,
+        connector_a: ConnectorBase,
+        connector_b: ConnectorBase,
+        config: Dict[str, Any],
+        clock: Optional[Clock] = None,
+    ):
         self.connector_a = connector_a
         self.connector_b = connector_b
         self.config = config
+        self.clock = clock or get_clock()
         self.timeouts = config.get("timeouts", {})
         self.safe_mode_enabled = bool(config.get("safe_mode", False))
         self.safe_mode_triggered = False
+        self.venue_a = "hyperliquid"
+        self.venue_b = "drift"
+        self.risk = RiskEngine(config, clock=self.clock)
 
         self.logger = logging.getLogger(self.__class__.__name__)
 
+    @staticmethod
+    @contextmanager
+    def _using(settings: Optional[Dict[str, Any]]):
+        if settings is None:
+            yield
+            return
+        token = _settings.set(settings)
+        try:
+            yield
+        finally:
+            _settings.reset(token)
+
+    def _setting(self, key: str, default: Any) -> Any:
+        """``key`` from the settings of the trade in progress, else ``default``."""
+        settings = _settings.get()
+        if settings is not None and key in settings:
+            return settings[key]
+        return default
+
     async def _wait_fill(
         self,
         fetch_position: Callable[[str], Awaitable[Dict[str, Any]]],
@@ -30,26 +84,72 @@ class ExecutionEngine:
         initial_pos: Dict[str, Any],
     ) -> bool:
         """Wait until position reflects the filled order or timeout occurs."""
-        timeout = self.timeouts.get("order_submit_sec", 10)
-        loop_time = asyncio.get_running_loop().time
-        end_time = loop_time() + timeout
-        while loop_time() < end_time:
+        timeout = (self._setting("timeouts", self.timeouts) or {}).get("order_submit_sec", 10)
+        end_time = self.clock.time() + timeout
+        while self.clock.time() < end_time:
             try:
                 pos = await fetch_position(symbol)
             except Exception as exc:  # pragma: no cover - depends on sdk
                 self.logger.error("Failed to fetch position: %s", exc)
                 return False
 
-            base_amt = pos.get("base_asset_amount", 0)
-            init_base = initial_pos.get("base_asset_amount", 0)
-            diff = base_amt - init_base
+            diff = self._position_size(pos) - self._position_size(initial_pos)
             if side.lower() == "buy" and diff >= amount:
                 return True
             if side.lower() == "sell" and diff <= -amount:
                 return True
-            await asyncio.sleep(1)
+            await self.clock.sleep(1)
         return False
 
+    @staticmethod
+    def _position_size(pos: Dict[str, Any]) -> float:
+        """Signed position size for Drift and Hyperliquid style structures."""
+        if "base_asset_amount" in pos:
+            return float(pos.get("base_asset_amount") or 0)
+        return float((pos.get("position") or {}).get("szi", 0) or 0)
+
+    @staticmethod
+    def _entry_price(pos: Dict[str, Any]) -> Optional[float]:
+        """Average entry of a Drift or Hyperliquid style position, if known."""
+        try:
+            if "base_asset_amount" in pos:
+                base = float(pos.get("base_asset_amount") or 0)
+                quote = float(pos.get("quote_asset_amount") or 0)
+                return abs(quote / base) if base and quote else None
+            entry = (pos.get("position") or {}).get("entryPx")
+            return float(entry) if entry else None
+        except (TypeError, ValueError):
+            return None
+
+    async def seed_risk(self, symbol_a: str, symbol_b: str) -> None:
+        """Load the positions already open on both venues into the risk engine.
+
+        Positions are marked at their entry price, or at the book mid when
+        the venue does not report one. A venue that cannot be read is logged
+        and left at zero.
+        """
+        for venue, connector, symbol in (
+            (self.venue_a, self.connector_a, symbol_a),
+            (self.venue_b, self.connector_b, symbol_b),
+        ):
+            try:
+                pos = await connector.get_position(symbol)
+                size = self._position_size(pos)
+                if abs(size) <= 1e-12:
+                    continue
+                price = self._entry_price(pos)
+                if price is None:
+                    book = await connector.fetch_book(symbol)
+                    bid = self._sweep_price(book, "sell", 0.0, 0.0)
+                    ask = self._sweep_price(book, "buy", 0.0, 0.0)
+                    price = (bid + ask) / 2 if bid and ask else bid or ask or 0.0
+            except Exception as exc:
+                self.logger.warning("Could not read %s position on %s: %s", symbol, venue, exc)
+                log_event(f"Risk seed skipped {venue}:{symbol}: {exc}")
+                continue
+            self.risk.seed_position(venue, symbol, size, price)
+            self.logger.info("Risk seeded %s:%s at %s @ %s", venue, symbol, size, price)
+
     async def _safe_cancel(self, connector: ConnectorBase, order_id: Any) -> None:
         """Cancel order and ignore errors."""
         try:
@@ -58,6 +158,75 @@ class ExecutionEngine:
             self.logger.warning("Failed to cancel order %s: %s", order_id, exc)
             log_event(f"Failed to cancel order {order_id}: {exc}")
 
+    async def _submit_orders(
+        self, legs: List[Tuple[ConnectorBase, Dict[str, Any]]]
+    ) -> Tuple[List[Any], List[Exception]]:
+        """Submit orders, batching those that go to the same venue.
+
+        Orders are grouped per connector; a group with more than one order is
+        sent through ``place_orders`` so it costs a single round-trip. Groups
+        for different venues are submitted concurrently. Returns the order
+        ids aligned with ``legs`` (``None`` where submission failed) and the
+        list of errors raised.
+        """
+        groups: Dict[int, List[int]] = {}
+        for i, (connector, _) in enumerate(legs):
+            groups.setdefault(id(connector), []).append(i)
+
+        async def _submit(indexes: List[int]) -> List[Any]:
+            connector = legs[indexes[0]][0]
+            orders = [legs[i][1] for i in indexes]
+            venue = self._venue(connector)
+            with tracing.span("submit", venue=venue, orders=len(orders)) as span:
+                if len(orders) == 1:
+                    o = orders[0]
+                    ids = [
+                        await connector.place_order(
+                            o["symbol"], o["side"], o["amount"], o["price"]
+                        )
+                    ]
+                else:
+                    ids = await connector.place_orders(orders)
+                span.event("ack", venue=venue, order_ids=[str(i) for i in ids])
+                return ids
+
+        results = await asyncio.gather(
+            *(_submit(idx) for idx in groups.values()), return_exceptions=True
+        )
+        order_ids: List[Any] = [None] * len(legs)
+        errors: List[Exception] = []
+        for indexes, res in zip(groups.values(), results):
+            if isinstance(res, Exception):
+                errors.append(res)
+                continue
+            for i, oid in zip(indexes, res):
+                order_ids[i] = oid
+        return order_ids, errors
+
+    def _venue(self, connector: ConnectorBase) -> str:
+        if connector is self.connector_a:
+            return self.venue_a
+        if connector is self.connector_b:
+            return self.venue_b
+        return type(connector).__name__
+
+    async def _traced_wait_fill(
+        self,
+        venue: str,
+        connector: ConnectorBase,
+        symbol: str,
+        side: str,
+        amount: float,
+        initial_pos: Dict[str, Any],
+    ) -> bool:
+        with tracing.span("fill_wait", venue=venue, symbol=symbol) as span:
+            filled = await self._wait_fill(
+                connector.get_position, symbol, side, amount, initial_pos
+            )
+            if filled:
+                span.event("fill", venue=venue)
+            return filled
+
     def _calc_fill_price(
         self,
         before: Dict[str, Any],
@@ -101,7 +270,9 @@ class ExecutionEngine:
         if executed is None or planned == 0:
             return
         slip = abs((executed - planned) / planned * 10000)
-        max_slip = float(self.config.get("max_slippage_bps", 0))
+        max_slip = float(
+            self._setting("max_slippage_bps", self.config.get("max_slippage_bps", 0))
+        )
         if slip > max_slip:
             msg = (
                 "ALERT: Slippage exceeded threshold!\n"
@@ -122,82 +293,460 @@ class ExecutionEngine:
         amount: float,
         price_a: float,
         price_b: float,
+        log_extra: Optional[Dict[str, Any]] = None,
+        settings: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """Place two orders and ensure they both fill or rollback.
+
+        ``settings`` overrides the ``EXECUTION_SETTINGS`` of the engine's
+        config for this trade only.
+        """
+        with self._using(settings), tracing.span(
+            "execute_pair_trade", symbol_a=symbol_a, symbol_b=symbol_b, amount=amount
+        ) as span:
+            ok = await self._execute_pair_trade(
+                symbol_a, symbol_b, side_a, side_b, amount, price_a, price_b, log_extra
+            )
+            span.set(ok=ok)
+            return ok
+
+    async def _execute_pair_trade(
+        self,
+        symbol_a: str,
+        symbol_b: str,
+        side_a: str,
+        side_b: str,
+        amount: float,
+        price_a: float,
+        price_b: float,
+        log_extra: Optional[Dict[str, Any]],
     ) -> bool:
-        """Place two orders and ensure they both fill or rollback."""
-        if self.safe_mode_enabled and self.safe_mode_triggered:
+        if self._setting("safe_mode", self.safe_mode_enabled) and self.safe_mode_triggered:
             self.logger.warning("Safe mode active - refusing to place new orders")
             log_event("Safe mode active - refusing to place new orders")
             return False
 
+        started = time.perf_counter()
+        with _PHASE["risk_check"].time():
+            breached = self.risk.check(
+                (
+                    (self.venue_a, symbol_a, side_a, amount, price_a),
+                    (self.venue_b, symbol_b, side_b, amount, price_b),
+                )
+            )
+        if breached:
+            self.logger.warning("Risk check rejected trade: %s", breached)
+            log_event(f"Risk check rejected trade: {breached}")
+            _EXECUTIONS.labels("rejected").observe(time.perf_counter() - started)
+            return False
 
-        initial_a = await self.connector_a.get_position(symbol_a)
-        initial_b = await self.connector_b.get_position(symbol_b)
+        with _PHASE["positions"].time():
+            initial_a = await self.connector_a.get_position(symbol_a)
+            initial_b = await self.connector_b.get_position(symbol_b)
 
         order_id_a = None
         order_id_b = None
+        filled_a = filled_b = False
+        opened = 0
         try:
-            order_id_a = await self.connector_a.place_order(
-                symbol_a,
-                side_a,
-                amount,
-                price_a,
-            )
-            order_id_b = await self.connector_b.place_order(
-                symbol_b,
-                side_b,
-                amount,
-                price_b,
-            )
+            with _PHASE["submit"].time():
+                (order_id_a, order_id_b), errors = await self._submit_orders(
+                    [
+                        (
+                            self.connector_a,
+                            {"symbol": symbol_a, "side": side_a, "amount": amount, "price": price_a},
+                        ),
+                        (
+                            self.connector_b,
+                            {"symbol": symbol_b, "side": side_b, "amount": amount, "price": price_b},
+                        ),
+                    ]
+                )
+            opened = sum(oid is not None for oid in (order_id_a, order_id_b))
+            self.risk.on_orders_opened(opened)
+            if errors:
+                raise errors[0]
 
-            filled_a = await self._wait_fill(
-                self.connector_a.get_position,
-                symbol_a,
-                side_a,
-                amount,
-                initial_a,
-            )
-            filled_b = await self._wait_fill(
-                self.connector_b.get_position,
-                symbol_b,
-                side_b,
-                amount,
-                initial_b,
-            )
+            with _PHASE["fill_wait"].time():
+                filled_a = await self._traced_wait_fill(
+                    self.venue_a, self.connector_a, symbol_a, side_a, amount, initial_a
+                )
+                filled_b = await self._traced_wait_fill(
+                    self.venue_b, self.connector_b, symbol_b, side_b, amount, initial_b
+                )
 
             if not (filled_a and filled_b):
                 raise TimeoutError("Fill timeout")
-
-            final_a = await self.connector_a.get_position(symbol_a)
-            final_b = await self.connector_b.get_position(symbol_b)
-
-            exec_price_a = self._calc_fill_price(initial_a, final_a, side_a, amount)
-            exec_price_b = self._calc_fill_price(initial_b, final_b, side_b, amount)
-
+        except Exception as exc:
+            self.logger.error("Execution failed: %s", exc)
+            log_event(f"Execution failed: {exc}")
+            with _PHASE["unwind"].time(), tracing.span("unwind", error=str(exc)):
+                (ok_a, qty_a, pnl_a), (ok_b, qty_b, pnl_b) = await asyncio.gather(
+                    self._unwind_leg(
+                        self.connector_a, self.venue_a, symbol_a, side_a, amount,
+                        price_a, order_id_a, initial_a, filled_a,
+                    ),
+                    self._unwind_leg(
+                        self.connector_b, self.venue_b, symbol_b, side_b, amount,
+                        price_b, order_id_b, initial_b, filled_b,
+                    ),
+                )
+            unwound = ok_a and ok_b
             log_trade(
                 {
+                    "event": "unwind",
                     "symbol_a": symbol_a,
                     "symbol_b": symbol_b,
                     "side_a": side_a,
                     "side_b": side_b,
                     "amount": amount,
-                    "price_a": price_a,
-                    "price_b": price_b,
-                    "exec_price_a": exec_price_a,
-                    "exec_price_b": exec_price_b,
+                    "flattened_a": qty_a,
+                    "flattened_b": qty_b,
+                    "unwound": unwound,
+                    "pnl": pnl_a + pnl_b,
+                    "error": str(exc),
+                    **tracing.trace_fields(),
+                    **(log_extra or {}),
                 }
             )
+            if unwound:
+                log_event("Unwind completed - no residual exposure")
+            else:
+                self.logger.error("Unwind failed - triggering safe mode")
+                log_event("Unwind failed - triggering safe mode")
+                self.safe_mode_triggered = True
+            _EXECUTIONS.labels("unwound" if unwound else "unwind_failed").observe(
+                time.perf_counter() - started
+            )
+            return False
+        finally:
+            self.risk.on_orders_closed(opened)
+
+        # Both legs are filled and hedged. Nothing below may unwind them, so
+        # a failure here is logged and the trade still counts as done.
+        exec_price_a = exec_price_b = None
+        try:
+            with _PHASE["confirm"].time():
+                final_a = await self.connector_a.get_position(symbol_a)
+                final_b = await self.connector_b.get_position(symbol_b)
+            exec_price_a = self._calc_fill_price(initial_a, final_a, side_a, amount)
+            exec_price_b = self._calc_fill_price(initial_b, final_b, side_b, amount)
+        except Exception as exc:
+            self.logger.error("Could not read fill prices: %s", exc)
+        # non-zero when the trade reduces positions opened earlier
+        pnl = self.risk.on_fill(
+            self.venue_a, symbol_a, side_a, amount, exec_price_a or price_a
+        ) + self.risk.on_fill(self.venue_b, symbol_b, side_b, amount, exec_price_b or price_b)
+
+        log_started = time.perf_counter()
+        try:
+            with tracing.span("log_trade"):
+                log_trade(
+                    {
+                        "symbol_a": symbol_a,
+                        "symbol_b": symbol_b,
+                        "side_a": side_a,
+                        "side_b": side_b,
+                        "amount": amount,
+                        "price_a": price_a,
+                        "price_b": price_b,
+                        "exec_price_a": exec_price_a,
+                        "exec_price_b": exec_price_b,
+                        "pnl": pnl,
+                        **tracing.trace_fields(),
+                        **(log_extra or {}),
+                    }
+                )
 
-            self._check_slippage("hyperliquid", price_a, exec_price_a)
-            self._check_slippage("drift", price_b, exec_price_b)
+            self._check_slippage(self.venue_a, price_a, exec_price_a)
+            self._check_slippage(self.venue_b, price_b, exec_price_b)
 
             log_event("Trade executed successfully")
-            return True
-        except Exception as exc:  # pragma: no cover - depends on sdk
-            self.logger.error("Execution failed: %s", exc)
-            log_event(f"Execution failed: {exc}")
-            if order_id_a is not None:
-                await self._safe_cancel(self.connector_a, order_id_a)
-            if order_id_b is not None:
-                await self._safe_cancel(self.connector_b, order_id_b)
-            self.safe_mode_triggered = True
+        except Exception as exc:
+            self.logger.error("Trade filled but post-trade logging failed: %s", exc)
+        _PHASE["log"].observe(time.perf_counter() - log_started)
+        _EXECUTIONS.labels("filled").observe(time.perf_counter() - started)
+        return True
+
+    async def _unwind_leg(
+        self,
+        connector: ConnectorBase,
+        venue: str,
+        symbol: str,
+        side: str,
+        amount: float,
+        price: float,
+        order_id: Any,
+        initial_pos: Dict[str, Any],
+        filled: bool,
+    ) -> Tuple[bool, float, float]:
+        """Cancel the leg's order and flatten whatever part of it filled.
+
+        The filled quantity is taken as ``amount`` when the fill was confirmed,
+        otherwise it is read from the position change after the cancel. It is
+        closed with an opposite order limited to ``unwind_slippage_bps`` from
+        the best price on a fresh book, or from the planned price when the
+        book is empty. A closing order that does not fill in time is cancelled
+        and the part it did fill is accounted for. Returns whether the leg is
+        flat, the quantity that was flattened and the PnL the flattening
+        realized.
+        """
+        if order_id is not None:
+            await self._safe_cancel(connector, order_id)
+        try:
+            current = await connector.get_position(symbol)
+            if filled:
+                qty = amount
+            else:
+                delta = self._position_size(current) - self._position_size(initial_pos)
+                qty = delta if side.lower() == "buy" else -delta
+                qty = min(max(qty, 0.0), amount)
+            if qty <= 1e-12:
+                return True, 0.0, 0.0
+            self.risk.on_fill(venue, symbol, side, qty, price)
+
+            bps = float(
+                (self._setting("execution", self.config.get("execution")) or {}).get(
+                    "unwind_slippage_bps", 50
+                )
+            )
+            close_side = "sell" if side.lower() == "buy" else "buy"
+            try:
+                book = await connector.fetch_book(symbol)
+            except Exception as exc:
+                self.logger.warning("Book for unwind of %s unavailable: %s", symbol, exc)
+                book = {}
+            ref = self._sweep_price(book, close_side, 0.0, 0.0) or price
+            if close_side == "sell":
+                limit = ref * (1 - bps / 10000)
+            else:
+                limit = ref * (1 + bps / 10000)
+            close_id = await connector.place_order(symbol, close_side, qty, limit)
+            flat = await self._wait_fill(
+                connector.get_position, symbol, close_side, qty, current
+            )
+            if not flat and close_id is not None:
+                await self._safe_cancel(connector, close_id)
+
+            after = await connector.get_position(symbol)
+            if flat:
+                closed = qty
+            else:
+                delta = self._position_size(after) - self._position_size(current)
+                closed = delta if close_side == "buy" else -delta
+                closed = min(max(closed, 0.0), qty)
+            pnl = 0.0
+            if closed > 1e-12:
+                close_px = self._calc_fill_price(current, after, close_side, closed) or limit
+                # realizes the cost of the unwind against the entry
+                pnl = self.risk.on_fill(venue, symbol, close_side, closed, close_px)
+            if not flat:
+                self.logger.error(
+                    "Failed to flatten %s %s on %s, closed %s", qty, symbol, side, closed
+                )
+                return False, closed, pnl
+            return True, qty, pnl
+        except Exception as exc:
+            self.logger.error("Unwind of %s failed: %s", symbol, exc)
+            log_event(f"Unwind of {symbol} failed: {exc}")
+            return False, 0.0, 0.0
+
+    @staticmethod
+    def _book_depth(book: Dict[str, Any], side: str, max_bps: float) -> float:
+        """Size available on the side ``side`` takes, within ``max_bps`` of best."""
+        levels = book.get("asks" if side.lower() == "buy" else "bids") or []
+        if not levels:
+            return 0.0
+        best = float(levels[0]["price"])
+        depth = 0.0
+        for lvl in levels:
+            price = float(lvl["price"])
+            if best and abs(price - best) / best * 10000 > max_bps:
+                break
+            depth += float(lvl.get("size", 0) or 0)
+        return depth
+
+    @staticmethod
+    def _sweep_price(
+        book: Dict[str, Any], side: str, size: float, max_bps: float
+    ) -> Optional[float]:
+        """Limit that takes ``size`` from the side ``side`` takes, within ``max_bps`` of best."""
+        levels = book.get("asks" if side.lower() == "buy" else "bids") or []
+        if not levels:
+            return None
+        best = price = float(levels[0]["price"])
+        depth = 0.0
+        for lvl in levels:
+            level_price = float(lvl["price"])
+            if best and abs(level_price - best) / best * 10000 > max_bps:
+                break
+            price = level_price
+            depth += float(lvl.get("size", 0) or 0)
+            if depth >= size:
+                break
+        return price
+
+    @staticmethod
+    def _limit_bound(parent: float, side: str, max_bps: float) -> float:
+        """Limit ``max_bps`` worse than the parent price ``parent`` for ``side``."""
+        if side.lower() == "buy":
+            return parent * (1 + max_bps / 10000)
+        return parent * (1 - max_bps / 10000)
+
+    @staticmethod
+    def _edge(side_a: str, price_a: float, price_b: float) -> float:
+        """Price edge of buying one leg and selling the other."""
+        return price_b - price_a if side_a.lower() == "buy" else price_a - price_b
+
+    async def execute_sliced_pair_trade(
+        self,
+        symbol_a: str,
+        symbol_b: str,
+        side_a: str,
+        side_b: str,
+        amount: float,
+        price_a: float,
+        price_b: float,
+        log_extra: Optional[Dict[str, Any]] = None,
+        settings: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """Execute a pair trade as a series of matched, hedged child slices.
+
+        Each slice is sized from the depth currently available on the books
+        within ``max_slippage_bps`` and is executed with ``execute_pair_trade``,
+        so both legs of a slice are filled before the next one is sent. A
+        venue that reports no sizes counts as unknown depth, and the other
+        venue's depth sizes the slice; with neither, the rest is spread evenly
+        over the slices left.
+
+        Each slice is priced from the books just fetched: the limit of a leg
+        is the furthest level within ``max_slippage_bps`` that the slice
+        reaches, but never more than ``max_slippage_bps`` past the parent
+        price. Slicing stops once the fresh best prices give up more than
+        that allowance of the parent's edge. The last slice is capped by the
+        depth as well, so when the books are too thin for the rest the trade
+        stops partially filled and ``False`` is returned. The pause between
+        slices doubles while the books have not refilled to the depth seen
+        before the previous slice and resets once they have. ``settings``
+        applies to every slice as in ``execute_pair_trade``.
+        """
+        with self._using(settings):
+            return await self._execute_sliced_pair_trade(
+                symbol_a, symbol_b, side_a, side_b, amount, price_a, price_b, log_extra
+            )
+
+    async def _execute_sliced_pair_trade(
+        self,
+        symbol_a: str,
+        symbol_b: str,
+        side_a: str,
+        side_b: str,
+        amount: float,
+        price_a: float,
+        price_b: float,
+        log_extra: Optional[Dict[str, Any]],
+    ) -> bool:
+        cfg = self._setting("execution", self.config.get("execution")) or {}
+        depth_fraction = float(cfg.get("depth_fraction", 0.5))
+        max_slices = max(1, int(cfg.get("max_slices", 10)))
+        min_slice = float(cfg.get("min_slice", 0.0))
+        base_interval = float(cfg.get("slice_interval_sec", 1.0))
+        max_interval = float(cfg.get("max_slice_interval_sec", 10.0))
+        refill_ratio = float(cfg.get("refill_ratio", 0.8))
+        max_bps = float(
+            self._setting("max_slippage_bps", self.config.get("max_slippage_bps", 0))
+        )
+
+        bound_a = self._limit_bound(price_a, side_a, max_bps)
+        bound_b = self._limit_bound(price_b, side_b, max_bps)
+        # the parent's edge less the slippage both legs may take
+        min_edge = self._edge(side_a, bound_a, bound_b)
+
+        remaining = amount
+        prev_depth: Optional[float] = None
+        interval = base_interval
+        filled = 0.0
+        for index in range(max_slices):
+            book_a, book_b = await asyncio.gather(
+                self.connector_a.fetch_book(symbol_a),
+                self.connector_b.fetch_book(symbol_b),
+            )
+            best_a = self._sweep_price(book_a, side_a, 0.0, max_bps)
+            best_b = self._sweep_price(book_b, side_b, 0.0, max_bps)
+            if best_a is not None and best_b is not None:
+                if self._edge(side_a, best_a, best_b) < min_edge - 1e-12:
+                    log_event(
+                        f"Sliced execution stopped at slice {index + 1}: spread moved "
+                        f"({best_a}/{best_b}), filled {filled} of {amount}"
+                    )
+                    return False
+
+            depth_a = self._book_depth(book_a, side_a, max_bps)
+            depth_b = self._book_depth(book_b, side_b, max_bps)
+            # a venue without sizes (Hyperliquid impact prices) is unknown depth
+            known = [d for d in (depth_a, depth_b) if d > 0]
+            depth = min(known) if known else 0.0
+
+            if prev_depth is not None and depth < prev_depth * refill_ratio:
+                interval = min(interval * 2, max_interval)
+            else:
+                interval = base_interval
+
+            slices_left = max_slices - index
+            if depth > 0 and slices_left == 1:
+                size = depth
+            elif depth > 0:
+                size = max(depth * depth_fraction, min_slice)
+            elif slices_left == 1:
+                size = remaining
+            else:
+                # venue does not publish sizes: spread evenly over the slices left
+                size = max(remaining / slices_left, min_slice)
+            size = min(size, remaining)
+            slice_price_a = self._sweep_price(book_a, side_a, size, max_bps) or price_a
+            slice_price_b = self._sweep_price(book_b, side_b, size, max_bps) or price_b
+            if side_a.lower() == "buy":
+                slice_price_a, slice_price_b = min(slice_price_a, bound_a), max(slice_price_b, bound_b)
+            else:
+                slice_price_a, slice_price_b = max(slice_price_a, bound_a), min(slice_price_b, bound_b)
+
+            ok = await self.execute_pair_trade(
+                symbol_a,
+                symbol_b,
+                side_a,
+                side_b,
+                size,
+                slice_price_a,
+                slice_price_b,
+                log_extra={
+                    **(log_extra or {}),
+                    "slice": index + 1,
+                    "slice_amount": size,
+                    "parent_amount": amount,
+                    "depth_a": depth_a,
+                    "depth_b": depth_b,
+                    "slice_interval_sec": interval,
+                },
+            )
+            if not ok:
+                log_event(
+                    f"Sliced execution stopped at slice {index + 1}: "
+                    f"filled {filled} of {amount}"
+                )
+                return False
+
+            filled += size
+            remaining -= size
+            prev_depth = depth
+            if remaining <= 1e-12:
+                break
+            await self.clock.sleep(interval)
+
+        if remaining > 1e-12:
+            log_event(
+                f"Sliced execution partial: filled {filled} of {amount} in {index + 1} slices, "
+                "books too thin for the rest"
+            )
             return False
+        log_event(f"Sliced execution completed: {filled} of {amount} in {index + 1} slices")
+        return True
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from .clock import Clock, get_clock
+
+Key = Tuple[str, str]
+
+
+class RiskEngine:
+    """Pre-trade risk gate backed by incrementally maintained aggregates.
+
+    Net delta per venue and symbol, gross notional, open order count and
+    realized PnL for the current UTC day are updated as orders are sent and
+    filled, so ``check`` only compares a handful of numbers and runs in
+    constant time. Each position is marked at its own last fill price and
+    keeps its average entry price, so fills that reduce it realize PnL. A
+    limit left unset (``None``) is not enforced.
+    """
+
+    def __init__(self, config: Dict[str, Any], clock: Optional[Clock] = None) -> None:
+        cfg = config.get("risk", {}) or {}
+        self.max_net_delta = self._limit(cfg.get("max_net_delta"))
+        self.max_gross_notional = self._limit(cfg.get("max_gross_notional"))
+        self.max_open_orders = self._limit(cfg.get("max_open_orders"))
+        self.max_daily_loss_usd = self._limit(cfg.get("max_daily_loss_usd"))
+        self.clock = clock or get_clock()
+
+        self.net_delta: Dict[Key, float] = {}
+        self._entry: Dict[Key, float] = {}
+        self._notional: Dict[Key, float] = {}
+        self.gross_notional = 0.0
+        self.open_orders = 0
+        self.daily_pnl = 0.0
+        self._day = self._today()
+
+    @staticmethod
+    def _limit(value: Any) -> Optional[float]:
+        return None if value is None else float(value)
+
+    def _today(self) -> int:
+        return int(self.clock.wall_time() // 86400)
+
+    @staticmethod
+    def _signed(side: str, qty: float) -> float:
+        return qty if side.lower() == "buy" else -qty
+
+    def _roll_day(self) -> None:
+        today = self._today()
+        if today != self._day:
+            self._day = today
+            self.daily_pnl = 0.0
+
+    def check(self, legs: Sequence[Tuple[str, str, str, float, float]]) -> Optional[str]:
+        """Return the name of the first limit ``legs`` would breach, if any.
+
+        Each leg is ``(venue, symbol, side, amount, price)``.
+        """
+        if self.max_daily_loss_usd is not None:
+            self._roll_day()
+            if self.daily_pnl <= -self.max_daily_loss_usd:
+                return f"max_daily_loss_usd ({self.daily_pnl:.2f} <= -{self.max_daily_loss_usd})"
+
+        if self.max_open_orders is not None and self.open_orders + len(legs) > self.max_open_orders:
+            return f"max_open_orders ({self.open_orders} + {len(legs)} > {self.max_open_orders:g})"
+
+        gross = self.gross_notional
+        for venue, symbol, side, amount, price in legs:
+            key = (venue, symbol)
+            current = self.net_delta.get(key, 0.0)
+            new = current + self._signed(side, amount)
+            if (
+                self.max_net_delta is not None
+                and abs(new) > self.max_net_delta
+                and abs(new) > abs(current)
+            ):
+                return f"max_net_delta[{venue}:{symbol}] ({new:g} > {self.max_net_delta:g})"
+            gross += abs(new) * price - self._notional.get(key, 0.0)
+
+        if self.max_gross_notional is not None and gross > self.max_gross_notional:
+            return f"max_gross_notional ({gross:.2f} > {self.max_gross_notional:g})"
+        return None
+
+    def seed_position(self, venue: str, symbol: str, qty: float, price: float) -> None:
+        """Set the position held before startup, ``qty`` signed, entered at ``price``.
+
+        Replaces whatever was known about the position and realizes nothing.
+        """
+        key = (venue, symbol)
+        qty = 0.0 if abs(qty) <= 1e-12 else qty
+        self.net_delta[key] = qty
+        if qty:
+            self._entry[key] = price
+        else:
+            self._entry.pop(key, None)
+        notional = abs(qty) * price
+        self.gross_notional += notional - self._notional.get(key, 0.0)
+        self._notional[key] = notional
+
+    def on_orders_opened(self, count: int) -> None:
+        self.open_orders += count
+
+    def on_orders_closed(self, count: int) -> None:
+        self.open_orders = max(0, self.open_orders - count)
+
+    def on_fill(self, venue: str, symbol: str, side: str, qty: float, price: float) -> float:
+        """Apply a fill to the position and the gross notional.
+
+        Returns the PnL the fill realized against the average entry price,
+        which is also added to ``daily_pnl``.
+        """
+        key = (venue, symbol)
+        signed = self._signed(side, qty)
+        current = self.net_delta.get(key, 0.0)
+        entry = self._entry.get(key, price)
+
+        realized = 0.0
+        if current and (current > 0) != (signed > 0):
+            closed = min(abs(signed), abs(current))
+            realized = (price - entry) * closed * (1 if current > 0 else -1)
+
+        new = current + signed
+        if abs(new) <= 1e-12:
+            new = 0.0
+            self._entry.pop(key, None)
+        elif not current or (current > 0) != (new > 0):
+            # opened, or flipped through flat
+            self._entry[key] = price
+        elif abs(new) > abs(current):
+            self._entry[key] = (entry * abs(current) + price * abs(signed)) / abs(new)
+        self.net_delta[key] = new
+
+        notional = abs(new) * price
+        self.gross_notional += notional - self._notional.get(key, 0.0)
+        self._notional[key] = notional
+        if realized:
+            self.on_realized_pnl(realized)
+        return realized
+
+    def on_realized_pnl(self, pnl: float) -> None:
+        self._roll_day()
+        self.daily_pnl += pnl
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the current aggregates."""
+        return {
+            "net_delta": dict(self.net_delta),
+            "gross_notional": self.gross_notional,
+            "open_orders": self.open_orders,
+            "daily_pnl": self.daily_pnl,
+        }
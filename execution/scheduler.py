@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Sequence, Set, Tuple
+
+from monitoring import tracing
+from storage.logger import log_event
+
+from .clock import Clock, get_clock
+from .engine import ExecutionEngine
+
+
+@dataclass
+class _Job:
+    """Pair trade waiting for its turn on the account."""
+
+    fn: Callable[[], Awaitable[bool]]
+    legs: Tuple[Tuple[str, str], ...]
+    priority: float
+    enqueued_at: float
+    started: asyncio.Future
+    done: asyncio.Future
+    expired: bool = field(default=False)
+    span: Any = field(default=None)
+
+    @property
+    def venues(self) -> Set[str]:
+        return {venue for venue, _ in self.legs}
+
+
+class ExecutionScheduler:
+    """Account-level scheduler shared by every strategy trading one account.
+
+    All strategies submit their pair trades here instead of calling their own
+    engine. Jobs are started highest expected profit first, a job never runs
+    while another one is trading the same venue/symbol, and at most
+    ``max_concurrent_per_venue`` jobs touch a venue at the same time. Jobs
+    that cannot start within ``max_wait_sec`` expire, since the opportunity
+    they were priced on is stale by then.
+    """
+
+    def __init__(
+        self,
+        engine: ExecutionEngine,
+        config: Dict[str, Any],
+        clock: Optional[Clock] = None,
+    ) -> None:
+        self.engine = engine
+        self.clock = clock or getattr(engine, "clock", None) or get_clock()
+        cfg = config.get("scheduler", {}) or {}
+        self.max_concurrent_per_venue = max(1, int(cfg.get("max_concurrent_per_venue", 1)))
+        self.max_wait_sec = float(cfg.get("max_wait_sec", 2.0))
+
+        self._queue: List[Tuple[float, int, _Job]] = []
+        self._seq = itertools.count()
+        self._busy: Set[Tuple[str, str]] = set()
+        self._venue_load: Dict[str, int] = {}
+        self._waits: Deque[float] = deque(maxlen=int(cfg.get("wait_samples", 1000)))
+        self._tasks: Set[asyncio.Task] = set()
+        self._closing = False
+
+        self.in_flight = 0
+        self.submitted = 0
+        self.completed = 0
+        self.expired = 0
+
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    async def submit(
+        self,
+        fn: Callable[[], Awaitable[bool]],
+        legs: Sequence[Tuple[str, str]],
+        priority: float = 0.0,
+    ) -> bool:
+        """Queue ``fn`` for execution and return its result.
+
+        ``legs`` lists the ``(venue, symbol)`` pairs the trade touches and
+        ``priority`` is its expected profit.
+        """
+        loop = asyncio.get_running_loop()
+        job = _Job(
+            fn=fn,
+            legs=tuple(legs),
+            priority=priority,
+            enqueued_at=self.clock.time(),
+            started=loop.create_future(),
+            done=loop.create_future(),
+            span=tracing.current(),
+        )
+        heapq.heappush(self._queue, (-priority, next(self._seq), job))
+        self.submitted += 1
+        self._dispatch()
+
+        try:
+            await self.clock.wait_for(asyncio.shield(job.started), self.max_wait_sec)
+        except asyncio.TimeoutError:
+            if not job.started.done():
+                self._expire(job)
+                self.logger.warning("Pair trade expired after waiting %.2fs", self.max_wait_sec)
+                log_event(f"Scheduler: pair trade on {list(job.legs)} expired in queue")
+                return False
+        except asyncio.CancelledError:
+            # the submitter gave up: never start the job behind its back
+            if not job.started.done():
+                self._expire(job)
+            raise
+        return await job.done
+
+    def _expire(self, job: _Job) -> None:
+        job.expired = True
+        self.expired += 1
+        self._queue = [item for item in self._queue if item[2] is not job]
+        heapq.heapify(self._queue)
+
+    def _runnable(self, job: _Job) -> bool:
+        if any(leg in self._busy for leg in job.legs):
+            return False
+        return all(
+            self._venue_load.get(venue, 0) < self.max_concurrent_per_venue
+            for venue in job.venues
+        )
+
+    def _dispatch(self) -> None:
+        """Start every queued job that fits, best priority first."""
+        if self._closing:
+            return
+        blocked: List[Tuple[float, int, _Job]] = []
+        while self._queue:
+            item = heapq.heappop(self._queue)
+            job = item[2]
+            if job.expired:
+                continue
+            if self._runnable(job):
+                self._start(job)
+            else:
+                blocked.append(item)
+        for item in blocked:
+            heapq.heappush(self._queue, item)
+
+    def _start(self, job: _Job) -> None:
+        loop = asyncio.get_running_loop()
+        self._waits.append(self.clock.time() - job.enqueued_at)
+        self._busy.update(job.legs)
+        self.in_flight += 1
+        for venue in job.venues:
+            self._venue_load[venue] = self._venue_load.get(venue, 0) + 1
+        job.started.set_result(True)
+        task = loop.create_task(self._run(job))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def stop(self, timeout: Optional[float] = None) -> None:
+        """Start no more jobs and wait for the running ones to finish.
+
+        Jobs still running after ``timeout`` seconds are cancelled.
+        """
+        self._closing = True
+        tasks = set(self._tasks)
+        if not tasks:
+            return
+        _, pending = await asyncio.wait(tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _run(self, job: _Job) -> None:
+        result = False
+        try:
+            # the task was created from whichever job freed the slot; run in
+            # the submitting opportunity's trace instead
+            with tracing.attach(job.span):
+                tracing.event("scheduled")
+                result = bool(await job.fn())
+        except Exception as exc:  # pragma: no cover - engine handles its own errors
+            self.logger.error("Scheduled pair trade failed: %s", exc)
+            log_event(f"Scheduled pair trade failed: {exc}")
+        finally:
+            self._busy.difference_update(job.legs)
+            self.in_flight -= 1
+            for venue in job.venues:
+                self._venue_load[venue] -= 1
+            self.completed += 1
+            if not job.done.done():
+                job.done.set_result(result)
+            self._dispatch()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Return queue depth, load and queue wait statistics."""
+        waits = sorted(self._waits)
+        return {
+            "queue_depth": sum(1 for item in self._queue if not item[2].expired),
+            "in_flight": self.in_flight,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "expired": self.expired,
+            "venue_load": dict(self._venue_load),
+            "wait_sec_avg": sum(waits) / len(waits) if waits else 0.0,
+            "wait_sec_p95": waits[int(0.95 * (len(waits) - 1))] if waits else 0.0,
+            "wait_sec_max": waits[-1] if waits else 0.0,
+            "safe_mode_triggered": self.engine.safe_mode_triggered,
+        }
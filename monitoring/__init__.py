@@ -0,0 +1,28 @@
+"""Latency metrics and the local metrics endpoint."""
+
+from .metrics import DEFAULT_BUCKETS, REGISTRY, Histogram, HistogramFamily, Registry
+from .instrumented import InstrumentedConnector
+from .server import MetricsServer
+from .collectors import register_bot_metrics, register_rate_limit_metrics, register_rpc_pool_metrics
+from .loop_lag import LoopLagMonitor
+from .startup import STARTUP, StartupTimer
+from .profiler import SamplingProfiler, add_profiler_routes, install_signal_toggle
+
+__all__ = [
+    "DEFAULT_BUCKETS",
+    "REGISTRY",
+    "Histogram",
+    "HistogramFamily",
+    "Registry",
+    "InstrumentedConnector",
+    "MetricsServer",
+    "register_bot_metrics",
+    "register_rpc_pool_metrics",
+    "register_rate_limit_metrics",
+    "LoopLagMonitor",
+    "STARTUP",
+    "StartupTimer",
+    "SamplingProfiler",
+    "add_profiler_routes",
+    "install_signal_toggle",
+]
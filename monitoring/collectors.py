@@ -0,0 +1,101 @@
+from typing import Any, Dict, Optional
+
+from storage.logger import journal_stats, writer_stats
+
+from .metrics import REGISTRY, Registry
+from .startup import STARTUP
+
+
+def register_bot_metrics(
+    engine: Any,
+    scheduler: Any = None,
+    registry: Optional[Registry] = None,
+) -> None:
+    """Expose storage, risk, engine and scheduler state as scrape-time gauges."""
+    registry = registry or REGISTRY
+
+    registry.gauge(
+        "storage_writer",
+        "Background log writer queue depth and counters",
+        writer_stats,
+        ("stat",),
+    )
+    registry.gauge(
+        "storage_journal",
+        "Journal writer queue depth and counters",
+        journal_stats,
+        ("stat",),
+    )
+    registry.gauge(
+        "startup_seconds",
+        "Duration of each startup phase, and time to the first strategy tick",
+        STARTUP.durations,
+        ("phase",),
+    )
+    registry.gauge(
+        "engine_safe_mode_triggered",
+        "1 once a failed unwind has put the engine in safe mode",
+        lambda: float(engine.safe_mode_triggered),
+    )
+
+    risk = getattr(engine, "risk", None)
+    if risk is not None:
+        registry.gauge("risk_net_delta", "Net base position per venue and symbol", lambda: risk.snapshot()["net_delta"], ("venue", "symbol"))
+        registry.gauge("risk_gross_notional", "Gross open notional", lambda: risk.snapshot()["gross_notional"])
+        registry.gauge("risk_open_orders", "Orders currently open", lambda: risk.snapshot()["open_orders"])
+        registry.gauge("risk_daily_pnl", "Realized PnL of the current UTC day", lambda: risk.snapshot()["daily_pnl"])
+
+    if scheduler is not None:
+        def _jobs():
+            m = scheduler.metrics()
+            return {k: m[k] for k in ("submitted", "completed", "expired")}
+
+        def _waits():
+            m = scheduler.metrics()
+            return {"avg": m["wait_sec_avg"], "p95": m["wait_sec_p95"], "max": m["wait_sec_max"]}
+
+        registry.gauge("scheduler_queue_depth", "Pair trades waiting to start", lambda: scheduler.metrics()["queue_depth"])
+        registry.gauge("scheduler_in_flight", "Pair trades executing", lambda: scheduler.metrics()["in_flight"])
+        registry.gauge("scheduler_jobs", "Pair trades by outcome since start", _jobs, ("state",))
+        registry.gauge("scheduler_venue_load", "Pair trades in flight per venue", lambda: scheduler.metrics()["venue_load"], ("venue",))
+        registry.gauge("scheduler_wait_seconds", "Queue wait of recent pair trades", _waits, ("stat",))
+
+
+def register_rpc_pool_metrics(pool: Any, registry: Optional[Registry] = None) -> None:
+    """Expose per-endpoint health of a Drift ``RpcPool``."""
+    registry = registry or REGISTRY
+    registry.gauge("rpc_endpoint_latency_seconds", "Moving average of get_slot round trips", lambda: pool.snapshot()["latency_sec"], ("endpoint",))
+    registry.gauge("rpc_endpoint_slot_lag", "Slots behind the most advanced endpoint", lambda: pool.snapshot()["slot_lag"], ("endpoint",))
+    registry.gauge("rpc_endpoint_healthy", "1 while the endpoint is eligible for use", lambda: pool.snapshot()["healthy"], ("endpoint",))
+    registry.gauge("rpc_endpoint_active", "1 for the endpoint the subscription is on", lambda: pool.snapshot()["active"], ("endpoint",))
+    registry.gauge("rpc_endpoint_errors", "Failed probes and connects since start", lambda: pool.snapshot()["errors"], ("endpoint",))
+    registry.gauge("rpc_endpoint_swaps", "Subscription moves to another endpoint", lambda: pool.swaps)
+
+
+def register_rate_limit_metrics(connectors: Dict[str, Any], registry: Optional[Registry] = None) -> None:
+    """Expose the budgets of ``RateLimitedConnector``s, keyed by venue."""
+    registry = registry or REGISTRY
+
+    def _per_class(stat):
+        def read():
+            return {
+                (venue, name): cls[stat]
+                for venue, conn in connectors.items()
+                for name, cls in conn.usage()["classes"].items()
+            }
+
+        return read
+
+    def _queued():
+        return {
+            (venue, name): n
+            for venue, conn in connectors.items()
+            for name, n in conn.usage()["queued"].items()
+        }
+
+    registry.gauge("rate_limit_tokens", "Request weight left in the venue budget", lambda: {v: c.usage()["tokens"] for v, c in connectors.items()}, ("venue",))
+    registry.gauge("rate_limit_capacity", "Size of the venue request weight budget", lambda: {v: c.usage()["capacity"] for v, c in connectors.items()}, ("venue",))
+    registry.gauge("rate_limit_queued", "Requests waiting for budget", _queued, ("venue", "class"))
+    registry.gauge("rate_limit_weight", "Request weight spent since start", _per_class("weight"), ("venue", "class"))
+    registry.gauge("rate_limit_wait_seconds", "Total time requests waited for budget", _per_class("wait_sec"), ("venue", "class"))
+    registry.gauge("rate_limit_coalesced", "Requests served by an identical one already queued or in flight", _per_class("coalesced"), ("venue", "class"))
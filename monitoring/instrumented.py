@@ -0,0 +1,67 @@
+import time
+from typing import Any, Dict, List, Optional
+
+from connectors.base import ConnectorBase, ConnectorWrapper
+
+from .metrics import REGISTRY, Histogram, Registry
+
+CONNECTOR_METHODS = (
+    "fetch_book",
+    "fetch_funding",
+    "place_order",
+    "place_orders",
+    "cancel_order",
+    "get_position",
+)
+
+
+class InstrumentedConnector(ConnectorWrapper):
+    """Time every ``ConnectorBase`` call of the wrapped connector.
+
+    Durations go to ``connector_call_seconds{venue, method, outcome}``, where
+    ``outcome`` is ``ok`` or ``error``. The histogram children are resolved
+    up front, so a call only adds two ``perf_counter`` reads and one
+    ``observe``.
+    """
+
+    def __init__(self, inner: ConnectorBase, venue: str, registry: Optional[Registry] = None) -> None:
+        super().__init__(inner)
+        self.venue = venue
+        family = (registry or REGISTRY).histogram(
+            "connector_call_seconds",
+            "Duration of connector calls",
+            ("venue", "method", "outcome"),
+        )
+        self._hist: Dict[tuple, Histogram] = {
+            (method, outcome): family.labels(venue, method, outcome)
+            for method in CONNECTOR_METHODS
+            for outcome in ("ok", "error")
+        }
+
+    async def _timed(self, method: str, call: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            result = await call
+        except BaseException:
+            self._hist[(method, "error")].observe(time.perf_counter() - start)
+            raise
+        self._hist[(method, "ok")].observe(time.perf_counter() - start)
+        return result
+
+    async def fetch_book(self, symbol: str) -> Dict[str, Any]:
+        return await self._timed("fetch_book", self.inner.fetch_book(symbol))
+
+    async def fetch_funding(self, symbol: str) -> Dict[str, Any]:
+        return await self._timed("fetch_funding", self.inner.fetch_funding(symbol))
+
+    async def place_order(self, symbol: str, side: str, amount: float, price: float) -> Any:
+        return await self._timed("place_order", self.inner.place_order(symbol, side, amount, price))
+
+    async def place_orders(self, orders: List[Dict[str, Any]]) -> List[Any]:
+        return await self._timed("place_orders", self.inner.place_orders(orders))
+
+    async def cancel_order(self, order_id: Any) -> None:
+        return await self._timed("cancel_order", self.inner.cancel_order(order_id))
+
+    async def get_position(self, symbol: str) -> Dict[str, Any]:
+        return await self._timed("get_position", self.inner.get_position(symbol))
@@ -0,0 +1,140 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Deque, Dict, Optional
+
+from .metrics import REGISTRY, Registry
+
+LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DEFAULT_STALL_FILE = Path("storage/loop_stalls.log")
+
+
+class LoopLagMonitor:
+    """Measure event loop lag and capture what blocks the loop.
+
+    A task on the loop sleeps ``interval_sec`` at a time; how late it wakes
+    up is the loop lag, recorded in ``event_loop_lag_seconds``. A watchdog
+    thread checks that task's heartbeat. When the loop has not come back for
+    ``threshold_sec`` the watchdog grabs the loop thread's current stack,
+    which is the code holding the loop, and logs it to ``stall_file``. One
+    stack is captured per stall.
+
+    Lag is measured with ``time.perf_counter`` and the sampling task uses
+    ``asyncio.sleep`` directly, so it sees real stalls even when the bot
+    runs on a virtual clock.
+    """
+
+    def __init__(
+        self,
+        interval_sec: float = 0.1,
+        threshold_sec: float = 0.25,
+        stall_file: Optional[Path] = DEFAULT_STALL_FILE,
+        registry: Optional[Registry] = None,
+        keep: int = 20,
+    ) -> None:
+        self.interval_sec = float(interval_sec)
+        self.threshold_sec = float(threshold_sec)
+        self.stall_file = Path(stall_file) if stall_file else None
+        self.registry = registry or REGISTRY
+        self._hist = self.registry.histogram(
+            "event_loop_lag_seconds",
+            "How late the event loop ran a timer",
+            buckets=LAG_BUCKETS,
+        ).labels()
+        self.stalls: Deque[Dict[str, Any]] = deque(maxlen=keep)
+        self.stall_count = 0
+        self.max_lag = 0.0
+
+        self._beat = 0.0
+        self._captured_beat = -1.0
+        self._loop_thread: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], registry: Optional[Registry] = None) -> Optional["LoopLagMonitor"]:
+        """Monitor per ``monitoring.loop_lag``, ``None`` when disabled."""
+        cfg = ((config.get("monitoring", {}) or {}).get("loop_lag", {})) or {}
+        if not cfg.get("enabled"):
+            return None
+        return cls(
+            interval_sec=float(cfg.get("interval_sec", 0.1)),
+            threshold_sec=float(cfg.get("threshold_sec", 0.25)),
+            stall_file=cfg.get("stall_file", DEFAULT_STALL_FILE),
+            registry=registry,
+        )
+
+    def start(self) -> None:
+        """Start sampling; call from the loop to monitor."""
+        self._loop_thread = threading.get_ident()
+        self._beat = time.perf_counter()
+        self._stop.clear()
+        self._task = asyncio.get_running_loop().create_task(self._sample())
+        self._thread = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._thread.start()
+        self.registry.gauge(
+            "event_loop_stalls",
+            "Loop stalls longer than the capture threshold",
+            lambda: self.stall_count,
+        )
+
+    async def stop(self) -> None:
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    async def _sample(self) -> None:
+        while True:
+            start = time.perf_counter()
+            self._beat = start
+            await asyncio.sleep(self.interval_sec)
+            lag = max(time.perf_counter() - start - self.interval_sec, 0.0)
+            self._hist.observe(lag)
+            if lag > self.max_lag:
+                self.max_lag = lag
+
+    def _watch(self) -> None:
+        period = max(min(self.threshold_sec / 4, 0.05), 0.001)
+        while not self._stop.wait(period):
+            beat = self._beat
+            blocked = time.perf_counter() - beat - self.interval_sec
+            if blocked >= self.threshold_sec and beat != self._captured_beat:
+                self._captured_beat = beat
+                self._capture(blocked)
+
+    def _capture(self, blocked: float) -> None:
+        frame = sys._current_frames().get(self._loop_thread)
+        if frame is None:
+            return
+        stack = "".join(traceback.format_stack(frame))
+        stall = {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "blocked_sec": blocked,
+            "stack": stack,
+        }
+        self.stalls.append(stall)
+        self.stall_count += 1
+        self.logger.warning("Event loop blocked for %.0f ms at:\n%s", blocked * 1000, stack)
+        if self.stall_file is not None:
+            try:
+                self.stall_file.parent.mkdir(parents=True, exist_ok=True)
+                with self.stall_file.open("a") as f:
+                    f.write(f"{stall['timestamp']} blocked {blocked * 1000:.0f} ms\n{stack}\n")
+            except OSError as exc:  # pragma: no cover - disk errors
+                self.logger.error("Failed to write stall stack: %s", exc)
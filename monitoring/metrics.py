@@ -0,0 +1,187 @@
+"""Minimal in-process metrics with Prometheus text exposition.
+
+Histograms are plain Python counters: ``observe`` is a ``bisect`` and three
+increments, cheap enough to leave on every connector call and execution
+phase. Label children are resolved once and can be cached by the caller.
+Gauges are callbacks evaluated only when the metrics are scraped.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+GaugeValue = Union[float, Dict[Union[str, Tuple[str, ...]], float]]
+
+
+class _Timer:
+    __slots__ = ("_hist", "_start")
+
+    def __init__(self, hist: "Histogram") -> None:
+        self._hist = hist
+
+    def __enter__(self) -> "_Timer":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._hist.observe(time.perf_counter() - self._start)
+
+
+class Histogram:
+    """Cumulative-bucket histogram of one label combination."""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def time(self) -> _Timer:
+        """Context manager observing the elapsed wall time of its block."""
+        return _Timer(self)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the ``q`` quantile."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, n in zip(self.buckets + (math.inf,), self.counts):
+            seen += n
+            if seen >= rank:
+                return bound
+        return math.inf
+
+
+class HistogramFamily:
+    """Histograms sharing a name, split by label values."""
+
+    def __init__(
+        self, name: str, help: str, labels: Sequence[str], buckets: Sequence[float]
+    ) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labels)
+        self.buckets = tuple(buckets)
+        self._children: Dict[Tuple[str, ...], Histogram] = {}
+
+    def labels(self, *values: Any) -> Histogram:
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}")
+            child = self._children.setdefault(key, Histogram(self.buckets))
+        return child
+
+    def children(self) -> Dict[Tuple[str, ...], Histogram]:
+        return dict(self._children)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _number(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+class Registry:
+    """Collection of metrics rendered together."""
+
+    def __init__(self) -> None:
+        self._histograms: Dict[str, HistogramFamily] = {}
+        self._gauges: Dict[str, Tuple[str, Tuple[str, ...], Callable[[], GaugeValue]]] = {}
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> HistogramFamily:
+        """Return the histogram family ``name``, creating it on first use."""
+        family = self._histograms.get(name)
+        if family is None:
+            family = self._histograms[name] = HistogramFamily(name, help, labels, buckets)
+        return family
+
+    def gauge(
+        self,
+        name: str,
+        help: str,
+        fn: Callable[[], GaugeValue],
+        labels: Sequence[str] = (),
+    ) -> None:
+        """Register a gauge read from ``fn`` at scrape time.
+
+        ``fn`` returns a number, or a mapping from label value(s) to numbers
+        when ``labels`` are given. Registering a name again replaces it.
+        """
+        self._gauges[name] = (help, tuple(labels), fn)
+
+    def unregister(self, name: str) -> None:
+        self._histograms.pop(name, None)
+        self._gauges.pop(name, None)
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+        for name, family in sorted(self._histograms.items()):
+            lines.append(f"# HELP {name} {family.help}")
+            lines.append(f"# TYPE {name} histogram")
+            for values, hist in sorted(family.children().items()):
+                cumulative = 0
+                for bound, n in zip(hist.buckets + (math.inf,), list(hist.counts)):
+                    cumulative += n
+                    le = _labels(family.labelnames, values, f'le="{_number(bound)}"')
+                    lines.append(f"{name}_bucket{le} {cumulative}")
+                plain = _labels(family.labelnames, values)
+                lines.append(f"{name}_sum{plain} {_number(hist.sum)}")
+                lines.append(f"{name}_count{plain} {hist.count}")
+        for name, (help, labelnames, fn) in sorted(self._gauges.items()):
+            try:
+                value = fn()
+            except Exception:  # pragma: no cover - a broken gauge must not break the scrape
+                continue
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} gauge")
+            for values, number in _gauge_samples(value):
+                lines.append(f"{name}{_labels(labelnames, values)} {_number(number)}")
+        return "\n".join(lines) + "\n"
+
+
+def _gauge_samples(value: GaugeValue) -> Iterable[Tuple[Tuple[str, ...], float]]:
+    if isinstance(value, dict):
+        for key, number in sorted(value.items(), key=lambda kv: str(kv[0])):
+            values = key if isinstance(key, tuple) else (key,)
+            if number is not None:
+                yield tuple(str(v) for v in values), float(number)
+    elif value is not None:
+        yield (), float(value)
+
+
+REGISTRY = Registry()
@@ -0,0 +1,184 @@
+import asyncio
+import json
+import logging
+import os
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+DEFAULT_PROFILE_DIR = Path("storage/profiles")
+
+
+class SamplingProfiler:
+    """Wall-clock sampling profiler that can be toggled in a running process.
+
+    While active, a daemon thread reads every thread's current frame each
+    ``interval_sec`` and counts the stacks. Nothing is hooked into the
+    profiled code, so the loop keeps its timing and no ticks are missed; the
+    cost is one ``sys._current_frames()`` walk per sample. A run lasts at
+    most ``max_duration_sec``. When it ends, the counts are written in the
+    collapsed-stack format (``thread;outer;...;inner count``) read by
+    ``flamegraph.pl`` and speedscope.
+    """
+
+    def __init__(
+        self,
+        interval_sec: float = 0.01,
+        default_duration_sec: float = 30.0,
+        max_duration_sec: float = 300.0,
+        output_dir: Path = DEFAULT_PROFILE_DIR,
+    ) -> None:
+        self.interval_sec = float(interval_sec)
+        self.default_duration_sec = float(default_duration_sec)
+        self.max_duration_sec = float(max_duration_sec)
+        self.output_dir = Path(output_dir)
+        self.last_output: Optional[Path] = None
+
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._stacks: Counter = Counter()
+        self._samples = 0
+        self._started_at = 0.0
+        self._duration = 0.0
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> Optional["SamplingProfiler"]:
+        """Profiler per ``monitoring.profiler``, ``None`` when disabled."""
+        cfg = ((config.get("monitoring", {}) or {}).get("profiler", {})) or {}
+        if not cfg.get("enabled"):
+            return None
+        return cls(
+            interval_sec=float(cfg.get("interval_sec", 0.01)),
+            default_duration_sec=float(cfg.get("default_duration_sec", 30.0)),
+            max_duration_sec=float(cfg.get("max_duration_sec", 300.0)),
+            output_dir=Path(cfg.get("output_dir", DEFAULT_PROFILE_DIR)),
+        )
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, duration_sec: Optional[float] = None) -> bool:
+        """Start a run; returns ``False`` if one is already going."""
+        with self._lock:
+            if self.running:
+                return False
+            duration = duration_sec if duration_sec is not None else self.default_duration_sec
+            self._duration = min(max(float(duration), self.interval_sec), self.max_duration_sec)
+            self._stacks = Counter()
+            self._samples = 0
+            self._started_at = time.time()
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+            self._thread.start()
+        self.logger.info("Profiler started for up to %.0fs", self._duration)
+        return True
+
+    def stop(self) -> Optional[Path]:
+        """End the current run early and return the file it was written to."""
+        thread = self._thread
+        if thread is None:
+            return self.last_output
+        self._stop.set()
+        thread.join()
+        return self.last_output
+
+    def toggle(self) -> None:
+        if self.running:
+            self._stop.set()  # the sampling thread writes the file on exit
+        else:
+            self.start()
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "samples": self._samples,
+            "elapsed_sec": time.time() - self._started_at if self.running else 0.0,
+            "duration_sec": self._duration,
+            "last_output": str(self.last_output) if self.last_output else None,
+        }
+
+    def _run(self) -> None:
+        me = threading.get_ident()
+        names = {t.ident: t.name for t in threading.enumerate()}
+        deadline = time.perf_counter() + self._duration
+        while not self._stop.wait(self.interval_sec) and time.perf_counter() < deadline:
+            for ident, frame in sys._current_frames().items():
+                if ident == me:
+                    continue
+                if ident not in names:
+                    names = {t.ident: t.name for t in threading.enumerate()}
+                self._stacks[self._collapse(names.get(ident, str(ident)), frame)] += 1
+            self._samples += 1
+        self._write()
+        self._thread = None
+
+    @staticmethod
+    def _collapse(thread_name: str, frame: Any) -> str:
+        parts = []
+        while frame is not None:
+            code = frame.f_code
+            parts.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+            frame = frame.f_back
+        parts.append(thread_name)
+        return ";".join(reversed(parts))
+
+    def _write(self) -> None:
+        stamp = datetime.fromtimestamp(self._started_at, tz=timezone.utc).strftime("%Y%m%dT%H%M%S")
+        path = self.output_dir / f"profile-{stamp}.collapsed"
+        try:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            with path.open("w") as f:
+                for stack, count in self._stacks.most_common():
+                    f.write(f"{stack} {count}\n")
+        except OSError as exc:  # pragma: no cover - disk errors
+            self.logger.error("Failed to write profile: %s", exc)
+            return
+        self.last_output = path
+        self.logger.info("Profile of %d samples written to %s", self._samples, path)
+
+
+def install_signal_toggle(profiler: SamplingProfiler, sig: int = getattr(signal, "SIGUSR1", 0)) -> bool:
+    """Start or stop ``profiler`` on ``sig`` (``kill -USR1 <pid>``).
+
+    Must be called from the running loop's thread. Returns ``False`` where
+    the platform has no such signal.
+    """
+    if not sig:
+        return False
+    try:
+        asyncio.get_running_loop().add_signal_handler(sig, profiler.toggle)
+    except (NotImplementedError, RuntimeError):  # pragma: no cover - Windows
+        return False
+    return True
+
+
+def add_profiler_routes(server: Any, profiler: SamplingProfiler) -> None:
+    """``/profile/start?seconds=N``, ``/profile/stop`` and ``/profile/status`` on a ``MetricsServer``."""
+
+    def _json(status: int, body: Dict[str, Any]):
+        return status, "application/json", json.dumps(body) + "\n"
+
+    def start(query: Dict[str, str]):
+        try:
+            seconds = float(query["seconds"]) if "seconds" in query else None
+        except ValueError:
+            return _json(400, {"error": "seconds must be a number"})
+        started = profiler.start(seconds)
+        return _json(200 if started else 409, profiler.status())
+
+    async def stop(query: Dict[str, str]):
+        # joining the sampler waits for the file write; keep it off the loop
+        await asyncio.to_thread(profiler.stop)
+        return _json(200, profiler.status())
+
+    server.add_route("/profile/start", start)
+    server.add_route("/profile/stop", stop)
+    server.add_route("/profile/status", lambda query: _json(200, profiler.status()))
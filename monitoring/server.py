@@ -0,0 +1,96 @@
+import asyncio
+import inspect
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlsplit
+
+from .metrics import REGISTRY, Registry
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+Response = Tuple[int, str, str]
+Handler = Callable[[Dict[str, str]], Union[Response, Awaitable[Response]]]
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 409: "Conflict", 500: "Internal Server Error"}
+
+
+class MetricsServer:
+    """Local HTTP endpoint serving ``/metrics`` on the bot's event loop.
+
+    Only GET requests are handled, one per connection, which is all a
+    Prometheus scraper or ``curl`` needs. Further routes can be added with
+    ``add_route``; a handler receives the query parameters and returns
+    ``(status, content_type, body)``.
+    """
+
+    def __init__(
+        self,
+        registry: Optional[Registry] = None,
+        host: str = "127.0.0.1",
+        port: int = 9108,
+    ) -> None:
+        self.registry = registry or REGISTRY
+        self.host = host
+        self.port = port
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._routes: Dict[str, Handler] = {"/metrics": self._metrics}
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def add_route(self, path: str, handler: Handler) -> None:
+        self._routes[path] = handler
+
+    def _metrics(self, query: Dict[str, str]) -> Response:
+        return 200, CONTENT_TYPE, self.registry.render()
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        sock = self._server.sockets[0] if self._server.sockets else None
+        if sock is not None:
+            self.port = sock.getsockname()[1]
+        self.logger.info("Metrics endpoint listening on http://%s:%s/metrics", self.host, self.port)
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request = await asyncio.wait_for(reader.readline(), 5)
+            while (await asyncio.wait_for(reader.readline(), 5)) not in (b"\r\n", b"\n", b""):
+                pass  # headers are not needed
+            status, ctype, body = await self._dispatch(request.decode("latin-1"))
+        except (asyncio.TimeoutError, ConnectionError):
+            writer.close()
+            return
+        payload = body.encode()
+        writer.write(
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+            f"Content-Type: {ctype}\r\nContent-Length: {len(payload)}\r\n"
+            "Connection: close\r\n\r\n".encode()
+            + payload
+        )
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def _dispatch(self, request_line: str) -> Response:
+        parts = request_line.split()
+        if len(parts) < 2:
+            return 400, "text/plain", "bad request\n"
+        if parts[0] != "GET":
+            return 405, "text/plain", "only GET is supported\n"
+        url = urlsplit(parts[1])
+        handler = self._routes.get(url.path)
+        if handler is None:
+            return 404, "text/plain", "not found\n"
+        try:
+            result: Any = handler(dict(parse_qsl(url.query)))
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+        except Exception as exc:  # pragma: no cover - handler bugs
+            self.logger.error("Handler for %s failed: %s", url.path, exc)
+            return 500, "text/plain", f"{exc}\n"
@@ -0,0 +1,83 @@
+import logging
+import os
+import resource
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+
+def rss_bytes() -> int:
+    """Resident set size of this process, in bytes."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        # peak, in KiB on Linux and bytes on macOS
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss if sys.platform == "darwin" else rss * 1024
+
+
+class StartupTimer:
+    """Per-phase timing of the bot's start, up to its first strategy tick.
+
+    Offsets are measured from ``t0``, which ``cli.py`` sets to the
+    ``perf_counter`` read taken before its own imports. Phases may overlap,
+    as the two venues initialize concurrently. ``first_tick`` is called by
+    every strategy iteration; only the first call counts, and it logs the
+    summary.
+    """
+
+    def __init__(self, t0: Optional[float] = None) -> None:
+        self.reset(t0)
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def reset(self, t0: Optional[float] = None) -> None:
+        self.t0 = time.perf_counter() if t0 is None else t0
+        self.phases: Dict[str, Dict[str, Optional[float]]] = {}
+        self.first_tick_sec: Optional[float] = None
+        self.first_tick_rss: Optional[int] = None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start, start - self.t0)
+
+    def record(self, name: str, duration: float, start: Optional[float] = None) -> None:
+        """Add a phase timed elsewhere; ``start`` is its offset from ``t0``."""
+        self.phases[name] = {"start": start, "duration": duration}
+
+    def first_tick(self) -> None:
+        if self.first_tick_sec is not None:
+            return
+        self.first_tick_sec = time.perf_counter() - self.t0
+        self.first_tick_rss = rss_bytes()
+        self.logger.info("Startup: %s", self.format())
+
+    def durations(self) -> Dict[str, float]:
+        """Phase durations plus ``first_tick``, in seconds."""
+        out = {name: p["duration"] or 0.0 for name, p in self.phases.items()}
+        if self.first_tick_sec is not None:
+            out["first_tick"] = self.first_tick_sec
+        return out
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "phases": dict(self.phases),
+            "first_tick_sec": self.first_tick_sec,
+            "first_tick_rss": self.first_tick_rss,
+        }
+
+    def format(self) -> str:
+        parts = [f"{name} {p['duration'] * 1000:.0f}ms" for name, p in self.phases.items()]
+        if self.first_tick_sec is not None:
+            parts.append(f"first tick after {self.first_tick_sec * 1000:.0f}ms")
+        if self.first_tick_rss is not None:
+            parts.append(f"rss {self.first_tick_rss / 2**20:.0f} MiB")
+        return ", ".join(parts)
+
+
+STARTUP = StartupTimer()
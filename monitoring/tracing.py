@@ -0,0 +1,272 @@
+"""Trade lifecycle tracing.
+
+Every strategy iteration opens a trace. Spans nest through a
+``contextvars`` variable, so the connector calls, execution phases and log
+writes made on behalf of an opportunity all share its trace id, including
+work the scheduler runs in another task. Spans carry ``time.monotonic_ns``
+start and end stamps plus point events (``opportunity``, ``ack``,
+``fill``...). A trace is buffered until its root span ends and is then
+written to a JSONL file, one trace per line. By default only traces that
+found an opportunity are kept.
+
+Tracing is off unless ``configure`` enables it; disabled, ``span`` returns a
+shared no-op context manager.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import json
+import os
+import statistics
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from connectors.base import ConnectorBase, ConnectorWrapper
+from storage.logger import DEFAULT_TRACE_FILE, log_trace
+
+_current: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar(
+    "trace_span", default=None
+)
+
+
+class _Trace:
+    __slots__ = ("trace_id", "spans", "keep")
+
+    def __init__(self, trace_id: str) -> None:
+        self.trace_id = trace_id
+        self.spans: List["Span"] = []
+        self.keep = False
+
+
+class Span:
+    """One timed step of a trace."""
+
+    __slots__ = (
+        "trace", "span_id", "parent_id", "name", "attrs", "events",
+        "start_ns", "end_ns", "wall", "error", "_token",
+    )
+
+    def __init__(self, trace: _Trace, name: str, parent: Optional["Span"], attrs: Dict[str, Any]) -> None:
+        self.trace = trace
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent.span_id if parent is not None else None
+        self.name = name
+        self.attrs = attrs
+        self.events: List[Dict[str, Any]] = []
+        self.start_ns = 0
+        self.end_ns: Optional[int] = None
+        self.wall = 0.0
+        self.error: Optional[str] = None
+
+    @property
+    def trace_id(self) -> str:
+        return self.trace.trace_id
+
+    def event(self, name: str, **attrs: Any) -> None:
+        self.events.append({"name": name, "t_ns": time.monotonic_ns(), **attrs})
+
+    def set(self, **attrs: Any) -> None:
+        self.attrs.update(attrs)
+
+    def __enter__(self) -> "Span":
+        self.wall = time.time()
+        self.start_ns = time.monotonic_ns()
+        self._token = _current.set(self)
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        self.end_ns = time.monotonic_ns()
+        if exc is not None:
+            self.error = repr(exc)
+        _current.reset(self._token)
+        self.trace.spans.append(self)
+        if self.parent_id is None:
+            TRACER.finish(self.trace)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "timestamp": datetime.fromtimestamp(self.wall, tz=timezone.utc).isoformat(),
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ms": (self.end_ns - self.start_ns) / 1e6 if self.end_ns else None,
+            "attrs": self.attrs,
+            "events": self.events,
+            "error": self.error,
+        }
+
+
+class _NoopSpan:
+    __slots__ = ()
+    trace_id = None
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+    def event(self, name: str, **attrs: Any) -> None:
+        return None
+
+    def set(self, **attrs: Any) -> None:
+        return None
+
+
+_NOOP = _NoopSpan()
+
+
+class _Attached:
+    """Make ``span`` current in this task without timing anything."""
+
+    __slots__ = ("span", "_token")
+
+    def __init__(self, span: Optional[Span]) -> None:
+        self.span = span
+
+    def __enter__(self) -> Optional[Span]:
+        self._token = _current.set(self.span)
+        return self.span
+
+    def __exit__(self, *exc: Any) -> None:
+        _current.reset(self._token)
+
+
+class Tracer:
+    """Holds the tracing switch and exports finished traces."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.sample_all = False
+        self.path = DEFAULT_TRACE_FILE
+        self.exported = 0
+
+    def finish(self, trace: _Trace) -> None:
+        if not (trace.keep or self.sample_all):
+            return
+        spans = sorted(trace.spans, key=lambda s: s.start_ns)
+        log_trace([s.to_dict() for s in spans], file_path=self.path)
+        self.exported += 1
+
+
+TRACER = Tracer()
+
+
+def configure(config: Dict[str, Any]) -> Tracer:
+    """Enable tracing per the ``tracing`` config section."""
+    cfg = config.get("tracing", {}) or {}
+    TRACER.enabled = bool(cfg.get("enabled", False))
+    TRACER.sample_all = cfg.get("sample", "opportunities") == "all"
+    TRACER.path = Path(cfg.get("path", DEFAULT_TRACE_FILE))
+    return TRACER
+
+
+def span(name: str, **attrs: Any) -> Union[Span, _NoopSpan]:
+    """Child of the current span, or the root of a new trace if there is none."""
+    if not TRACER.enabled:
+        return _NOOP
+    parent = _current.get()
+    trace = parent.trace if parent is not None else _Trace(os.urandom(8).hex())
+    return Span(trace, name, parent, attrs)
+
+
+def current() -> Optional[Span]:
+    return _current.get()
+
+
+def trace_fields() -> Dict[str, str]:
+    """``{"trace_id": ...}`` to tag a log record with, empty when untraced."""
+    s = _current.get()
+    return {"trace_id": s.trace_id} if s is not None else {}
+
+
+def attach(span: Optional[Span]) -> _Attached:
+    """Context manager re-entering ``span`` in another task."""
+    return _Attached(span)
+
+
+def event(name: str, **attrs: Any) -> None:
+    """Record a point event on the current span."""
+    s = _current.get()
+    if s is not None:
+        s.event(name, **attrs)
+
+
+def keep_trace() -> None:
+    """Export the current trace even when only opportunities are sampled."""
+    s = _current.get()
+    if s is not None:
+        s.trace.keep = True
+
+
+class TracedConnector(ConnectorWrapper):
+    """Open a span around the market data reads of the wrapped connector.
+
+    The end of a ``fetch_book`` span is the snapshot receipt time of that
+    venue's book.
+    """
+
+    def __init__(self, inner: ConnectorBase, venue: str) -> None:
+        super().__init__(inner)
+        self.venue = venue
+
+    async def fetch_book(self, symbol: str) -> Dict[str, Any]:
+        with span("fetch_book", venue=self.venue, symbol=symbol):
+            return await self.inner.fetch_book(symbol)
+
+    async def fetch_funding(self, symbol: str) -> Dict[str, Any]:
+        with span("fetch_funding", venue=self.venue, symbol=symbol):
+            return await self.inner.fetch_funding(symbol)
+
+    async def get_position(self, symbol: str) -> Dict[str, Any]:
+        with span("get_position", venue=self.venue, symbol=symbol):
+            return await self.inner.get_position(symbol)
+
+
+def iter_traces(path: Union[str, Path] = DEFAULT_TRACE_FILE) -> Iterator[List[Dict[str, Any]]]:
+    """Yield the spans of each exported trace."""
+    with Path(path).open() as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            yield record["spans"]
+
+
+def latency_breakdown(path: Union[str, Path] = DEFAULT_TRACE_FILE) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """Decision-to-ack and decision-to-fill latency in ms per venue.
+
+    The decision is the ``opportunity`` event. ``ack`` and ``fill`` events
+    carry the ``venue`` they belong to.
+    """
+    samples: Dict[str, Dict[str, List[float]]] = defaultdict(lambda: defaultdict(list))
+    for spans in iter_traces(path):
+        events = [e for s in spans for e in s.get("events", [])]
+        decided = [e["t_ns"] for e in events if e["name"] == "opportunity"]
+        if not decided:
+            continue
+        t0 = decided[0]
+        for e in events:
+            if e["name"] in ("ack", "fill") and "venue" in e:
+                samples[e["venue"]][f"decision_to_{e['name']}"].append((e["t_ns"] - t0) / 1e6)
+
+    out: Dict[str, Dict[str, Dict[str, float]]] = {}
+    for venue, kinds in sorted(samples.items()):
+        out[venue] = {}
+        for kind, values in sorted(kinds.items()):
+            values.sort()
+            out[venue][kind] = {
+                "count": len(values),
+                "p50": statistics.median(values),
+                "p95": values[int(0.95 * (len(values) - 1))],
+                "max": values[-1],
+            }
+    return out
@@ -1,2 +1,14 @@
-from .logger import setup_logging, log_trade, log_event, log_opportunity
-
+from .logger import (
+    setup_logging,
+    configure_rotation,
+    log_trade,
+    log_event,
+    log_opportunity,
+    start_writer,
+    stop_writer,
+    writer_stats,
+    start_journal,
+    stop_journal,
+    journal_stats,
+)
+from .journal import Journal
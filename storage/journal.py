@@ -0,0 +1,436 @@
+"""Indexed SQLite journal of trades and opportunities.
+
+The JSONL logs are append-only and have to be scanned end to end to answer
+any question about them. The journal stores the same records in SQLite,
+keeping the fields reports filter on in indexed columns and the whole
+record as JSON::
+
+    trades(ts, strategy, market, direction, event, amount,
+           expected_profit, pnl, key, data)
+    opportunities(ts, strategy, market, direction, type, profit, key, data)
+
+``key`` is a hash of the timestamp and the record and is unique, so a
+record that is written or imported twice is stored once. ``pnl`` is the
+PnL the engine realized with the trade or unwind.
+
+The database runs in WAL mode, so readers never block the writer thread.
+That thread inserts records in batches, one transaction per batch.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+TRADES = "trades"
+OPPORTUNITIES = "opportunities"
+
+TimeBound = Union[None, float, datetime]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS trades (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    strategy TEXT,
+    market TEXT,
+    direction TEXT,
+    event TEXT NOT NULL,
+    amount REAL,
+    expected_profit REAL,
+    pnl REAL,
+    key TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS trades_ts ON trades (ts);
+CREATE INDEX IF NOT EXISTS trades_market_ts ON trades (market, ts);
+CREATE INDEX IF NOT EXISTS trades_strategy_ts ON trades (strategy, ts);
+CREATE INDEX IF NOT EXISTS trades_direction_ts ON trades (direction, ts);
+
+CREATE TABLE IF NOT EXISTS opportunities (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    strategy TEXT,
+    market TEXT,
+    direction TEXT,
+    type TEXT,
+    profit REAL,
+    key TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS opportunities_ts ON opportunities (ts);
+CREATE INDEX IF NOT EXISTS opportunities_market_ts ON opportunities (market, ts);
+CREATE INDEX IF NOT EXISTS opportunities_strategy_ts ON opportunities (strategy, ts);
+CREATE INDEX IF NOT EXISTS opportunities_direction_ts ON opportunities (direction, ts);
+"""
+
+# created after ``_migrate`` has added ``key`` to journals that predate it
+_KEY_INDEXES = """
+CREATE UNIQUE INDEX IF NOT EXISTS trades_key ON trades (key);
+CREATE UNIQUE INDEX IF NOT EXISTS opportunities_key ON opportunities (key);
+"""
+
+_INSERT = {
+    TRADES: "INSERT OR IGNORE INTO trades (ts, strategy, market, direction, event, amount,"
+    " expected_profit, pnl, key, data) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+    OPPORTUNITIES: "INSERT OR IGNORE INTO opportunities (ts, strategy, market, direction, type,"
+    " profit, key, data) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+}
+
+# errors that only concern the record at hand: skip it, keep the batch
+_BAD_RECORD = (
+    AttributeError,
+    OverflowError,
+    TypeError,
+    ValueError,
+    sqlite3.IntegrityError,
+    sqlite3.InterfaceError,
+)
+
+
+def _epoch(value: Any) -> float:
+    """Epoch seconds of an ISO timestamp (naive means UTC), datetime or number."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+    return time.time()
+
+
+def _number(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def trade_direction(record: Dict[str, Any]) -> Optional[str]:
+    """``long_<venue>_short_<venue>`` of a trade or opportunity record."""
+    if record.get("direction"):
+        return record["direction"]
+    if record.get("long_exchange") and record.get("short_exchange"):
+        return f"long_{record['long_exchange']}_short_{record['short_exchange']}"
+    side_a = str(record.get("side_a", "")).lower()
+    if side_a == "buy":
+        return "long_hyperliquid_short_drift"
+    if side_a == "sell":
+        return "long_drift_short_hyperliquid"
+    return None
+
+
+def _row(table: str, record: Dict[str, Any]) -> Tuple[Any, ...]:
+    ts = _epoch(record.get("timestamp"))
+    market = record.get("market") or record.get("symbol_b") or record.get("symbol_a")
+    data = json.dumps(record)
+    key = hashlib.sha1(f"{ts!r}:{json.dumps(record, sort_keys=True)}".encode()).hexdigest()
+    if table == TRADES:
+        return (
+            ts,
+            record.get("strategy"),
+            market,
+            trade_direction(record),
+            record.get("event", "trade"),
+            _number(record.get("amount")),
+            _number(record.get("expected_profit")),
+            _number(record.get("pnl")),
+            key,
+            data,
+        )
+    return (
+        ts,
+        record.get("strategy"),
+        market,
+        trade_direction(record),
+        record.get("type"),
+        _number(record.get("profit")),
+        key,
+        data,
+    )
+
+
+def connect(path: Union[str, Path]) -> sqlite3.Connection:
+    """Open the journal, creating the schema and enabling WAL."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(path))
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(_SCHEMA)
+    _migrate(conn)
+    conn.executescript(_KEY_INDEXES)
+    return conn
+
+
+def _migrate(conn: sqlite3.Connection) -> None:
+    for table in (TRADES, OPPORTUNITIES):
+        columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        if "key" not in columns:
+            with conn:
+                conn.execute(f"ALTER TABLE {table} ADD COLUMN key TEXT")
+
+
+class Journal:
+    """Background writer and query helpers for one journal database.
+
+    ``enqueue`` never blocks; when the queue is full the record is dropped
+    and counted. The writer thread commits once ``batch_size`` records are
+    pending or ``flush_interval_sec`` has passed, and ``stop`` drains the
+    queue without blocking on it when full. A record that cannot be stored
+    is logged and skipped without losing the rest of its batch. Queries
+    open their own connection.
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        batch_size: int = 500,
+        flush_interval_sec: float = 1.0,
+        max_queue: int = 100000,
+    ) -> None:
+        self.path = Path(path)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval_sec = flush_interval_sec
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue)
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        self.dropped = 0
+        self.skipped = 0
+        self.rows_written = 0
+        connect(self.path).close()
+
+    # -- writing -------------------------------------------------------
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._stopping.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="storage-journal", daemon=True
+            )
+            self._thread.start()
+
+    def enqueue(self, table: str, record: Dict[str, Any]) -> bool:
+        try:
+            self._queue.put_nowait((table, record))
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Insert everything queued so far and stop the thread."""
+        if self._thread is None:
+            return
+        self._stopping.set()
+        try:
+            self._queue.put_nowait(self._STOP)
+        except queue.Full:
+            pass
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logging.getLogger(__name__).warning(
+                "Journal still draining %d records after %ss", self._queue.qsize(), timeout
+            )
+            return
+        self._thread = None
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "queue_depth": self._queue.qsize(),
+            "dropped": self.dropped,
+            "skipped": self.skipped,
+            "rows_written": self.rows_written,
+        }
+
+    def _run(self) -> None:
+        conn = connect(self.path)
+        pending: List[Tuple[str, Dict[str, Any]]] = []
+        deadline = time.monotonic() + self.flush_interval_sec
+        try:
+            while not self._stopping.is_set():
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    item = None
+                if item is self._STOP:
+                    break
+                if item is not None:
+                    pending.append(item)
+                if len(pending) >= self.batch_size or time.monotonic() >= deadline:
+                    self._insert(conn, pending)
+                    pending = []
+                    deadline = time.monotonic() + self.flush_interval_sec
+
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not self._STOP:
+                    pending.append(item)
+            self._insert(conn, pending)
+        finally:
+            conn.close()
+
+    def _write(self, conn: sqlite3.Connection, items: List[Tuple[str, Any]]) -> int:
+        """Insert ``items`` in one transaction; return how many rows were new."""
+        added = 0
+        with conn:
+            for table, record in items:
+                try:
+                    added += conn.execute(_INSERT[table], _row(table, record)).rowcount
+                except _BAD_RECORD as exc:
+                    self.skipped += 1
+                    logging.getLogger(__name__).warning(
+                        "Skipping %s record %.200r: %s", table, record, exc
+                    )
+        return added
+
+    def _insert(self, conn: sqlite3.Connection, items: List[Tuple[str, Dict[str, Any]]]) -> None:
+        if not items:
+            return
+        try:
+            self.rows_written += self._write(conn, items)
+        except sqlite3.Error as exc:  # pragma: no cover - disk errors
+            logging.getLogger(__name__).error("Failed to write journal %s: %s", self.path, exc)
+
+    def import_jsonl(
+        self, path: Union[str, Path], table: Optional[str] = None, batch_size: int = 5000
+    ) -> int:
+        """Insert every record of a JSONL log and return how many were added.
+
+        ``table`` defaults to ``opportunities`` for files named like the
+        opportunity log and ``trades`` otherwise. Unparseable lines are
+        skipped, and so are records already in the journal, so importing
+        the same file again adds nothing.
+        """
+        path = Path(path)
+        if table is None:
+            table = OPPORTUNITIES if "opportunit" in path.name else TRADES
+        count = 0
+        conn = connect(self.path)
+        try:
+            batch: List[Tuple[str, Any]] = []
+            with path.open() as f:
+                for line in f:
+                    try:
+                        batch.append((table, json.loads(line)))
+                    except ValueError:
+                        continue
+                    if len(batch) >= batch_size:
+                        count += self._write(conn, batch)
+                        batch = []
+            if batch:
+                count += self._write(conn, batch)
+        finally:
+            conn.close()
+        return count
+
+    # -- queries -------------------------------------------------------
+
+    @staticmethod
+    def _where(
+        market: Optional[str],
+        strategy: Optional[str],
+        direction: Optional[str],
+        start: TimeBound,
+        end: TimeBound,
+    ) -> Tuple[str, List[Any]]:
+        clauses, params = [], []
+        for column, value in (("market", market), ("strategy", strategy), ("direction", direction)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if start is not None:
+            clauses.append("ts >= ?")
+            params.append(_epoch(start))
+        if end is not None:
+            clauses.append("ts < ?")
+            params.append(_epoch(end))
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def _query(self, sql: str, params: Iterable[Any]) -> List[sqlite3.Row]:
+        conn = sqlite3.connect(str(self.path))
+        conn.row_factory = sqlite3.Row
+        try:
+            return conn.execute(sql, list(params)).fetchall()
+        finally:
+            conn.close()
+
+    def trades(
+        self,
+        market: Optional[str] = None,
+        strategy: Optional[str] = None,
+        direction: Optional[str] = None,
+        start: TimeBound = None,
+        end: TimeBound = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Trade records in ``[start, end)``, oldest first."""
+        where, params = self._where(market, strategy, direction, start, end)
+        sql = f"SELECT data FROM trades{where} ORDER BY ts"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        return [json.loads(row["data"]) for row in self._query(sql, params)]
+
+    def trade_summary(
+        self,
+        market: Optional[str] = None,
+        strategy: Optional[str] = None,
+        direction: Optional[str] = None,
+        start: TimeBound = None,
+        end: TimeBound = None,
+    ) -> Dict[str, Any]:
+        """Trade and unwind counts, volume, expected profit and recorded PnL."""
+        where, params = self._where(market, strategy, direction, start, end)
+        row = self._query(
+            "SELECT COUNT(*) AS records,"
+            " SUM(event = 'trade') AS trades,"
+            " SUM(event = 'unwind') AS unwinds,"
+            " TOTAL(CASE WHEN event = 'trade' THEN amount END) AS volume,"
+            " TOTAL(expected_profit) AS expected_profit,"
+            f" TOTAL(pnl) AS pnl FROM trades{where}",
+            params,
+        )[0]
+        return {
+            "records": row["records"],
+            "trades": row["trades"] or 0,
+            "unwinds": row["unwinds"] or 0,
+            "volume": row["volume"],
+            "expected_profit": row["expected_profit"],
+            "pnl": row["pnl"],
+        }
+
+    def opportunity_counts(
+        self,
+        group_by: str = "direction",
+        market: Optional[str] = None,
+        strategy: Optional[str] = None,
+        start: TimeBound = None,
+        end: TimeBound = None,
+    ) -> Dict[Optional[str], Dict[str, float]]:
+        """Opportunity count, total and average profit per ``group_by`` value."""
+        if group_by not in ("direction", "market", "strategy", "type"):
+            raise ValueError(f"cannot group opportunities by {group_by!r}")
+        where, params = self._where(market, strategy, None, start, end)
+        rows = self._query(
+            f"SELECT {group_by} AS k, COUNT(*) AS n, TOTAL(profit) AS total,"
+            f" AVG(profit) AS avg FROM opportunities{where} GROUP BY {group_by}",
+            params,
+        )
+        return {
+            row["k"]: {"count": row["n"], "total_profit": row["total"], "avg_profit": row["avg"]}
+            for row in rows
+        }
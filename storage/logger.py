@@ -1,14 +1,259 @@
+import atexit
 import json
 import logging
 import os
+import queue
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, TextIO
 
+from .journal import OPPORTUNITIES, TRADES, Journal
+from .rotation import RotatingCompressedFileHandler, RotationManager, RotationPolicy
 
 DEFAULT_TRADE_FILE = Path("storage/trades.jsonl")
 DEFAULT_EVENT_FILE = Path("storage/events.log")
 DEFAULT_OPP_FILE = Path("storage/opportunities.jsonl")
+DEFAULT_TRACE_FILE = Path("storage/traces.jsonl")
+
+
+class BatchedWriter:
+    """Append lines to files from a background thread.
+
+    Producers only put ``(path, line)`` pairs on a bounded queue; when the
+    queue is full the line is dropped and counted instead of blocking the
+    caller. The writer thread keeps one open handle per file and writes
+    batches, flushing once ``batch_size`` lines are pending or
+    ``flush_interval_sec`` has passed. ``stop`` drains everything queued; it
+    never blocks on a full queue, and a thread still draining when its
+    ``timeout`` runs out is kept so that a later ``stop`` can wait for it.
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        max_queue: int = 10000,
+        batch_size: int = 256,
+        flush_interval_sec: float = 1.0,
+    ) -> None:
+        self.batch_size = max(1, batch_size)
+        self.flush_interval_sec = flush_interval_sec
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue)
+        self._handles: Dict[Path, TextIO] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        self.dropped = 0
+        self.lines_written = 0
+        self.bytes_written = 0
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._stopping.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="storage-writer", daemon=True
+            )
+            self._thread.start()
+
+    def enqueue(self, path: Path, line: str) -> bool:
+        try:
+            self._queue.put_nowait((path, line))
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Write out everything queued so far and stop the thread."""
+        if self._thread is None:
+            return
+        self._stopping.set()
+        try:
+            # only wakes an idle thread; a full queue keeps it busy anyway
+            self._queue.put_nowait(self._STOP)
+        except queue.Full:
+            pass
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logging.getLogger(__name__).warning(
+                "Writer still draining %d lines after %ss", self._queue.qsize(), timeout
+            )
+            return
+        self._thread = None
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "queue_depth": self._queue.qsize(),
+            "dropped": self.dropped,
+            "lines_written": self.lines_written,
+            "bytes_written": self.bytes_written,
+        }
+
+    def _run(self) -> None:
+        pending: Dict[Path, List[str]] = {}
+        count = 0
+        deadline = time.monotonic() + self.flush_interval_sec
+        while not self._stopping.is_set():
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                item = None
+            if item is self._STOP:
+                break
+            if item is not None:
+                path, line = item
+                pending.setdefault(path, []).append(line)
+                count += 1
+            if count >= self.batch_size or time.monotonic() >= deadline:
+                self._flush(pending)
+                pending, count = {}, 0
+                deadline = time.monotonic() + self.flush_interval_sec
+
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not self._STOP:
+                pending.setdefault(item[0], []).append(item[1])
+        self._flush(pending)
+        for handle in self._handles.values():
+            handle.close()
+        self._handles.clear()
+
+    def _flush(self, pending: Dict[Path, List[str]]) -> None:
+        for path, lines in pending.items():
+            try:
+                handle = self._handles.get(path)
+                if handle is not None and _rotation is not None and _rotation.due(path, handle.tell()):
+                    handle.close()
+                    del self._handles[path]
+                    _rotation.rotate(path)
+                    handle = None
+                if handle is None:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    handle = self._handles[path] = path.open("a")
+                data = "".join(lines)
+                handle.write(data)
+                handle.flush()
+                self.lines_written += len(lines)
+                self.bytes_written += len(data)
+            except OSError as exc:  # pragma: no cover - disk errors
+                logging.getLogger(__name__).error("Failed to write %s: %s", path, exc)
+
+
+_writer: Optional[BatchedWriter] = None
+_rotation: Optional[RotationManager] = None
+_exit_hooks: set = set()
+
+
+def _stop_at_exit(hook: Any) -> None:
+    """Register ``hook`` with ``atexit`` unless it already is."""
+    if hook not in _exit_hooks:
+        _exit_hooks.add(hook)
+        atexit.register(hook)
+
+
+def start_writer(config: Dict[str, Any]) -> Optional[BatchedWriter]:
+    """Route log_* writes through a background ``BatchedWriter``."""
+    global _writer
+    cfg = config.get("storage", {}) or {}
+    if not cfg.get("async_writer", True) or _writer is not None:
+        return _writer
+    _writer = BatchedWriter(
+        max_queue=int(cfg.get("queue_size", 10000)),
+        batch_size=int(cfg.get("batch_size", 256)),
+        flush_interval_sec=float(cfg.get("flush_interval_sec", 1.0)),
+    )
+    _writer.start()
+    _stop_at_exit(stop_writer)
+    return _writer
+
+
+def stop_writer() -> None:
+    """Drain the background writer and fall back to synchronous writes."""
+    global _writer
+    writer, _writer = _writer, None
+    if writer is not None:
+        writer.stop()
+    if _rotation is not None:
+        _rotation.wait()
+
+
+def writer_stats() -> Dict[str, int]:
+    """Queue depth and counters of the background writer."""
+    if _writer is None:
+        return {"queue_depth": 0, "dropped": 0, "lines_written": 0, "bytes_written": 0}
+    return _writer.stats()
+
+
+_journal: Optional[Journal] = None
+_journal_jsonl = True
+
+
+def start_journal(config: Dict[str, Any]) -> Optional[Journal]:
+    """Also write trades and opportunities to the SQLite journal when enabled."""
+    global _journal, _journal_jsonl
+    cfg = config.get("journal", {}) or {}
+    if not cfg.get("enabled") or _journal is not None:
+        return _journal
+    _journal = Journal(
+        cfg.get("path", "storage/journal.db"),
+        batch_size=int(cfg.get("batch_size", 500)),
+        flush_interval_sec=float(cfg.get("flush_interval_sec", 1.0)),
+        max_queue=int(cfg.get("queue_size", 100000)),
+    )
+    _journal_jsonl = bool(cfg.get("jsonl", True))
+    _journal.start()
+    _stop_at_exit(stop_journal)
+    return _journal
+
+
+def stop_journal() -> None:
+    """Drain the journal writer; later records only go to the JSONL files."""
+    global _journal, _journal_jsonl
+    journal, _journal = _journal, None
+    _journal_jsonl = True
+    if journal is not None:
+        journal.stop()
+
+
+def journal_stats() -> Dict[str, int]:
+    """Queue depth and counters of the journal writer."""
+    if _journal is None:
+        return {"queue_depth": 0, "dropped": 0, "skipped": 0, "rows_written": 0}
+    return _journal.stats()
+
+
+def _record(table: str, file_path: Path, entry: Dict[str, Any]) -> None:
+    if _journal is not None:
+        _journal.enqueue(table, entry)
+        if not _journal_jsonl:
+            return
+    _append(file_path, json.dumps(entry) + "\n")
+
+
+def _append(file_path: Path, line: str) -> None:
+    if _writer is not None:
+        _writer.enqueue(file_path, line)
+        return
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    if _rotation is not None and file_path.exists():
+        if _rotation.due(file_path, file_path.stat().st_size):
+            _rotation.rotate(file_path)
+    with file_path.open("a") as f:
+        f.write(line)
+
+
+def configure_rotation(config: Dict[str, Any]) -> Optional[RotationManager]:
+    """Rotate the storage logs and ``log_file`` per ``storage.rotation``."""
+    global _rotation
+    policy = RotationPolicy.from_config((config.get("storage", {}) or {}).get("rotation"))
+    if _rotation is not None:
+        _rotation.wait()
+    _rotation = RotationManager(policy) if policy is not None else None
+    return _rotation
 
 
 def setup_logging(config: Dict[str, Any]) -> None:
@@ -17,11 +262,15 @@ def setup_logging(config: Dict[str, Any]) -> None:
     level_str = log_cfg.get("level", "INFO")
     level = getattr(logging, level_str.upper(), logging.INFO)
     log_file = log_cfg.get("log_file")
+    rotation = configure_rotation(config)
 
     handlers = [logging.StreamHandler()]
     if log_file:
         os.makedirs(os.path.dirname(log_file), exist_ok=True)
-        handlers.append(logging.FileHandler(log_file))
+        if rotation is not None:
+            handlers.append(RotatingCompressedFileHandler(log_file, rotation))
+        else:
+            handlers.append(logging.FileHandler(log_file))
 
     logging.basicConfig(
         level=level,
@@ -32,28 +281,34 @@ def setup_logging(config: Dict[str, Any]) -> None:
 
 def log_trade(trade: Dict[str, Any], file_path: Path = DEFAULT_TRADE_FILE) -> None:
     """Append executed trade info as JSON line."""
-    file_path.parent.mkdir(parents=True, exist_ok=True)
     entry = {"timestamp": datetime.utcnow().isoformat(), **trade}
-    with file_path.open("a") as f:
-        f.write(json.dumps(entry) + "\n")
+    _record(TRADES, file_path, entry)
 
 
 def log_event(message: str, file_path: Path = DEFAULT_EVENT_FILE) -> None:
     """Append event message with timestamp."""
-    file_path.parent.mkdir(parents=True, exist_ok=True)
     ts = datetime.utcnow().isoformat()
-    with file_path.open("a") as f:
-        f.write(f"{ts} {message}\n")
+    _append(file_path, f"{ts} {message}\n")
 
 
 def log_opportunity(
     info: Dict[str, Any], file_path: Path = DEFAULT_OPP_FILE
 ) -> None:
     """Append arbitrage opportunity as JSON line."""
-    file_path.parent.mkdir(parents=True, exist_ok=True)
     entry = {"timestamp": datetime.utcnow().isoformat(), **info}
     for key in ("funding_rate_drift", "funding_rate_hyperliquid"):
         if key in entry and isinstance(entry[key], (float, int)):
             entry[key] = format(entry[key], ".6f")
-    with file_path.open("a") as f:
-        f.write(json.dumps(entry) + "\n")
+    _record(OPPORTUNITIES, file_path, entry)
+
+
+def log_trace(
+    spans: List[Dict[str, Any]], file_path: Path = DEFAULT_TRACE_FILE
+) -> None:
+    """Append the spans of one finished trace as a JSON line."""
+    entry = {
+        "timestamp": datetime.utcnow().isoformat(),
+        "trace_id": spans[0]["trace_id"] if spans else None,
+        "spans": spans,
+    }
+    _append(file_path, json.dumps(entry) + "\n")
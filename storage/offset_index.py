@@ -0,0 +1,154 @@
+"""Sparse timestamp index for the append-only JSONL logs.
+
+``<log>.idx`` sits next to the log and holds little-endian float64 values:
+a header ``(every_bytes, indexed_bytes)`` followed by ``(ts, offset)`` pairs.
+Each pair marks the first line starting at least ``every_bytes`` after the
+previous entry. Records are appended in time order, so a reader looking
+for ``start`` can seek to the last entry before it instead of parsing the
+whole file. The index is extended incrementally on every use and rebuilt
+when the log was truncated or replaced.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+from array import array
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+SUFFIX = ".idx"
+
+
+def parse_ts(value: Any) -> Optional[float]:
+    """Epoch seconds of a record's ISO ``timestamp`` (naive means UTC)."""
+    if not isinstance(value, str):
+        return None
+    try:
+        ts = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts.timestamp()
+
+
+def _line_ts(line: bytes) -> Optional[float]:
+    try:
+        return parse_ts(json.loads(line).get("timestamp"))
+    except (ValueError, AttributeError):
+        return None
+
+
+class OffsetIndex:
+    """Sidecar ``(timestamp, byte offset)`` index of one JSONL log."""
+
+    def __init__(self, log_path: Union[str, Path], every_bytes: int = 1 << 20) -> None:
+        self.log_path = Path(log_path)
+        self.path = self.log_path.with_name(self.log_path.name + SUFFIX)
+        self.every_bytes = max(1, every_bytes)
+        self.indexed_bytes = 0
+        self.ts: List[float] = []
+        self.offsets: List[int] = []
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        values = array("d")
+        values.frombytes(self.path.read_bytes())
+        if len(values) < 2 or len(values) % 2:
+            return
+        self.every_bytes = int(values[0])
+        self.indexed_bytes = int(values[1])
+        self.ts = list(values[2::2])
+        self.offsets = [int(v) for v in values[3::2]]
+
+    def _save(self) -> None:
+        values = array("d", [self.every_bytes, self.indexed_bytes])
+        for ts, offset in zip(self.ts, self.offsets):
+            values.extend((ts, offset))
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_bytes(values.tobytes())
+        tmp.replace(self.path)
+
+    def update(self) -> None:
+        """Index the part of the log written since the last update."""
+        try:
+            size = self.log_path.stat().st_size
+        except FileNotFoundError:
+            size = 0
+        if size < self.indexed_bytes:
+            # truncated or replaced: start over
+            self.indexed_bytes, self.ts, self.offsets = 0, [], []
+        if size == self.indexed_bytes:
+            return
+        last = self.offsets[-1] if self.offsets else -self.every_bytes
+        with self.log_path.open("rb") as f:
+            f.seek(self.indexed_bytes)
+            offset = self.indexed_bytes
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # a line still being written
+                if offset - last >= self.every_bytes:
+                    ts = _line_ts(line)
+                    if ts is not None:
+                        self.ts.append(ts)
+                        self.offsets.append(offset)
+                        last = offset
+                offset += len(line)
+        self.indexed_bytes = offset
+        self._save()
+
+    def seek_offset(self, start: Optional[float]) -> int:
+        """Byte offset from which every record at or after ``start`` follows."""
+        if start is None:
+            return 0
+        i = bisect.bisect_left(self.ts, start) - 1
+        return self.offsets[i] if i >= 0 else 0
+
+
+def iter_records(
+    path: Union[str, Path],
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    use_index: bool = True,
+) -> Iterator[Tuple[float, Dict[str, Any]]]:
+    """Stream ``(ts, record)`` pairs of a JSONL log within ``[start, end)``.
+
+    Lines are read one at a time. With ``use_index`` the read starts at the
+    indexed offset closest before ``start``; it stops at the first record at
+    or after ``end``. Lines that are not JSON or carry no timestamp are
+    skipped.
+    """
+    path = Path(path)
+    if not path.exists():
+        return
+    offset = 0
+    if use_index and start is not None:
+        index = OffsetIndex(path)
+        index.update()
+        offset = index.seek_offset(start)
+    with path.open("rb") as f:
+        f.seek(offset)
+        yield from filter_records(f, start, end)
+
+
+def filter_records(
+    lines: Iterable[bytes], start: Optional[float] = None, end: Optional[float] = None
+) -> Iterator[Tuple[float, Dict[str, Any]]]:
+    """Parse JSONL ``lines`` and yield the ``(ts, record)`` pairs in ``[start, end)``."""
+    for line in lines:
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if not isinstance(record, dict):
+            continue
+        ts = parse_ts(record.get("timestamp"))
+        if ts is None or (start is not None and ts < start):
+            continue
+        if end is not None and ts >= end:
+            break
+        yield ts, record
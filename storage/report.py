@@ -0,0 +1,192 @@
+"""Streaming analytics over the trade and opportunity logs.
+
+Records are aggregated one at a time, so memory use depends on the number
+of histogram bins and time buckets, not on the size of the logs.
+"""
+
+from __future__ import annotations
+
+import math
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from .rotation import iter_log
+
+DEFAULT_TRADE_FILE = Path("storage/trades.jsonl")
+DEFAULT_OPP_FILE = Path("storage/opportunities.jsonl")
+
+
+class Histogram:
+    """Fixed-width histogram with running count, mean, min and max."""
+
+    def __init__(self, bin_width: float) -> None:
+        self.bin_width = bin_width
+        self.bins: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        key = math.floor(value / self.bin_width)
+        self.bins[key] = self.bins.get(key, 0) + 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper edge of the bin holding the ``q`` quantile, capped at ``max``."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for key in sorted(self.bins):
+            seen += self.bins[key]
+            if seen >= rank:
+                return min((key + 1) * self.bin_width, self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, Any]:
+        if not self.count:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "mean": self.total / self.count,
+            "min": self.min,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "max": self.max,
+            "bins": {
+                round(key * self.bin_width, 10): n for key, n in sorted(self.bins.items())
+            },
+        }
+
+
+def slippage_bps(side: str, planned: Any, executed: Any) -> Optional[float]:
+    """Adverse slippage of a fill in basis points (negative = price improvement)."""
+    try:
+        planned, executed = float(planned), float(executed)
+    except (TypeError, ValueError):
+        return None
+    if not planned:
+        return None
+    sign = 1 if str(side).lower() == "buy" else -1
+    return sign * (executed - planned) / planned * 10000 or 0.0
+
+
+def _bucket(buckets: Dict[float, Dict[str, Any]], ts: float, width: float) -> Dict[str, Any]:
+    key = math.floor(ts / width) * width
+    bucket = buckets.get(key)
+    if bucket is None:
+        bucket = buckets[key] = {
+            "trades": 0,
+            "unwinds": 0,
+            "volume": 0.0,
+            "slippage_bps_sum": 0.0,
+            "slippage_legs": 0,
+            "opportunities": 0,
+            "opportunity_profit": 0.0,
+        }
+    return bucket
+
+
+def build_report(
+    trades_path: Union[str, Path] = DEFAULT_TRADE_FILE,
+    opportunities_path: Union[str, Path] = DEFAULT_OPP_FILE,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    bucket_sec: float = 3600,
+    profit_bin: float = 1.0,
+    slippage_bin: float = 1.0,
+    use_index: bool = True,
+) -> Dict[str, Any]:
+    """Aggregate trades and opportunities in ``[start, end)``.
+
+    Rotated segments are read only where the manifest says they overlap
+    the range. Slippage is computed per leg from ``price_a``/``exec_price_a`` and
+    ``price_b``/``exec_price_b``; unwind records count separately and do not
+    contribute to it.
+    """
+    slippage = {"a": Histogram(slippage_bin), "b": Histogram(slippage_bin)}
+    profit: Dict[str, Histogram] = {}
+    buckets: Dict[float, Dict[str, Any]] = {}
+    trades = unwinds = 0
+    volume = 0.0
+
+    for ts, rec in iter_log(trades_path, start, end, use_index):
+        bucket = _bucket(buckets, ts, bucket_sec)
+        if rec.get("event") == "unwind":
+            unwinds += 1
+            bucket["unwinds"] += 1
+            continue
+        trades += 1
+        amount = float(rec.get("amount") or 0)
+        volume += amount
+        bucket["trades"] += 1
+        bucket["volume"] += amount
+        for leg in ("a", "b"):
+            bps = slippage_bps(rec.get(f"side_{leg}"), rec.get(f"price_{leg}"), rec.get(f"exec_price_{leg}"))
+            if bps is not None:
+                slippage[leg].add(bps)
+                bucket["slippage_bps_sum"] += bps
+                bucket["slippage_legs"] += 1
+
+    for ts, rec in iter_log(opportunities_path, start, end, use_index):
+        bucket = _bucket(buckets, ts, bucket_sec)
+        bucket["opportunities"] += 1
+        hist = profit.setdefault(str(rec.get("type") or "unknown"), Histogram(profit_bin))
+        try:
+            value = float(rec.get("profit"))
+        except (TypeError, ValueError):
+            continue
+        hist.add(value)
+        bucket["opportunity_profit"] += value
+
+    rollup = []
+    for key in sorted(buckets):
+        b = buckets.pop(key)
+        legs = b.pop("slippage_legs")
+        total = b.pop("slippage_bps_sum")
+        rollup.append({"start": key, **b, "avg_slippage_bps": total / legs if legs else None})
+
+    return {
+        "trades": trades,
+        "unwinds": unwinds,
+        "volume": volume,
+        "slippage_bps": {f"leg_{leg}": h.summary() for leg, h in slippage.items()},
+        "opportunities": {name: h.summary() for name, h in sorted(profit.items())},
+        "buckets": rollup,
+    }
+
+
+def _fmt(value: Any) -> str:
+    if value is None:
+        return "-"
+    return f"{value:.4f}" if isinstance(value, float) else str(value)
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Render ``build_report`` output as text."""
+    lines = [
+        f"trades: {report['trades']}  unwinds: {report['unwinds']}  volume: {_fmt(report['volume'])}",
+        "",
+        "slippage (bps, positive = adverse)",
+    ]
+    stats = ("count", "mean", "min", "p50", "p95", "max")
+    for leg, summary in report["slippage_bps"].items():
+        lines.append(f"  {leg}: " + "  ".join(f"{k}={_fmt(summary.get(k))}" for k in stats))
+    lines += ["", "opportunities"]
+    for name, summary in report["opportunities"].items():
+        lines.append(f"  {name}: " + "  ".join(f"{k}={_fmt(summary.get(k))}" for k in stats))
+        for edge, n in (summary.get("bins") or {}).items():
+            lines.append(f"    {edge:>12}: {n}")
+    lines += ["", f"{'bucket (UTC)':<20} {'trades':>7} {'unwinds':>8} {'volume':>12} {'slip_bps':>9} {'opps':>7} {'opp_profit':>12}"]
+    for b in report["buckets"]:
+        start = datetime.fromtimestamp(b["start"], tz=timezone.utc).strftime("%Y-%m-%d %H:%M")
+        lines.append(
+            f"{start:<20} {b['trades']:>7} {b['unwinds']:>8} {_fmt(b['volume']):>12} "
+            f"{_fmt(b['avg_slippage_bps']):>9} {b['opportunities']:>7} {_fmt(b['opportunity_profit']):>12}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,279 @@
+"""Size- and time-based rotation of the bot's log files.
+
+When a log reaches ``max_bytes`` or has been written to for
+``interval_sec``, it is renamed to a timestamped segment next to it, e.g.
+``trades.jsonl`` becomes ``trades.20240501T101500.jsonl``, and a new file
+is started. Segments are gzip-compressed by a background thread.
+``<log>.manifest.json`` lists them with the wall-clock range they were
+written in::
+
+    [{"file": "trades.20240501T101500.jsonl.gz", "start": 1714550400.0,
+      "end": 1714558500.0, "bytes": 104857600, "compressed": true}, ...]
+
+Readers use the manifest to open only the segments overlapping the range
+they need.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import logging.handlers
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from .offset_index import SUFFIX as INDEX_SUFFIX, filter_records, iter_records
+
+MANIFEST_SUFFIX = ".manifest.json"
+
+# records are timestamped before they are written, by at most the writer's
+# flush interval; segments are matched with this much leeway
+SLACK_SEC = 60.0
+
+_manifest_lock = threading.Lock()
+
+
+@dataclass
+class RotationPolicy:
+    """When to rotate and what to do with the rotated segments."""
+
+    max_bytes: Optional[int] = None
+    interval_sec: Optional[float] = None
+    compress: bool = True
+    keep: Optional[int] = None
+
+    @classmethod
+    def from_config(cls, cfg: Optional[Dict[str, Any]]) -> Optional["RotationPolicy"]:
+        cfg = cfg or {}
+        policy = cls(
+            max_bytes=cfg.get("max_bytes"),
+            interval_sec=cfg.get("interval_sec"),
+            compress=bool(cfg.get("compress", True)),
+            keep=cfg.get("keep"),
+        )
+        return policy if policy.max_bytes or policy.interval_sec else None
+
+
+def manifest_path(path: Union[str, Path]) -> Path:
+    path = Path(path)
+    return path.with_name(path.name + MANIFEST_SUFFIX)
+
+
+def read_manifest(path: Union[str, Path]) -> List[Dict[str, Any]]:
+    """Rotated segments of ``path``, oldest first."""
+    try:
+        return json.loads(manifest_path(path).read_text())
+    except (FileNotFoundError, ValueError):
+        return []
+
+
+def _update_manifest(
+    path: Path, update: Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]]
+) -> None:
+    with _manifest_lock:
+        entries = update(read_manifest(path))
+        target = manifest_path(path)
+        tmp = target.with_name(target.name + ".tmp")
+        tmp.write_text(json.dumps(entries, indent=1))
+        tmp.replace(target)
+
+
+def _segment_path(path: Path, now: float) -> Path:
+    stamp = datetime.fromtimestamp(now, tz=timezone.utc).strftime("%Y%m%dT%H%M%S")
+    stem, suffix = os.path.splitext(path.name)
+    candidate = path.with_name(f"{stem}.{stamp}{suffix}")
+    n = 1
+    while candidate.exists() or candidate.with_name(candidate.name + ".gz").exists():
+        candidate = path.with_name(f"{stem}.{stamp}-{n}{suffix}")
+        n += 1
+    return candidate
+
+
+class RotationManager:
+    """Rotate log files under one ``RotationPolicy``.
+
+    Writers call ``due`` with the current file size before appending and
+    ``rotate`` when it returns true, with the file closed. Compression runs
+    on a single background thread; ``wait`` blocks until it is idle.
+    """
+
+    def __init__(self, policy: RotationPolicy) -> None:
+        self.policy = policy
+        self._opened: Dict[Path, float] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.rotations = 0
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def _segment_start(self, path: Path, now: float) -> float:
+        start = self._opened.get(path)
+        if start is None:
+            entries = read_manifest(path)
+            start = self._opened[path] = entries[-1]["end"] if entries else now
+        return start
+
+    def due(self, path: Path, size: int, now: Optional[float] = None) -> bool:
+        if size <= 0:
+            return False
+        now = time.time() if now is None else now
+        if self.policy.max_bytes and size >= self.policy.max_bytes:
+            return True
+        start = self._segment_start(path, now)
+        return bool(self.policy.interval_sec and now - start >= self.policy.interval_sec)
+
+    def rotate(self, path: Path, now: Optional[float] = None) -> Optional[Path]:
+        """Move ``path`` to a new segment and return it (``None`` if empty)."""
+        path = Path(path)
+        now = time.time() if now is None else now
+        with self._lock:
+            try:
+                size = path.stat().st_size
+            except FileNotFoundError:
+                return None
+            if not size:
+                return None
+            start = self._segment_start(path, now)
+            segment = _segment_path(path, now)
+            os.replace(path, segment)
+            index = path.with_name(path.name + INDEX_SUFFIX)
+            if index.exists():
+                if self.policy.compress:
+                    index.unlink()
+                else:
+                    os.replace(index, segment.with_name(segment.name + INDEX_SUFFIX))
+            entry = {
+                "file": segment.name,
+                "start": start,
+                "end": now,
+                "bytes": size,
+                "compressed": False,
+            }
+            _update_manifest(path, lambda entries: entries + [entry])
+            self._opened[path] = now
+            self.rotations += 1
+
+        if self.policy.compress:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(1, thread_name_prefix="log-compress")
+            self._executor.submit(self._compress, path, segment)
+        elif self.policy.keep:
+            self._prune(path)
+        return segment
+
+    def _compress(self, path: Path, segment: Path) -> None:
+        target = segment.with_name(segment.name + ".gz")
+        try:
+            with segment.open("rb") as src, gzip.open(target, "wb") as dst:
+                shutil.copyfileobj(src, dst, 1 << 20)
+        except OSError as exc:  # pragma: no cover - disk errors
+            self.logger.error("Failed to compress %s: %s", segment, exc)
+            return
+
+        def _mark(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            for entry in entries:
+                if entry["file"] == segment.name:
+                    entry["file"] = target.name
+                    entry["compressed"] = True
+                    entry["compressed_bytes"] = target.stat().st_size
+            return entries
+
+        _update_manifest(path, _mark)
+        segment.unlink()
+        if self.policy.keep:
+            self._prune(path)
+
+    def _prune(self, path: Path) -> None:
+        """Delete the oldest segments beyond ``keep``."""
+        removed: List[Dict[str, Any]] = []
+
+        def _drop(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            excess = len(entries) - int(self.policy.keep or 0)
+            if excess > 0:
+                removed.extend(entries[:excess])
+                return entries[excess:]
+            return entries
+
+        _update_manifest(path, _drop)
+        for entry in removed:
+            for name in (entry["file"], entry["file"] + INDEX_SUFFIX):
+                try:
+                    (path.parent / name).unlink()
+                except FileNotFoundError:
+                    pass
+
+    def wait(self) -> None:
+        """Block until every queued compression has finished."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+class RotatingCompressedFileHandler(logging.handlers.BaseRotatingHandler):
+    """``logging`` file handler rotating through a ``RotationManager``."""
+
+    def __init__(self, filename: str, manager: RotationManager, encoding: Optional[str] = None) -> None:
+        super().__init__(filename, "a", encoding=encoding, delay=False)
+        self.manager = manager
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:  # noqa: N802 - logging API
+        if self.stream is None:
+            self.stream = self._open()
+        return self.manager.due(Path(self.baseFilename), self.stream.tell())
+
+    def doRollover(self) -> None:  # noqa: N802 - logging API
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        self.manager.rotate(Path(self.baseFilename))
+        self.stream = self._open()
+
+
+def segments(
+    path: Union[str, Path], start: Optional[float] = None, end: Optional[float] = None
+) -> List[Path]:
+    """Segments of ``path`` that may hold records in ``[start, end)``, oldest first.
+
+    The live file is included last.
+    """
+    path = Path(path)
+    entries = read_manifest(path)
+    out = []
+    for entry in entries:
+        if start is not None and entry["end"] < start:
+            continue
+        if end is not None and entry["start"] - SLACK_SEC >= end:
+            continue
+        segment = path.parent / entry["file"]
+        if not segment.exists():
+            # compressed after the manifest was read
+            alt = segment.with_name(segment.name + ".gz")
+            segment = alt if alt.exists() else segment
+        if segment.exists():
+            out.append(segment)
+    active_start = entries[-1]["end"] if entries else None
+    if path.exists() and (end is None or active_start is None or active_start - SLACK_SEC < end):
+        out.append(path)
+    return out
+
+
+def iter_log(
+    path: Union[str, Path],
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    use_index: bool = True,
+) -> Iterator[Tuple[float, Dict[str, Any]]]:
+    """Stream ``(ts, record)`` pairs of a rotated JSONL log within ``[start, end)``."""
+    for segment in segments(path, start, end):
+        if segment.suffix == ".gz":
+            with gzip.open(segment, "rb") as f:
+                yield from filter_records(f, start, end)
+        else:
+            yield from iter_records(segment, start, end, use_index)
@@ -0,0 +1,258 @@
+"""Columnar archive of order book and funding snapshots.
+
+Snapshots are stored one column per field as raw little-endian float64
+files, partitioned by UTC day, venue, market and kind::
+
+    <root>/2024-05-01/drift/SOL-PERP/book/ts.f64
+    <root>/2024-05-01/drift/SOL-PERP/book/bid_px_0.f64
+    <root>/2024-05-01/hyperliquid/SOL/funding/funding_rate.f64
+
+Writes are buffered and appended chunk by chunk; files are never
+rewritten. Every column of a partition holds one value per ``ts`` row,
+NaN where a snapshot lacked the field. Reads memory-map the column files,
+so a time range within one day is returned as zero-copy views.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+DTYPE = np.dtype("<f8")
+SUFFIX = ".f64"
+BOOK = "book"
+FUNDING = "funding"
+
+_PartitionKey = Tuple[str, str, str, str]
+
+
+def _day(ts: float) -> str:
+    return datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%d")
+
+
+def _safe(name: str) -> str:
+    return name.replace("/", "_")
+
+
+def _to_float(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class _Partition:
+    """Buffered columns of one day/venue/market/kind directory.
+
+    Columns already on disk are carried on, so a recorder restarted with a
+    different column set still appends NaN to the ones it no longer fills.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.columns: Dict[str, List[float]] = {}
+        self.rows = 0
+        ts_file = path / f"ts{SUFFIX}"
+        self.disk_rows = ts_file.stat().st_size // DTYPE.itemsize if ts_file.exists() else 0
+        if self.disk_rows:
+            for file in sorted(path.glob(f"*{SUFFIX}")):
+                self.columns[file.stem] = []
+
+    def append(self, row: Dict[str, float]) -> None:
+        for name, values in self.columns.items():
+            values.append(row.get(name, math.nan))
+        for name, value in row.items():
+            if name not in self.columns:
+                self.columns[name] = [math.nan] * self.rows + [value]
+        self.rows += 1
+
+    def flush(self) -> None:
+        if not self.rows:
+            return
+        self.path.mkdir(parents=True, exist_ok=True)
+        # ts goes last: a crash mid-flush leaves other columns longer, never shorter
+        names = [name for name in self.columns if name != "ts"] + ["ts"]
+        for name in names:
+            file = self.path / f"{name}{SUFFIX}"
+            with file.open("ab") as f:
+                have = f.tell() // DTYPE.itemsize
+                if have > self.disk_rows:
+                    # the unfinished chunk of a crashed flush
+                    f.truncate(self.disk_rows * DTYPE.itemsize)
+                    f.seek(0, 2)
+                elif have < self.disk_rows:
+                    # column first seen after earlier chunks were written
+                    np.full(self.disk_rows - have, np.nan, dtype=DTYPE).tofile(f)
+                np.asarray(self.columns[name], dtype=DTYPE).tofile(f)
+        self.disk_rows += self.rows
+        self.rows = 0
+        self.columns = {name: [] for name in self.columns}
+
+
+class TickRecorder:
+    """Append connector snapshots to the columnar archive."""
+
+    def __init__(self, root: str | Path, levels: int = 5, chunk_rows: int = 1024) -> None:
+        self.root = Path(root)
+        self.levels = levels
+        self.chunk_rows = max(1, chunk_rows)
+        self._partitions: Dict[_PartitionKey, _Partition] = {}
+
+    def _partition(self, ts: float, venue: str, symbol: str, kind: str) -> _Partition:
+        key = (_day(ts), venue, symbol, kind)
+        part = self._partitions.get(key)
+        if part is None:
+            # a new day starts: write out what is still buffered for the old one
+            for old_key in [k for k in self._partitions if k[1:] == key[1:]]:
+                self._partitions.pop(old_key).flush()
+            part = self._partitions[key] = _Partition(
+                self.root / key[0] / _safe(venue) / _safe(symbol) / kind
+            )
+        return part
+
+    def _append(self, ts: float, venue: str, symbol: str, kind: str, row: Dict[str, float]) -> None:
+        part = self._partition(ts, venue, symbol, kind)
+        part.append(row)
+        if part.rows >= self.chunk_rows:
+            part.flush()
+
+    def record_book(
+        self, venue: str, symbol: str, book: Dict[str, Any], ts: Optional[float] = None
+    ) -> None:
+        ts = time.time() if ts is None else ts
+        row = {"ts": ts}
+        for side, prefix in (("bids", "bid"), ("asks", "ask")):
+            levels = book.get(side) or []
+            for i in range(self.levels):
+                lvl = levels[i] if i < len(levels) else {}
+                price = _to_float(lvl.get("price"))
+                size = _to_float(lvl.get("size"))
+                row[f"{prefix}_px_{i}"] = math.nan if price is None else price
+                row[f"{prefix}_sz_{i}"] = math.nan if size is None else size
+        self._append(ts, venue, symbol, BOOK, row)
+
+    def record_funding(
+        self, venue: str, symbol: str, funding: Dict[str, Any], ts: Optional[float] = None
+    ) -> None:
+        ts = time.time() if ts is None else ts
+        row = {"ts": ts}
+        for key, value in funding.items():
+            number = _to_float(value)
+            if number is not None and key != "ts":
+                row[key] = number
+        self._append(ts, venue, symbol, FUNDING, row)
+
+    def flush(self) -> None:
+        for part in self._partitions.values():
+            part.flush()
+
+    def close(self) -> None:
+        self.flush()
+        self._partitions.clear()
+
+
+def _memmap(path: Path) -> np.ndarray:
+    if path.stat().st_size == 0:
+        return np.empty(0, dtype=DTYPE)
+    return np.memmap(path, dtype=DTYPE, mode="r")
+
+
+class TickArchive:
+    """Read-only access to a ``TickRecorder`` archive."""
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+
+    def days(self) -> List[str]:
+        if not self.root.exists():
+            return []
+        return sorted(p.name for p in self.root.iterdir() if p.is_dir())
+
+    def iter_days(
+        self,
+        venue: str,
+        symbol: str,
+        kind: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> Iterator[Dict[str, np.ndarray]]:
+        """Yield the columns of each day in ``[start, end)`` as memmap views."""
+        first = _day(start) if start is not None else None
+        last = _day(end) if end is not None else None
+        for day in self.days():
+            if (first and day < first) or (last and day > last):
+                continue
+            path = self.root / day / _safe(venue) / _safe(symbol) / kind
+            if not (path / f"ts{SUFFIX}").exists():
+                continue
+            cols = {p.stem: _memmap(p) for p in path.glob(f"*{SUFFIX}")}
+            # a crash mid-flush can leave some columns a chunk longer than ts
+            ts = cols["ts"]
+            n = len(ts)
+            short = sorted(name for name, col in cols.items() if len(col) < n)
+            if short:
+                raise ValueError(f"{path}: columns {short} have fewer rows than ts")
+            lo = int(np.searchsorted(ts, start, "left")) if start is not None else 0
+            hi = int(np.searchsorted(ts, end, "left")) if end is not None else n
+            if hi > lo:
+                yield {name: col[lo:hi] for name, col in cols.items()}
+
+    def read(
+        self,
+        venue: str,
+        symbol: str,
+        kind: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> Dict[str, np.ndarray]:
+        """Return all columns in ``[start, end)``.
+
+        A range inside a single day is returned zero-copy; ranges spanning
+        several days are concatenated.
+        """
+        chunks = list(self.iter_days(venue, symbol, kind, start, end))
+        if not chunks:
+            return {"ts": np.empty(0, dtype=DTYPE)}
+        if len(chunks) == 1:
+            return chunks[0]
+        names = set().union(*chunks)
+        return {
+            name: np.concatenate(
+                [c.get(name, np.full(len(c["ts"]), np.nan)) for c in chunks]
+            )
+            for name in names
+        }
+
+
+def row_to_book(columns: Dict[str, np.ndarray], index: int) -> Dict[str, Any]:
+    """Rebuild the connector book dict stored at ``index``."""
+    book: Dict[str, Any] = {}
+    for side, prefix in (("bids", "bid"), ("asks", "ask")):
+        levels = []
+        i = 0
+        while f"{prefix}_px_{i}" in columns:
+            price = columns[f"{prefix}_px_{i}"][index]
+            if math.isnan(price):
+                break
+            level: Dict[str, float] = {"price": float(price)}
+            size = columns[f"{prefix}_sz_{i}"][index]
+            if not math.isnan(size):
+                level["size"] = float(size)
+            levels.append(level)
+            i += 1
+        book[side] = levels
+    return book
+
+
+def row_to_funding(columns: Dict[str, np.ndarray], index: int) -> Dict[str, float]:
+    """Rebuild the funding dict stored at ``index``."""
+    return {
+        name: float(col[index])
+        for name, col in columns.items()
+        if name != "ts" and not math.isnan(col[index])
+    }
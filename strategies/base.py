@@ -1,20 +1,31 @@
 from __future__ import annotations
 
 import logging
-import asyncio
 import threading
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional
 
 from connectors import DriftConnector, HyperliquidConnector
-from execution.engine import ExecutionEngine
+from execution.clock import Clock, get_clock
+from execution.engine import EXECUTION_SETTINGS, ExecutionEngine
+from execution.scheduler import ExecutionScheduler
+from monitoring import tracing
+from monitoring.metrics import REGISTRY
+from monitoring.startup import STARTUP
 from storage.logger import log_event, log_opportunity
 
 
 class ArbitrageStrategyBase(ABC):
     """Common functionality for arbitrage strategies."""
 
-    def __init__(self, config: Dict[str, Any], drift: DriftConnector, hyper: HyperliquidConnector) -> None:
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        drift: DriftConnector,
+        hyper: HyperliquidConnector,
+        scheduler: Optional[ExecutionScheduler] = None,
+        clock: Optional[Clock] = None,
+    ) -> None:
         self.config = config
         self.symbol = config.get("market", "")  # for logging
         self.drift_symbol = config.get("drift", {}).get("market", self.symbol)
@@ -27,11 +38,34 @@ class ArbitrageStrategyBase(ABC):
 
         self.drift = drift
         self.hyper = hyper
-        self.engine = ExecutionEngine(self.hyper, self.drift, config)
+        self.scheduler = scheduler
+        if scheduler is not None:
+            # account-level engine shared with the other strategies; this
+            # strategy's overrides travel with each job it submits
+            self.engine = scheduler.engine
+            self.clock = clock or scheduler.clock
+            self.execution_settings: Optional[Dict[str, Any]] = {
+                key: config[key] for key in EXECUTION_SETTINGS if key in config
+            }
+        else:
+            self.clock = clock or get_clock()
+            self.engine = ExecutionEngine(self.hyper, self.drift, config, clock=self.clock)
+            self.execution_settings = None
 
         self.logger = logging.getLogger(self.__class__.__name__)
         self._stop_event = threading.Event()
 
+        phases = REGISTRY.histogram(
+            "strategy_phase_seconds",
+            "Duration of strategy loop phases",
+            ("strategy", "phase"),
+        )
+        name = config.get("strategy") or self.__class__.__name__
+        self._phase = {
+            phase: phases.labels(name, phase)
+            for phase in ("find_opportunity", "funding", "log_opportunity", "execute", "iteration")
+        }
+
     @abstractmethod
     async def find_opportunity(self) -> Optional[Dict[str, Any]]:
         """Search for an arbitrage opportunity and return its parameters."""
@@ -61,7 +95,13 @@ class ArbitrageStrategyBase(ABC):
             side_b = "sell"
             price_b = short_price
 
-        return await self.engine.execute_pair_trade(
+        execution_cfg = self.config.get("execution", {}) or {}
+        if execution_cfg.get("mode", "single") == "sliced":
+            execute_fn = self.engine.execute_sliced_pair_trade
+        else:
+            execute_fn = self.engine.execute_pair_trade
+
+        args = (
             self.hyper_symbol,
             self.drift_symbol,
             side_a,
@@ -70,6 +110,21 @@ class ArbitrageStrategyBase(ABC):
             price_a,
             price_b,
         )
+        # columns the trade journal indexes on
+        log_extra = {
+            "strategy": self.config.get("strategy", ""),
+            "market": self.symbol,
+            "direction": f"long_{long_exchange}_short_{short_exchange}",
+            "expected_profit": opportunity.get("profit"),
+        }
+        if self.scheduler is None:
+            return await execute_fn(*args, log_extra=log_extra)
+
+        return await self.scheduler.submit(
+            lambda: execute_fn(*args, log_extra=log_extra, settings=self.execution_settings),
+            legs=[("hyperliquid", self.hyper_symbol), ("drift", self.drift_symbol)],
+            priority=float(opportunity.get("profit") or 0.0),
+        )
 
     def stop(self) -> None:
         """Signal the running loop to exit."""
@@ -80,14 +135,24 @@ class ArbitrageStrategyBase(ABC):
 
 
         async def _process_once() -> None:
-            opp = await self.find_opportunity()
+            with self._phase["find_opportunity"].time(), tracing.span("find_opportunity"):
+                opp = await self.find_opportunity()
             if not opp:
                 self.logger.info("No opportunity found")
                 log_event("No opportunity found")
                 return
 
-            f_drift = await self.drift.fetch_funding(self.drift_symbol)
-            f_hyper = await self.hyper.fetch_funding(self.hyper_symbol)
+            tracing.keep_trace()
+            tracing.event(
+                "opportunity",
+                long_exchange=opp["long_exchange"],
+                short_exchange=opp["short_exchange"],
+                profit=opp.get("profit"),
+            )
+
+            with self._phase["funding"].time():
+                f_drift = await self.drift.fetch_funding(self.drift_symbol)
+                f_hyper = await self.hyper.fetch_funding(self.hyper_symbol)
             rate_drift = float(
                 f_drift.get("last_funding_rate") or f_drift.get("funding_rate", 0)
             )
@@ -102,18 +167,22 @@ class ArbitrageStrategyBase(ABC):
                 "Funding Rate Arbitrage" if strategy_name == "funding" else "Arbitrage"
             )
 
-            log_opportunity(
-                {
-                    "type": opp_type,
-                    "long_exchange": opp["long_exchange"],
-                    "short_exchange": opp["short_exchange"],
-                    "long_price": opp["long_price"],
-                    "short_price": opp["short_price"],
-                    "profit": opp.get("profit"),
-                    "funding_rate_drift": rate_drift_norm,
-                    "funding_rate_hyperliquid": rate_hyper,
-                }
-            )
+            with self._phase["log_opportunity"].time(), tracing.span("log_opportunity"):
+                log_opportunity(
+                    {
+                        "type": opp_type,
+                        "strategy": strategy_name,
+                        "market": self.symbol,
+                        "long_exchange": opp["long_exchange"],
+                        "short_exchange": opp["short_exchange"],
+                        "long_price": opp["long_price"],
+                        "short_price": opp["short_price"],
+                        "profit": opp.get("profit"),
+                        "funding_rate_drift": rate_drift_norm,
+                        "funding_rate_hyperliquid": rate_hyper,
+                        **tracing.trace_fields(),
+                    }
+                )
             self.logger.info("%s: long %s @ %s short %s @ %s; potential profit %.2f; funding drift %.6f, hyperliquid %.6f",
                 opp_type,
                 opp["long_exchange"],
@@ -126,7 +195,8 @@ class ArbitrageStrategyBase(ABC):
             )
 
             if live:
-                executed = await self.execute(opp)
+                with self._phase["execute"].time(), tracing.span("execute"):
+                    executed = await self.execute(opp)
                 if executed:
                     log_event("Trade executed successfully")
                 else:
@@ -137,8 +207,12 @@ class ArbitrageStrategyBase(ABC):
         async def _loop() -> None:
             interval = float(self.config.get("poll_interval_sec", 1))
             while not self._stop_event.is_set():
-                await _process_once()
-                await asyncio.sleep(interval)
+                with self._phase["iteration"].time(), tracing.span(
+                    "iteration", strategy=self.config.get("strategy", ""), market=self.symbol
+                ):
+                    await _process_once()
+                STARTUP.first_tick()
+                await self.clock.sleep(interval)
 
         try:
             await _loop()
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from connectors import DriftConnector, HyperliquidConnector
+from execution.clock import Clock, get_clock
+from execution.engine import ExecutionEngine
+from execution.scheduler import ExecutionScheduler
 
 from . import STRATEGY_MAP
 
@@ -11,11 +14,24 @@ from . import STRATEGY_MAP
 class MultiStrategyRunner:
     """Run multiple strategies concurrently."""
 
-    def __init__(self, config: Dict[str, Any], drift: DriftConnector, hyper: HyperliquidConnector) -> None:
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        drift: DriftConnector,
+        hyper: HyperliquidConnector,
+        clock: Optional[Clock] = None,
+    ) -> None:
         self.config = config
         self.drift = drift
         self.hyper = hyper
+        self.clock = clock or get_clock()
         self.strategies: List[Any] = []
+        # one engine and scheduler per account, shared by every strategy
+        self.scheduler = ExecutionScheduler(
+            ExecutionEngine(self.hyper, self.drift, config, clock=self.clock),
+            config,
+            clock=self.clock,
+        )
         self._init_strategies()
 
     def _init_strategies(self) -> None:
@@ -32,7 +48,27 @@ class MultiStrategyRunner:
                 continue
             merged = {**self.config, **cfg}
             merged["strategy"] = name
-            self.strategies.append(strat_cls(merged, drift=self.drift, hyper=self.hyper))
+            self.strategies.append(
+                strat_cls(
+                    merged,
+                    drift=self.drift,
+                    hyper=self.hyper,
+                    scheduler=self.scheduler,
+                    clock=self.clock,
+                )
+            )
 
     async def run(self, live: bool = True) -> None:
-        await asyncio.gather(*(s.run(live=live) for s in self.strategies))
+        if live:
+            # positions left open by an earlier run count against the limits
+            engine = self.scheduler.engine
+            pairs = {(s.hyper_symbol, s.drift_symbol) for s in self.strategies}
+            for symbol_a, symbol_b in sorted(pairs):
+                await engine.seed_risk(symbol_a, symbol_b)
+        try:
+            await asyncio.gather(*(s.run(live=live) for s in self.strategies))
+        finally:
+            # let trades already on the books finish hedging before returning
+            await self.scheduler.stop(
+                (self.config.get("scheduler", {}) or {}).get("stop_timeout_sec")
+            )
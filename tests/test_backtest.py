@@ -0,0 +1,166 @@
+import time
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from backtest import MarketData, load_market_data, run_backtest
+from backtest.engine import avg_fill_price, basis_signals, funding_signals
+from connectors.base import ConnectorBase
+from storage.ticks import TickArchive, TickRecorder, row_to_book, row_to_funding
+from strategies.basis import BasisStrategy
+from strategies.funding import FundingStrategy
+
+T0 = 1_714_521_600.0
+
+
+class StaticConnector(ConnectorBase):
+    def __init__(self, book, funding):
+        super().__init__({})
+        self.book = book
+        self.funding = funding
+
+    async def fetch_book(self, symbol):
+        return self.book
+
+    async def fetch_funding(self, symbol):
+        return self.funding
+
+    async def place_order(self, symbol, side, amount, price):
+        return 1
+
+    async def cancel_order(self, order_id):
+        pass
+
+    async def get_position(self, symbol):
+        return {}
+
+
+class DummyEngine:
+    def __init__(self, *a, **kw):
+        pass
+
+
+PARAMS = {
+    "market": "TEST",
+    "amount": 2.0,
+    "max_slippage_bps": 40,
+    "min_profit_usd": 0.05,
+    "hold_time_sec": 5,
+    "fees": {"drift": 0.0002, "hyperliquid": 0.0001},
+    "drift": {"market": "SOL-PERP"},
+    "hyperliquid": {"market": "SOL"},
+}
+
+
+def random_book(rng, mid):
+    levels = int(rng.integers(1, 4))
+    half = float(rng.uniform(0.01, 0.3))
+    book = {"bids": [], "asks": []}
+    for i in range(levels):
+        for side, sign in (("bids", -1), ("asks", 1)):
+            level = {"price": round(mid + sign * (half + 0.05 * i), 4)}
+            if rng.random() < 0.8:
+                level["size"] = float(rng.choice([0.5, 1.0, 3.0]))
+            book[side].append(level)
+    return book
+
+
+@pytest.fixture
+def archive(tmp_path):
+    rng = np.random.default_rng(7)
+    rec = TickRecorder(tmp_path, levels=3)
+    mid = 100.0
+    for i in range(200):
+        mid += rng.normal(0, 0.1)
+        ts = T0 + i
+        rec.record_book("drift", "SOL-PERP", random_book(rng, mid + rng.normal(0, 0.3)), ts=ts)
+        rec.record_book("hyperliquid", "SOL", random_book(rng, mid + rng.normal(0, 0.3)), ts=ts)
+        rec.record_funding("drift", "SOL-PERP", {"last_funding_rate": rng.normal(0, 1e9)}, ts=ts)
+        rec.record_funding("hyperliquid", "SOL", {"funding_rate": rng.normal(0, 1.0)}, ts=ts)
+    rec.close()
+    return TickArchive(tmp_path)
+
+
+async def strategy_decision(cls, archive, row):
+    books = {
+        v: row_to_book(archive.read(v, s, "book"), row)
+        for v, s in (("drift", "SOL-PERP"), ("hyperliquid", "SOL"))
+    }
+    funding = {
+        v: row_to_funding(archive.read(v, s, "funding"), row)
+        for v, s in (("drift", "SOL-PERP"), ("hyperliquid", "SOL"))
+    }
+    drift = StaticConnector(books["drift"], funding["drift"])
+    hyper = StaticConnector(books["hyperliquid"], funding["hyperliquid"])
+    with patch("strategies.base.ExecutionEngine", lambda a, b, c, clock=None: DummyEngine()):
+        strat = cls(PARAMS, drift=drift, hyper=hyper)
+    return await strat.find_opportunity()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "cls,signals", [(BasisStrategy, basis_signals), (FundingStrategy, funding_signals)]
+)
+async def test_vectorized_signals_match_strategies(archive, cls, signals):
+    data = load_market_data(archive, "SOL-PERP", "SOL")
+    sig = signals(data, PARAMS)
+    assert 0 < sig.enter.sum() < len(data)
+
+    for row in range(len(data)):
+        opp = await strategy_decision(cls, archive, row)
+        assert bool(sig.enter[row]) == (opp is not None), row
+        if opp:
+            assert (opp["long_exchange"] == "drift") == bool(sig.long_drift[row])
+            assert opp["long_price"] == pytest.approx(sig.long_price[row])
+            assert opp["short_price"] == pytest.approx(sig.short_price[row])
+            assert opp["profit"] == pytest.approx(sig.profit[row])
+
+
+def test_avg_fill_price_matches_level_walk():
+    px = np.array([[10.0, 11.0, np.nan], [10.0, np.nan, np.nan], [10.0, 11.0, 12.0]])
+    sz = np.array([[1.0, 5.0, np.nan], [np.nan, np.nan, np.nan], [0.0, 0.0, 0.0]])
+    assert list(avg_fill_price(px, sz, 2.0)) == [10.5, 10.0, 12.0]
+
+
+def test_trades_do_not_overlap_and_summary(archive, tmp_path):
+    data = load_market_data(archive, "SOL-PERP", "SOL")
+    result = run_backtest(data, PARAMS, "basis")
+    trades = result.trades
+
+    assert result.summary["trades"] == len(trades["pnl"]) > 0
+    assert np.all(trades["exit_ts"] - trades["entry_ts"] >= PARAMS["hold_time_sec"])
+    assert np.all(trades["entry_ts"][1:] >= trades["exit_ts"][:-1])
+    np.testing.assert_allclose(
+        trades["pnl"], trades["price_pnl"] + trades["funding_pnl"] - trades["fees"]
+    )
+    assert result.summary["total_pnl"] == pytest.approx(trades["pnl"].sum())
+
+    data.save(tmp_path / "grid")
+    loaded = MarketData.load(tmp_path / "grid")
+    assert isinstance(loaded.drift_bid_px, np.memmap)
+    again = run_backtest(loaded, PARAMS, "basis")
+    assert again.summary == result.summary
+
+
+def test_month_of_seconds_runs_quickly():
+    n = 30 * 24 * 3600
+    rng = np.random.default_rng(0)
+    mid = 100 + np.cumsum(rng.normal(0, 0.01, n))
+
+    def side(offset):
+        return (mid + offset)[:, None], np.ones((n, 1))
+
+    d_bid, d_bsz = side(-0.05)
+    d_ask, d_asz = side(0.05)
+    h_bid, h_bsz = side(-0.04 + rng.normal(0, 0.05, n))
+    h_ask, h_asz = side(0.04 + rng.normal(0, 0.05, n))
+    data = MarketData(
+        t=np.arange(n, dtype=float), drift_bid_px=d_bid, drift_bid_sz=d_bsz,
+        drift_ask_px=d_ask, drift_ask_sz=d_asz, hyper_bid_px=h_bid, hyper_bid_sz=h_bsz,
+        hyper_ask_px=h_ask, hyper_ask_sz=h_asz, rate_drift=np.zeros(n), rate_hyper=np.zeros(n),
+    )
+    start = time.perf_counter()
+    result = run_backtest(data, {**PARAMS, "hold_time_sec": 600, "amount": 1.0}, "basis")
+    assert time.perf_counter() - start < 10
+    assert result.summary["rows"] == n
@@ -0,0 +1,44 @@
+import json
+
+from benchmarks.__main__ import main
+from benchmarks.harness import compare, load_baseline, run_benchmarks, save_baseline
+
+
+def test_run_save_and_compare(tmp_path):
+    results = run_benchmarks("depth=1]", rounds=2, min_time=0.001)
+    assert set(results) == {"basis.find_opportunity[depth=1]", "funding.find_opportunity[depth=1]"}
+    assert all(r["median_us"] > 0 and r["ops_per_round"] >= 1 for r in results.values())
+
+    baseline = tmp_path / "baseline.json"
+    save_baseline(results, baseline)
+    assert load_baseline(baseline) == results
+
+    slower = {name: {**r, "median_us": r["median_us"] * 2} for name, r in results.items()}
+    comparison = compare(slower, load_baseline(baseline), threshold=0.25)
+    assert all(c["regressed"] and abs(c["change"] - 1.0) < 1e-9 for c in comparison.values())
+    assert compare(results, {}, 0.25)["basis.find_opportunity[depth=1]"] == {"change": None, "regressed": False}
+
+
+def test_cli_exit_code_flags_regressions(tmp_path, capsys):
+    baseline = tmp_path / "baseline.json"
+    args = ["-k", "logger.log_opportunity[sync]", "--rounds", "1", "--min-time", "0.001", "--baseline", str(baseline)]
+    assert main(args + ["--save"]) == 0
+    data = json.loads(baseline.read_text())
+    data["results"]["logger.log_opportunity[sync]"]["median_us"] = 1e-6
+    baseline.write_text(json.dumps(data))
+    assert main(args) == 1
+    assert "REGRESSED" in capsys.readouterr().out
+
+
+def test_load_harness_reports_throughput_and_io():
+    from benchmarks.load import LoadProfile, format_load_report, run_load
+
+    report = run_load(LoadProfile(markets=2, duration_sec=2.0, warmup_fraction=0.5, seed=3))
+
+    assert report["strategies"] == 4
+    assert report["simulated_sec"] == 1.0
+    assert report["ticks"] > 0 and report["ticks_per_sec"] > 0
+    assert report["eval_simulated_ms"]["p50"] > 0
+    assert report["io"]["files"]["storage/opportunities.jsonl"] > 0
+    assert report["io"]["writer_dropped"] == 0
+    assert "ticks:" in format_load_report(report)
@@ -0,0 +1,115 @@
+import asyncio
+import time
+
+import pytest
+
+from connectors.simulator import SimulatedVenue
+from execution.clock import Clock, VirtualClock, get_clock, set_clock
+from execution.engine import ExecutionEngine
+from execution.scheduler import ExecutionScheduler
+
+
+@pytest.mark.asyncio
+async def test_virtual_sleep_advances_instantly_in_order():
+    clock = VirtualClock(start=100.0)
+    woke = []
+
+    async def sleeper(delay):
+        await clock.sleep(delay)
+        woke.append((delay, clock.time()))
+
+    started = time.perf_counter()
+    await asyncio.gather(sleeper(3600), sleeper(5), sleeper(60))
+    assert time.perf_counter() - started < 1
+    assert woke == [(5, 105.0), (60, 160.0), (3600, 3700.0)]
+
+
+@pytest.mark.asyncio
+async def test_virtual_wait_for_times_out_and_passes_results():
+    clock = VirtualClock()
+    never = asyncio.get_running_loop().create_future()
+    with pytest.raises(asyncio.TimeoutError):
+        await clock.wait_for(never, 30)
+    assert clock.time() == 30
+    assert never.cancelled()
+
+    async def quick():
+        await clock.sleep(1)
+        return "done"
+
+    assert await clock.wait_for(quick(), 30) == "done"
+    assert clock.time() == 31
+
+
+@pytest.mark.asyncio
+async def test_virtual_wait_for_times_out_a_coroutine():
+    clock = VirtualClock()
+    stopped = []
+
+    async def slow():
+        try:
+            await clock.sleep(60)
+        finally:
+            stopped.append(clock.time())
+        return "late"
+
+    with pytest.raises(asyncio.TimeoutError):
+        await clock.wait_for(slow(), 10)
+    assert clock.time() == 10
+    assert stopped == [10]
+
+
+def test_default_clock_can_be_swapped():
+    virtual = VirtualClock()
+    previous = set_clock(virtual)
+    try:
+        assert get_clock() is virtual
+        assert ExecutionEngine(None, None, {}).clock is virtual
+    finally:
+        set_clock(previous)
+    assert isinstance(get_clock(), Clock)
+
+
+@pytest.mark.asyncio
+async def test_engine_timeout_runs_in_virtual_time(monkeypatch):
+    monkeypatch.setattr("execution.engine.log_trade", lambda *a, **k: None)
+    monkeypatch.setattr("execution.engine.log_event", lambda *a, **k: None)
+    clock = VirtualClock()
+    latency = {"kind": "lognormal", "mean_ms": 50, "sigma": 0.5}
+    # the drift book never reaches the sell limit, so that leg times out
+    hyper = SimulatedVenue({"mid": 100, "spread_bps": 2, "seed": 1, "latency": latency}, clock=clock)
+    drift = SimulatedVenue({"mid": 90, "spread_bps": 2, "seed": 2, "latency": latency}, clock=clock)
+    engine = ExecutionEngine(
+        hyper, drift, {"timeouts": {"order_submit_sec": 10}}, clock=clock
+    )
+
+    started = time.perf_counter()
+    ok = await engine.execute_pair_trade("SOL", "SOL-PERP", "buy", "sell", 1.0, 100.02, 100.0)
+
+    assert not ok
+    assert time.perf_counter() - started < 1
+    assert clock.time() >= 10
+    assert not drift.open_orders()
+    assert (await hyper.get_position("SOL"))["base_asset_amount"] == pytest.approx(0.0)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_expiry_uses_clock():
+    clock = VirtualClock()
+
+    class Engine:
+        pass
+
+    sched = ExecutionScheduler(Engine(), {"scheduler": {"max_wait_sec": 5}}, clock=clock)
+    release = asyncio.Event()
+
+    async def blocking():
+        await release.wait()
+        return True
+
+    first = asyncio.ensure_future(sched.submit(blocking, legs=[("drift", "SOL")]))
+    await asyncio.sleep(0)
+    assert await sched.submit(lambda: blocking(), legs=[("drift", "SOL")]) is False
+    assert clock.time() == 5
+    release.set()
+    assert await first
@@ -211,3 +211,151 @@ async def test_drift_ws_url_override(monkeypatch):
         assert drift_types.get_ws_url("anything") == "wss://foo"
     finally:
         drift_types.get_ws_url = original
+
+
+@pytest.mark.asyncio
+async def test_drift_place_orders_single_transaction(monkeypatch):
+    class DummyParams:
+        def __init__(self, **kw):
+            self.__dict__.update(kw)
+
+    class DummyDirection:
+        @staticmethod
+        def Long():
+            return "long"
+
+        @staticmethod
+        def Short():
+            return "short"
+
+    class DummyMarketType:
+        @staticmethod
+        def Perp():
+            return "perp"
+
+    class DummyOrderType:
+        MARKET = "market"
+
+    class DummyClient:
+        def __init__(self):
+            self.sent = []
+
+        def get_market_index_and_type(self, symbol):
+            return 0, None
+
+        def get_place_perp_order_ix(self, params):
+            return ("ix", params.direction, params.base_asset_amount)
+
+        async def send_ixs(self, ixs):
+            self.sent.append(ixs)
+            return type("Sig", (), {"tx_sig": "sig1"})()
+
+    monkeypatch.setattr("connectors.drift_connector.OrderParams", DummyParams)
+    monkeypatch.setattr("connectors.drift_connector.PositionDirection", DummyDirection)
+    monkeypatch.setattr("connectors.drift_connector.MarketType", DummyMarketType)
+    monkeypatch.setattr("connectors.drift_connector.OrderType", DummyOrderType)
+
+    conn = DriftConnector({"rpc_url": "http://one", "private_key": "key"})
+    conn.client = DummyClient()
+    ids = await conn.place_orders(
+        [
+            {"symbol": "SOL-PERP", "side": "buy", "amount": 1, "price": 10},
+            {"symbol": "SOL-PERP", "side": "sell", "amount": 2, "price": 11},
+        ]
+    )
+
+    assert ids == ["sig1", "sig1"]
+    assert len(conn.client.sent) == 1
+    assert [ix[1] for ix in conn.client.sent[0]] == ["long", "short"]
+
+
+@pytest.mark.asyncio
+async def test_drift_dlob_server_mode_skips_user_map(monkeypatch):
+    from connectors.dlob_http import DLOBHttpSource
+
+    monkeypatch.setattr(
+        "connectors.drift_connector.AsyncClient",
+        lambda url: DummyAsyncClient(url, ok=True),
+    )
+
+    def no_user_map(*a, **k):
+        raise AssertionError("UserMap must not be built in dlob_server mode")
+
+    monkeypatch.setattr("connectors.drift_connector.UserMap", no_user_map)
+    monkeypatch.setattr("connectors.drift_connector.DLOBSubscriber", no_user_map)
+
+    clients = []
+
+    class DummyDC:
+        def __init__(self, *a, **k):
+            self.kwargs = k
+            clients.append(self)
+
+        async def subscribe(self):
+            return None
+
+    monkeypatch.setattr("connectors.drift_connector.DriftClient", DummyDC)
+
+    class DummyKP:
+        @staticmethod
+        def from_base58_string(v):
+            return "kp"
+
+    monkeypatch.setattr("connectors.drift_connector.Keypair", DummyKP)
+
+    requests = []
+
+    class DummyResponse:
+        def raise_for_status(self):
+            return None
+
+        def json(self):
+            return {
+                "bids": [{"price": "10000000", "size": "2000000000"}, {"price": "9900000", "size": "1000000000"}],
+                "asks": [{"price": "11000000", "size": "500000000"}],
+                "slot": 7,
+            }
+
+    class DummyHttp:
+        async def get(self, url, params=None):
+            requests.append((url, params))
+            return DummyResponse()
+
+    monkeypatch.setattr(
+        "connectors.drift_connector.DLOBHttpSource",
+        lambda url, depth: DLOBHttpSource(url, depth=depth, client=DummyHttp()),
+    )
+
+    conn = DriftConnector(
+        {
+            "rpc_url": "http://one",
+            "private_key": "key",
+            "market_data": "dlob_server",
+            "dlob_url": "https://dlob.example/",
+            "dlob_depth": 5,
+            "perp_market_indexes": [0],
+        }
+    )
+    await conn.async_init()
+    assert "user_map_and_slot_subscribe" not in conn.init_timings
+    assert clients[0].kwargs["perp_market_indexes"] == [0]
+    assert clients[0].kwargs["spot_market_indexes"] == [0]
+
+    book = await conn.fetch_book("SOL-PERP")
+    assert book["bids"] == [{"price": 10.0, "size": 2.0}, {"price": 9.9, "size": 1.0}]
+    assert book["asks"] == [{"price": 11.0, "size": 0.5}]
+    assert requests == [
+        ("https://dlob.example/l2", {"marketName": "SOL-PERP", "depth": 5, "includeVamm": "true"})
+    ]
+    stats = conn.market_data_stats
+    assert stats["mode"] == "dlob_server"
+    assert 0 <= stats["init_sec"] <= stats["first_book_sec"]
+    assert stats["rss_at_first_book"] > 0
+
+
+def test_drift_dlob_server_mode_requires_url():
+    with pytest.raises(ValueError):
+        DriftConnector({"rpc_url": "http://one", "private_key": "key", "market_data": "other"})
+    conn = DriftConnector({"rpc_url": "http://one", "private_key": "key", "market_data": "dlob_server"})
+    with pytest.raises(RuntimeError):
+        asyncio.run(conn.async_init())
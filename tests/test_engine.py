@@ -72,3 +72,328 @@ async def test_slippage_alert(monkeypatch, caplog):
 
     assert success
     assert any("ALERT: Slippage exceeded" in r.message for r in caplog.records)
+
+
+class BatchingConnector(DummyExecConnector):
+    def __init__(self):
+        super().__init__(True)
+        self.single_calls = 0
+        self.batch_calls = []
+
+    async def place_order(self, symbol, side, amount, price):
+        self.single_calls += 1
+        return await super().place_order(symbol, side, amount, price)
+
+    async def place_orders(self, orders):
+        self.batch_calls.append(orders)
+        return [f"oid-{i}" for i, _ in enumerate(orders)]
+
+
+@pytest.mark.asyncio
+async def test_same_venue_orders_are_batched(monkeypatch):
+    conn = BatchingConnector()
+    engine = ExecutionEngine(conn, conn, {})
+
+    async def fake_wait_fill(*a, **k):
+        return True
+
+    monkeypatch.setattr(engine, "_wait_fill", fake_wait_fill)
+    monkeypatch.setattr("execution.engine.log_event", lambda *a, **k: None)
+    monkeypatch.setattr("execution.engine.log_trade", lambda *a, **k: None)
+
+    success = await engine.execute_pair_trade("A", "B", "buy", "sell", 1, 10, 11)
+
+    assert success
+    assert conn.single_calls == 0
+    assert len(conn.batch_calls) == 1
+    assert [o["symbol"] for o in conn.batch_calls[0]] == ["A", "B"]
+
+
+@pytest.mark.asyncio
+async def test_submit_orders_reports_ids_and_errors():
+    class FailingConnector(DummyExecConnector):
+        async def place_order(self, symbol, side, amount, price):
+            raise RuntimeError("rejected")
+
+    ok = DummyExecConnector(True)
+    bad = FailingConnector(True)
+    engine = ExecutionEngine(ok, bad, {})
+
+    order = {"symbol": "A", "side": "buy", "amount": 1, "price": 10}
+    ids, errors = await engine._submit_orders([(ok, order), (bad, order)])
+
+    assert ids == [1, None]
+    assert len(errors) == 1 and "rejected" in str(errors[0])
+
+
+class DepthConnector(DummyExecConnector):
+    def __init__(self, sizes, prices=(10,)):
+        super().__init__(True)
+        self.sizes = list(sizes)
+        self.prices = list(prices)
+
+    async def fetch_book(self, symbol: str):
+        size = self.sizes.pop(0) if len(self.sizes) > 1 else self.sizes[0]
+        price = self.prices.pop(0) if len(self.prices) > 1 else self.prices[0]
+        level = {"price": price, "size": size}
+        return {"bids": [level], "asks": [level]}
+
+
+@pytest.mark.asyncio
+async def test_sliced_execution_sizes_from_depth(monkeypatch):
+    conn_a = DepthConnector([4, 4, 4])
+    conn_b = DepthConnector([2, 2, 2])
+    engine = ExecutionEngine(
+        conn_a,
+        conn_b,
+        {"execution": {"depth_fraction": 0.5, "max_slices": 5, "slice_interval_sec": 0}},
+    )
+
+    calls = []
+
+    async def fake_pair_trade(*args, log_extra=None, **kwargs):
+        calls.append((args[4], log_extra))
+        return True
+
+    monkeypatch.setattr(engine, "execute_pair_trade", fake_pair_trade)
+    monkeypatch.setattr("execution.engine.log_event", lambda *a, **k: None)
+
+    success = await engine.execute_sliced_pair_trade("A", "B", "buy", "sell", 2.5, 10, 10)
+
+    assert success
+    assert [size for size, _ in calls] == [1, 1, 0.5]
+    assert [extra["slice"] for _, extra in calls] == [1, 2, 3]
+    assert calls[0][1]["depth_b"] == 2
+
+
+@pytest.mark.asyncio
+async def test_sliced_execution_reprices_and_caps_last_slice(monkeypatch):
+    conn_a = DepthConnector([2], prices=[10, 9.8])
+    conn_b = DepthConnector([2], prices=[11, 10.85])
+    engine = ExecutionEngine(
+        conn_a,
+        conn_b,
+        {
+            "max_slippage_bps": 100,
+            "execution": {"depth_fraction": 0.5, "max_slices": 2, "slice_interval_sec": 0},
+        },
+    )
+
+    calls = []
+
+    async def fake_pair_trade(*args, **kwargs):
+        calls.append(args[4:7])
+        return True
+
+    events = []
+    monkeypatch.setattr(engine, "execute_pair_trade", fake_pair_trade)
+    monkeypatch.setattr("execution.engine.log_event", events.append)
+
+    # the books only hold 2 per venue: the last slice does not take all 4 left,
+    # and the sell limit is held at 1% under the parent price of 11
+    assert not await engine.execute_sliced_pair_trade("A", "B", "buy", "sell", 5, 10, 11)
+    assert calls == [(1, 10, 11), (2, 9.8, pytest.approx(10.89))]
+    assert "partial: filled 3.0 of 5" in events[-1]
+
+
+@pytest.mark.asyncio
+async def test_sliced_execution_stops_when_spread_closes(monkeypatch):
+    conn_a = DepthConnector([1], prices=[10, 10.5])
+    conn_b = DepthConnector([1], prices=[11, 10.8])
+    engine = ExecutionEngine(
+        conn_a,
+        conn_b,
+        {"max_slippage_bps": 100, "execution": {"max_slices": 3, "slice_interval_sec": 0}},
+    )
+
+    calls = []
+
+    async def fake_pair_trade(*args, **kwargs):
+        calls.append(args[4:7])
+        return True
+
+    events = []
+    monkeypatch.setattr(engine, "execute_pair_trade", fake_pair_trade)
+    monkeypatch.setattr("execution.engine.log_event", events.append)
+
+    assert not await engine.execute_sliced_pair_trade("A", "B", "buy", "sell", 3, 10, 11)
+    assert calls == [(0.5, 10, 11)]
+    assert "spread moved" in events[-1]
+
+
+@pytest.mark.asyncio
+async def test_sliced_execution_sizes_from_venue_with_depth(monkeypatch):
+    # Hyperliquid impact prices carry no sizes; the other book sizes the slices
+    conn_a = DepthConnector([0])
+    conn_b = DepthConnector([2])
+    engine = ExecutionEngine(
+        conn_a,
+        conn_b,
+        {"execution": {"depth_fraction": 0.5, "max_slices": 5, "slice_interval_sec": 0}},
+    )
+
+    sizes = []
+
+    async def fake_pair_trade(*args, **kwargs):
+        sizes.append(args[4])
+        return True
+
+    monkeypatch.setattr(engine, "execute_pair_trade", fake_pair_trade)
+    monkeypatch.setattr("execution.engine.log_event", lambda *a, **k: None)
+
+    assert await engine.execute_sliced_pair_trade("A", "B", "buy", "sell", 2, 10, 10)
+    assert sizes == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_sliced_execution_stops_on_failed_slice(monkeypatch):
+    conn_a = DepthConnector([1])
+    conn_b = DepthConnector([1])
+    engine = ExecutionEngine(
+        conn_a, conn_b, {"execution": {"max_slices": 4, "slice_interval_sec": 0}}
+    )
+
+    results = iter([True, False, True])
+    sizes = []
+
+    async def fake_pair_trade(*args, **kwargs):
+        sizes.append(args[4])
+        return next(results)
+
+    monkeypatch.setattr(engine, "execute_pair_trade", fake_pair_trade)
+    monkeypatch.setattr("execution.engine.log_event", lambda *a, **k: None)
+
+    assert not await engine.execute_sliced_pair_trade("A", "B", "buy", "sell", 3, 10, 10)
+    assert len(sizes) == 2
+
+
+class FillingConnector(DummyExecConnector):
+    """Connector whose position follows the orders it accepts."""
+
+    def __init__(self, fills=True):
+        super().__init__(True)
+        self.fills = fills
+        self.orders = []
+        self.position = {"base_asset_amount": 0.0}
+
+    async def place_order(self, symbol, side, amount, price):
+        self.orders.append((side, amount, price))
+        if self.fills:
+            sign = 1 if side == "buy" else -1
+            self.position = {"base_asset_amount": self.position["base_asset_amount"] + sign * amount}
+        return await super().place_order(symbol, side, amount, price)
+
+
+@pytest.mark.asyncio
+async def test_partial_fill_is_unwound_without_safe_mode(monkeypatch):
+    conn_a = FillingConnector(fills=True)
+    conn_b = FillingConnector(fills=False)
+    engine = ExecutionEngine(
+        conn_a,
+        conn_b,
+        {"safe_mode": True, "timeouts": {"order_submit_sec": 0}, "execution": {"unwind_slippage_bps": 100}},
+    )
+    trades = []
+    monkeypatch.setattr("execution.engine.log_event", lambda *a, **k: None)
+    monkeypatch.setattr("execution.engine.log_trade", trades.append)
+
+    async def fake_wait_fill(fetch_position, symbol, side, amount, initial_pos):
+        pos = await fetch_position(symbol)
+        diff = pos["base_asset_amount"] - initial_pos["base_asset_amount"]
+        return diff >= amount if side == "buy" else diff <= -amount
+
+    monkeypatch.setattr(engine, "_wait_fill", fake_wait_fill)
+
+    success = await engine.execute_pair_trade("A", "B", "buy", "sell", 2, 10, 11)
+
+    assert not success
+    assert not engine.safe_mode_triggered
+    assert conn_a.orders[-1] == ("sell", 2, pytest.approx(9.9))
+    assert conn_a.position["base_asset_amount"] == 0
+    assert conn_b.cancelled == [1]
+    assert trades[-1]["event"] == "unwind" and trades[-1]["unwound"]
+    assert trades[-1]["flattened_a"] == 2 and trades[-1]["flattened_b"] == 0
+    # bought 2 at 10, flattened at the 9.9 limit
+    assert trades[-1]["pnl"] == pytest.approx(-0.2)
+    assert engine.risk.daily_pnl == pytest.approx(-0.2)
+
+
+@pytest.mark.asyncio
+async def test_unwind_prices_from_fresh_book_and_cancels_stuck_close(monkeypatch):
+    class MovedConnector(FillingConnector):
+        async def fetch_book(self, symbol):
+            return {"bids": [{"price": 9.5, "size": 5}], "asks": [{"price": 9.6, "size": 5}]}
+
+    conn = MovedConnector(fills=False)
+    conn.position = {"base_asset_amount": 2.0}
+    engine = ExecutionEngine(
+        conn,
+        DummyExecConnector(True),
+        {"timeouts": {"order_submit_sec": 0}, "execution": {"unwind_slippage_bps": 100}},
+    )
+    monkeypatch.setattr("execution.engine.log_event", lambda *a, **k: None)
+
+    flat, closed, pnl = await engine._unwind_leg(
+        conn, "hyperliquid", "A", "buy", 2, 10, None, {"base_asset_amount": 0.0}, True
+    )
+
+    # the close is priced off the 9.5 bid, not the planned 10, and is
+    # cancelled once it has not filled in time
+    assert conn.orders[-1] == ("sell", 2, pytest.approx(9.405))
+    assert conn.cancelled == [1]
+    assert (flat, closed, pnl) == (False, 0.0, 0.0)
+    assert engine.risk.net_delta[("hyperliquid", "A")] == 2
+
+
+@pytest.mark.asyncio
+async def test_seed_risk_loads_open_positions(monkeypatch):
+    conn_a = DummyExecConnector(True)
+    conn_a.position = {"position": {"coin": "A", "szi": "1.5", "entryPx": "10"}}
+    conn_b = DummyExecConnector(True)
+    conn_b.position = {"base_asset_amount": -1.5, "quote_asset_amount": 16.5}
+    engine = ExecutionEngine(conn_a, conn_b, {"risk": {"max_net_delta": 2}})
+
+    await engine.seed_risk("A", "B")
+
+    assert engine.risk.net_delta == {("hyperliquid", "A"): 1.5, ("drift", "B"): -1.5}
+    assert engine.risk.gross_notional == pytest.approx(15 + 16.5)
+    assert engine.risk.check([("hyperliquid", "A", "buy", 1, 10)]) is not None
+
+
+@pytest.mark.asyncio
+async def test_risk_rejection_blocks_orders(monkeypatch, caplog):
+    conn_a = DummyExecConnector(True)
+    conn_b = DummyExecConnector(True)
+    engine = ExecutionEngine(conn_a, conn_b, {"risk": {"max_net_delta": 1}})
+    monkeypatch.setattr("execution.engine.log_event", lambda *a, **k: None)
+
+    with caplog.at_level(logging.WARNING):
+        success = await engine.execute_pair_trade("A", "B", "buy", "sell", 2, 10, 11)
+
+    assert not success
+    assert conn_a.order_counter == 0 and conn_b.order_counter == 0
+    assert any("max_net_delta[hyperliquid:A]" in r.message for r in caplog.records)
+
+
+@pytest.mark.asyncio
+async def test_logging_failure_after_fill_does_not_unwind(monkeypatch, caplog):
+    conn_a = FillingConnector()
+    conn_b = FillingConnector()
+    engine = ExecutionEngine(conn_a, conn_b, {"safe_mode": True})
+    monkeypatch.setattr("execution.engine.log_event", lambda *a, **k: None)
+
+    def broken_log_trade(record):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("execution.engine.log_trade", broken_log_trade)
+
+    with caplog.at_level(logging.ERROR):
+        success = await engine.execute_pair_trade("A", "B", "buy", "sell", 2, 10, 11)
+
+    assert success
+    assert not engine.safe_mode_triggered
+    # no cancel and no flattening order: the hedge stays on
+    assert conn_a.orders == [("buy", 2, 10)] and conn_b.orders == [("sell", 2, 11)]
+    assert conn_a.cancelled == [] and conn_b.cancelled == []
+    assert engine.risk.snapshot()["net_delta"] == {("hyperliquid", "A"): 2, ("drift", "B"): -2}
+    assert any("post-trade logging failed" in r.message for r in caplog.records)
@@ -18,6 +18,20 @@ class DummyExchange:
     async def cancel(self, *a, **k):
         return {}
 
+    async def bulk_orders(self, requests):
+        self.bulk_requests = requests
+        return {
+            "response": {
+                "data": {
+                    "statuses": [
+                        {"resting": {"oid": 7}},
+                        {"filled": {"oid": 8, "totalSz": "1", "avgPx": "2"}},
+                        {"error": "insufficient margin"},
+                    ]
+                }
+            }
+        }
+
 
 @pytest.mark.asyncio
 async def test_hyperliquid_fetch_methods(monkeypatch):
@@ -36,3 +50,26 @@ async def test_hyperliquid_fetch_methods(monkeypatch):
     assert book['bids'][0]['price'] == 1.0
     assert funding['funding_rate'] == 0.03
 
+
+@pytest.mark.asyncio
+async def test_hyperliquid_bulk_orders(monkeypatch):
+    exchange = DummyExchange()
+    monkeypatch.setattr('connectors.hyperliquid_connector.Info', lambda *a, **k: DummyInfo())
+    monkeypatch.setattr('connectors.hyperliquid_connector.Exchange', lambda *a, **k: exchange)
+
+    class DummyAccount:
+        @staticmethod
+        def from_key(key):
+            return "acc"
+
+    monkeypatch.setattr('connectors.hyperliquid_connector.Account', DummyAccount)
+    conn = HyperliquidConnector({'api_key': 'k', 'account_address': '0x1', 'api_url': 'http://api'})
+    orders = [
+        {'symbol': 'SOL', 'side': 'buy', 'amount': 1, 'price': 2},
+        {'symbol': 'SOL', 'side': 'sell', 'amount': 1, 'price': 3},
+        {'symbol': 'ETH', 'side': 'buy', 'amount': 1, 'price': 4},
+    ]
+    oids = await conn.place_orders(orders)
+    assert oids == [7, 8, None]
+    assert [r['is_buy'] for r in exchange.bulk_requests] == [True, False, True]
+    assert exchange.bulk_requests[2]['coin'] == 'ETH'
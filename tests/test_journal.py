@@ -0,0 +1,148 @@
+import json
+import sqlite3
+
+from storage import logger
+from storage.journal import Journal
+
+
+def _trade(ts, market, side_a="buy", event=None, profit=1.0, strategy="basis"):
+    record = {
+        "timestamp": ts,
+        "symbol_a": "SOL",
+        "symbol_b": market,
+        "side_a": side_a,
+        "side_b": "sell" if side_a == "buy" else "buy",
+        "amount": 2.0,
+        "strategy": strategy,
+        "expected_profit": profit,
+    }
+    if event:
+        record["event"] = event
+    return record
+
+
+def test_writer_batches_and_queries_filter(tmp_path):
+    journal = Journal(tmp_path / "journal.db", batch_size=1000, flush_interval_sec=60)
+    journal.start()
+    journal.enqueue("trades", _trade("2024-05-01T10:00:00", "SOL-PERP"))
+    journal.enqueue("trades", _trade("2024-05-03T10:00:00", "SOL-PERP", side_a="sell", profit=3.0))
+    journal.enqueue("trades", _trade("2024-05-03T11:00:00", "SOL-PERP", event="unwind", profit=None))
+    journal.enqueue("trades", _trade("2024-05-03T12:00:00", "ETH-PERP", strategy="funding"))
+    journal.enqueue(
+        "opportunities",
+        {"timestamp": "2024-05-03T10:00:00", "market": "SOL-PERP", "long_exchange": "drift",
+         "short_exchange": "hyperliquid", "profit": 4.0},
+    )
+    journal.stop()
+    assert journal.stats()["rows_written"] == 5
+
+    week = {"start": "2024-05-02T00:00:00", "end": "2024-05-09T00:00:00"}
+    summary = journal.trade_summary(market="SOL-PERP", **week)
+    assert summary == {
+        "records": 2,
+        "trades": 1,
+        "unwinds": 1,
+        "volume": 2.0,
+        "expected_profit": 3.0,
+        "pnl": 0.0,
+    }
+    assert journal.trade_summary(strategy="funding")["trades"] == 1
+    trades = journal.trades(direction="long_drift_short_hyperliquid")
+    assert [t["timestamp"] for t in trades] == ["2024-05-03T10:00:00"]
+    counts = journal.opportunity_counts("direction")
+    assert counts == {
+        "long_drift_short_hyperliquid": {"count": 1, "total_profit": 4.0, "avg_profit": 4.0}
+    }
+
+    conn = sqlite3.connect(str(tmp_path / "journal.db"))
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    plan = conn.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM trades WHERE market = ? AND ts >= ?", ("SOL-PERP", 0)
+    ).fetchall()
+    assert any("trades_market_ts" in row[-1] for row in plan)
+
+
+def test_import_jsonl(tmp_path):
+    trades = tmp_path / "trades.jsonl"
+    trades.write_text(
+        "\n".join(json.dumps(_trade(f"2024-05-0{i}T00:00:00", "SOL-PERP")) for i in range(1, 6))
+        + "\nnot json\n"
+    )
+    opps = tmp_path / "opportunities.jsonl"
+    opps.write_text(json.dumps({"timestamp": "2024-05-01T00:00:00", "profit": 1}) + "\n")
+
+    journal = Journal(tmp_path / "journal.db")
+    assert journal.import_jsonl(trades, batch_size=2) == 5
+    assert journal.import_jsonl(opps) == 1
+    assert journal.trade_summary()["trades"] == 5
+    assert journal.opportunity_counts("market") == {
+        None: {"count": 1, "total_profit": 1.0, "avg_profit": 1.0}
+    }
+
+
+def test_log_functions_feed_journal(tmp_path):
+    db = tmp_path / "journal.db"
+    logger.start_journal({"journal": {"enabled": True, "path": str(db), "jsonl": False}})
+    try:
+        logger.log_trade({"amount": 1, "market": "SOL-PERP"}, file_path=tmp_path / "trades.jsonl")
+        logger.log_opportunity({"profit": 2.5}, file_path=tmp_path / "opps.jsonl")
+    finally:
+        logger.stop_journal()
+
+    assert not (tmp_path / "trades.jsonl").exists()
+    journal = Journal(db)
+    assert journal.trade_summary(market="SOL-PERP")["trades"] == 1
+    assert journal.opportunity_counts("type") == {
+        None: {"count": 1, "total_profit": 2.5, "avg_profit": 2.5}
+    }
+
+
+def test_reimport_is_idempotent(tmp_path):
+    trades = tmp_path / "trades.jsonl"
+    trades.write_text(
+        "\n".join(json.dumps(_trade(f"2024-05-0{i}T00:00:00", "SOL-PERP")) for i in range(1, 4))
+    )
+
+    journal = Journal(tmp_path / "journal.db")
+    assert journal.import_jsonl(trades) == 3
+    assert journal.import_jsonl(trades) == 0
+    assert journal.trade_summary()["records"] == 3
+
+    # the live writer skips records that were imported already
+    journal.start()
+    journal.enqueue("trades", _trade("2024-05-01T00:00:00", "SOL-PERP"))
+    journal.enqueue("trades", _trade("2024-05-04T00:00:00", "SOL-PERP"))
+    journal.stop()
+    assert journal.stats()["rows_written"] == 1
+    assert journal.trade_summary()["records"] == 4
+
+
+def test_bad_record_does_not_lose_its_batch(tmp_path):
+    journal = Journal(tmp_path / "journal.db", batch_size=1000, flush_interval_sec=60)
+    journal.start()
+    journal.enqueue("trades", {**_trade("2024-05-01T00:00:00", "SOL-PERP"), "pnl": 1.5})
+    journal.enqueue("trades", _trade("not a timestamp", "SOL-PERP"))
+    journal.enqueue("trades", {**_trade("2024-05-02T00:00:00", "SOL-PERP"), "order": object()})
+    journal.enqueue("trades", {**_trade("2024-05-03T00:00:00", "SOL-PERP"), "pnl": -0.5})
+    journal.stop()
+
+    assert journal.stats() == {"queue_depth": 0, "dropped": 0, "skipped": 2, "rows_written": 2}
+    assert journal.trade_summary()["pnl"] == 1.0
+
+
+def test_journal_without_key_column_is_migrated(tmp_path):
+    db = tmp_path / "journal.db"
+    conn = sqlite3.connect(str(db))
+    conn.execute(
+        "CREATE TABLE trades (id INTEGER PRIMARY KEY, ts REAL NOT NULL, strategy TEXT,"
+        " market TEXT, direction TEXT, event TEXT NOT NULL, amount REAL,"
+        " expected_profit REAL, pnl REAL, data TEXT NOT NULL)"
+    )
+    conn.commit()
+    conn.close()
+
+    journal = Journal(db)
+    trades = tmp_path / "trades.jsonl"
+    trades.write_text(json.dumps(_trade("2024-05-01T00:00:00", "SOL-PERP")) + "\n")
+    assert journal.import_jsonl(trades) == 1
+    assert journal.import_jsonl(trades) == 0
@@ -0,0 +1,88 @@
+import json
+import threading
+import time
+
+from storage import logger
+from storage.logger import BatchedWriter
+
+
+def test_writer_batches_and_drains_on_stop(tmp_path):
+    writer = BatchedWriter(batch_size=1000, flush_interval_sec=60)
+    writer.start()
+    path = tmp_path / "nested" / "trades.jsonl"
+    for i in range(5):
+        assert writer.enqueue(path, json.dumps({"i": i}) + "\n")
+
+    writer.stop()
+
+    lines = path.read_text().splitlines()
+    assert [json.loads(line)["i"] for line in lines] == [0, 1, 2, 3, 4]
+    assert writer.stats()["lines_written"] == 5
+    assert writer.stats()["dropped"] == 0
+
+
+def test_writer_drops_when_queue_full(tmp_path):
+    writer = BatchedWriter(max_queue=2)
+    path = tmp_path / "events.log"
+    results = [writer.enqueue(path, "x\n") for _ in range(4)]
+
+    assert results == [True, True, False, False]
+    assert writer.stats() == {
+        "queue_depth": 2,
+        "dropped": 2,
+        "lines_written": 0,
+        "bytes_written": 0,
+    }
+
+
+def test_log_functions_use_background_writer(tmp_path):
+    logger.start_writer({"storage": {"flush_interval_sec": 60}})
+    try:
+        logger.log_event("hello", file_path=tmp_path / "events.log")
+        logger.log_trade({"amount": 1}, file_path=tmp_path / "trades.jsonl")
+        assert logger.writer_stats()["lines_written"] == 0
+    finally:
+        logger.stop_writer()
+
+    assert (tmp_path / "events.log").read_text().endswith(" hello\n")
+    assert json.loads((tmp_path / "trades.jsonl").read_text())["amount"] == 1
+
+
+def test_stop_does_not_block_on_full_queue(tmp_path):
+    writer = BatchedWriter(max_queue=2, batch_size=1)
+    gate = threading.Event()
+    flush = writer._flush
+
+    def slow_flush(pending):
+        gate.wait(5)
+        flush(pending)
+
+    writer._flush = slow_flush
+    writer.start()
+    path = tmp_path / "events.log"
+    writer.enqueue(path, "a\n")
+    while writer.stats()["queue_depth"]:
+        time.sleep(0.001)
+    assert writer.enqueue(path, "b\n") and writer.enqueue(path, "c\n")
+
+    started = time.monotonic()
+    writer.stop(timeout=0.05)
+    assert time.monotonic() - started < 1
+    # still draining: kept so that the next stop can wait for it
+    assert writer._thread is not None and writer._thread.is_alive()
+
+    gate.set()
+    writer.stop(timeout=5)
+    assert writer._thread is None
+    assert path.read_text() == "a\nb\nc\n"
+
+
+def test_writer_exit_hook_registered_once(monkeypatch):
+    registered = []
+    monkeypatch.setattr(logger, "_exit_hooks", set())
+    monkeypatch.setattr(logger.atexit, "register", registered.append)
+    for _ in range(2):
+        logger.start_writer({})
+        logger.stop_writer()
+
+    assert registered == [logger.stop_writer]
@@ -0,0 +1,230 @@
+import asyncio
+
+import pytest
+
+from connectors.base import ConnectorBase
+from monitoring import InstrumentedConnector, MetricsServer, Registry, register_bot_metrics
+from monitoring.metrics import REGISTRY, Histogram
+
+
+class Venue(ConnectorBase):
+    def __init__(self):
+        super().__init__({})
+
+    async def fetch_book(self, symbol):
+        return {"bids": [], "asks": []}
+
+    async def fetch_funding(self, symbol):
+        raise RuntimeError("down")
+
+    async def place_order(self, symbol, side, amount, price):
+        return 1
+
+    async def cancel_order(self, order_id):
+        return None
+
+    async def get_position(self, symbol):
+        return {}
+
+
+def test_histogram_buckets_and_render():
+    registry = Registry()
+    family = registry.histogram("call_seconds", "Calls", ("venue",), buckets=(0.1, 1.0))
+    hist = family.labels("drift")
+    for value in (0.05, 0.1, 0.5, 3.0):
+        hist.observe(value)
+    assert hist.counts == [2, 1, 1]
+    assert hist.quantile(0.5) == 0.1
+
+    registry.gauge("queue_depth", "Depth", lambda: 3)
+    registry.gauge("load", "Load", lambda: {"drift": 1, "hyper\"liquid": 2}, ("venue",))
+    text = registry.render()
+    assert '# TYPE call_seconds histogram' in text
+    assert 'call_seconds_bucket{venue="drift",le="0.1"} 2' in text
+    assert 'call_seconds_bucket{venue="drift",le="1.0"} 3' in text
+    assert 'call_seconds_bucket{venue="drift",le="+Inf"} 4' in text
+    assert 'call_seconds_count{venue="drift"} 4' in text
+    assert "queue_depth 3.0" in text
+    assert 'load{venue="hyper\\"liquid"} 2.0' in text
+
+    with pytest.raises(ValueError):
+        family.labels("a", "b")
+
+
+@pytest.mark.asyncio
+async def test_instrumented_connector_times_calls():
+    registry = Registry()
+    conn = InstrumentedConnector(Venue(), "drift", registry)
+    await conn.fetch_book("SOL")
+    await conn.fetch_book("SOL")
+    with pytest.raises(RuntimeError):
+        await conn.fetch_funding("SOL")
+
+    family = registry.histogram("connector_call_seconds", "")
+    children = family.children()
+    assert children[("drift", "fetch_book", "ok")].count == 2
+    assert children[("drift", "fetch_funding", "error")].count == 1
+    assert children[("drift", "place_order", "ok")].count == 0
+
+
+@pytest.mark.asyncio
+async def test_metrics_server_serves_registry():
+    registry = Registry()
+    registry.gauge("up", "Up", lambda: 1)
+    server = MetricsServer(registry, port=0)
+    await server.start()
+    try:
+        async def get(path):
+            reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+            writer.write(f"GET {path} HTTP/1.1\r\nHost: x\r\n\r\n".encode())
+            await writer.drain()
+            data = await reader.read()
+            writer.close()
+            return data.decode()
+
+        body = await get("/metrics")
+        assert body.startswith("HTTP/1.1 200 OK")
+        assert "up 1.0" in body
+        assert (await get("/nope")).startswith("HTTP/1.1 404")
+    finally:
+        await server.stop()
+
+
+def test_bot_metrics_and_engine_phases(monkeypatch):
+    from execution.engine import ExecutionEngine
+
+    monkeypatch.setattr("execution.engine.log_trade", lambda *a, **k: None)
+    monkeypatch.setattr("execution.engine.log_event", lambda *a, **k: None)
+    engine = ExecutionEngine(Venue(), Venue(), {"risk": {"max_net_delta": 0.5}})
+    assert not asyncio.run(engine.execute_pair_trade("A", "B", "buy", "sell", 1, 10, 10))
+
+    registry = Registry()
+    register_bot_metrics(engine, registry=registry)
+    text = registry.render()
+    assert "engine_safe_mode_triggered 0.0" in text
+    assert 'storage_writer{stat="dropped"}' in text
+    assert "risk_open_orders 0.0" in text
+
+    phases = REGISTRY.histogram("execution_phase_seconds", "").children()
+    assert phases[("risk_check",)].count >= 1
+    assert REGISTRY.histogram("execution_seconds", "").children()[("rejected",)].count >= 1
+    assert isinstance(phases[("risk_check",)], Histogram)
+
+
+@pytest.mark.asyncio
+async def test_loop_lag_monitor_captures_blocking_stack(tmp_path):
+    import time
+
+    from monitoring import LoopLagMonitor
+
+    registry = Registry()
+    monitor = LoopLagMonitor(
+        interval_sec=0.01, threshold_sec=0.05, stall_file=tmp_path / "stalls.log", registry=registry
+    )
+
+    def blocking_call():
+        time.sleep(0.2)
+
+    monitor.start()
+    try:
+        await asyncio.sleep(0.03)
+        blocking_call()
+        await asyncio.sleep(0.03)
+    finally:
+        await monitor.stop()
+
+    assert monitor.stall_count == 1
+    assert "blocking_call" in monitor.stalls[0]["stack"]
+    assert monitor.max_lag >= 0.1
+    assert "blocking_call" in (tmp_path / "stalls.log").read_text()
+    assert "event_loop_stalls 1.0" in registry.render()
+    assert 'event_loop_lag_seconds_bucket{le="0.25"}' in registry.render()
+
+
+def test_sampling_profiler_writes_collapsed_stacks(tmp_path):
+    import time
+
+    from monitoring import SamplingProfiler
+
+    profiler = SamplingProfiler(interval_sec=0.002, output_dir=tmp_path)
+
+    def hot_loop():
+        end = time.perf_counter() + 0.15
+        while time.perf_counter() < end:
+            pass
+
+    assert profiler.start(duration_sec=10)
+    assert not profiler.start()
+    hot_loop()
+    path = profiler.stop()
+
+    assert not profiler.running
+    lines = path.read_text().splitlines()
+    stack, count = lines[0].rsplit(" ", 1)
+    assert stack.startswith("MainThread;") and "hot_loop (test_monitoring.py:" in stack
+    assert int(count) > 10
+
+
+@pytest.mark.asyncio
+async def test_profiler_signal_and_routes(tmp_path):
+    import os
+    import signal
+
+    from monitoring import SamplingProfiler, add_profiler_routes, install_signal_toggle
+
+    profiler = SamplingProfiler(interval_sec=0.005, output_dir=tmp_path)
+    assert install_signal_toggle(profiler)
+    try:
+        os.kill(os.getpid(), signal.SIGUSR1)
+        await asyncio.sleep(0.05)
+        assert profiler.running
+        os.kill(os.getpid(), signal.SIGUSR1)
+        await asyncio.sleep(0.05)
+        await asyncio.to_thread(profiler.stop)
+        assert not profiler.running and profiler.last_output.exists()
+    finally:
+        asyncio.get_running_loop().remove_signal_handler(signal.SIGUSR1)
+
+    server = MetricsServer(Registry(), port=0)
+    add_profiler_routes(server, profiler)
+    assert (await server._dispatch("GET /profile/start?seconds=5 HTTP/1.1"))[0] == 200
+    assert (await server._dispatch("GET /profile/start HTTP/1.1"))[0] == 409
+    assert (await server._dispatch("GET /profile/start?seconds=x HTTP/1.1"))[0] == 400
+    status, ctype, body = await server._dispatch("GET /profile/stop HTTP/1.1")
+    assert status == 200 and ctype == "application/json"
+    assert '"running": false' in body
+
+
+@pytest.mark.asyncio
+async def test_live_connectors_initialize_concurrently(monkeypatch):
+    import time
+
+    import cli
+    from monitoring import StartupTimer
+
+    class SlowVenue(Venue):
+        def __init__(self, config):
+            super().__init__()
+            self.init_timings = {"subscribe": 0.1}
+
+        async def async_init(self):
+            await asyncio.sleep(0.1)
+
+    monkeypatch.setattr("connectors.DriftConnector", SlowVenue, raising=False)
+    monkeypatch.setattr("connectors.HyperliquidConnector", SlowVenue, raising=False)
+
+    startup = StartupTimer()
+    start = time.perf_counter()
+    drift, hyper = await cli._live_connectors({}, startup)
+    assert time.perf_counter() - start < 0.19
+    assert isinstance(drift, SlowVenue) and isinstance(hyper, SlowVenue)
+
+    durations = startup.durations()
+    assert {"drift_init", "hyperliquid_init", "connectors", "drift_init.subscribe"} <= set(durations)
+    assert durations["connectors"] < durations["drift_init"] + durations["hyperliquid_init"]
+    assert "first_tick" not in durations
+    startup.first_tick()
+    first = startup.first_tick_sec
+    startup.first_tick()
+    assert startup.first_tick_sec == first >= durations["connectors"]
+    assert "first tick after" in startup.format()
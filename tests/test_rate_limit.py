@@ -0,0 +1,115 @@
+import asyncio
+
+import pytest
+
+from connectors.base import ConnectorBase
+from connectors.rate_limit import MARKET_DATA, ORDER, RateLimitedConnector, TokenBucket
+from execution.clock import VirtualClock
+from monitoring.collectors import register_rate_limit_metrics
+from monitoring.metrics import Registry
+
+
+class Venue(ConnectorBase):
+    REQUEST_WEIGHTS = {"fetch_book": 4, "fetch_funding": 0, "place_order": 1, "get_position": 2}
+
+    def __init__(self, clock):
+        super().__init__({})
+        self.clock = clock
+        self.calls = []
+
+    async def fetch_book(self, symbol):
+        self.calls.append(("fetch_book", symbol, self.clock.time()))
+        await self.clock.sleep(0.1)
+        return {"bids": [{"price": 1.0, "size": 1.0}], "asks": []}
+
+    async def fetch_funding(self, symbol):
+        self.calls.append(("fetch_funding", symbol, self.clock.time()))
+        return {"funding_rate": 0.0}
+
+    async def place_order(self, symbol, side, amount, price):
+        self.calls.append(("place_order", symbol, self.clock.time()))
+        return "oid"
+
+    async def cancel_order(self, order_id):
+        self.calls.append(("cancel_order", order_id, self.clock.time()))
+
+    async def get_position(self, symbol):
+        self.calls.append(("get_position", symbol, self.clock.time()))
+        return {}
+
+
+@pytest.mark.asyncio
+async def test_bucket_serves_orders_before_queued_market_data():
+    clock = VirtualClock()
+    bucket = TokenBucket(10, 1, reserve=2, clock=clock)
+    served = []
+
+    async def take(name, weight, priority, delay=0.0):
+        await clock.sleep(delay)
+        waited = await bucket.acquire(weight, priority)
+        served.append((name, clock.time(), waited))
+
+    await take("drain", 10, ORDER)
+    await asyncio.gather(
+        take("book", 3, MARKET_DATA),
+        take("order", 3, ORDER, delay=1),
+    )
+
+    # the order arrived a second later but went first, without the reserve
+    assert [s[0] for s in served] == ["drain", "order", "book"]
+    assert served[1][1] == pytest.approx(3)
+    # the book then needed 3 tokens plus the 2 reserved for orders
+    assert served[2][1] == pytest.approx(8)
+    assert bucket.queued() == {"order": 0, "market_data": 0}
+
+
+@pytest.mark.asyncio
+async def test_identical_market_data_requests_are_coalesced():
+    clock = VirtualClock()
+    venue = Venue(clock)
+    conn = RateLimitedConnector(venue, "v", TokenBucket(100, 10, clock=clock))
+
+    books = await asyncio.gather(*(conn.fetch_book("SOL") for _ in range(3)), conn.fetch_book("ETH"))
+    assert books[0] is books[1] is books[2]
+    assert [c[:2] for c in venue.calls] == [("fetch_book", "SOL"), ("fetch_book", "ETH")]
+
+    # once answered, the next poll is a new request
+    await conn.fetch_book("SOL")
+    assert len(venue.calls) == 3
+    md = conn.usage()["classes"]["market_data"]
+    assert md["requests"] == 3 and md["weight"] == 12 and md["coalesced"] == 2
+
+
+@pytest.mark.asyncio
+async def test_connector_weights_overrides_and_metrics():
+    clock = VirtualClock()
+    venue = Venue(clock)
+    conn = RateLimitedConnector.from_config(
+        venue,
+        "v",
+        {"rate_limits": {"v": {"capacity": 8, "refill_per_sec": 2, "reserve_fraction": 0.25, "weights": {"get_position": 4}}}},
+        clock=clock,
+    )
+    assert conn.bucket.reserve == 2
+
+    # zero weight calls pass straight through
+    await conn.fetch_funding("SOL")
+    await conn.get_position("SOL")
+    await conn.place_order("SOL", "buy", 1, 1)
+    await conn.cancel_order("oid")
+    usage = conn.usage()
+    assert usage["classes"]["order"]["weight"] == 4 + 1 + 1
+    assert usage["classes"]["market_data"]["requests"] == 0
+    assert usage["tokens"] == pytest.approx(2)
+
+    # 4 for the book plus 2 in reserve: waits for 4 tokens at 2 per second
+    start = clock.time()
+    await conn.fetch_book("SOL")
+    assert venue.calls[-1][2] - start == pytest.approx(2)
+
+    registry = Registry()
+    register_rate_limit_metrics({"v": conn}, registry)
+    text = registry.render()
+    assert 'rate_limit_capacity{venue="v"} 8' in text
+    assert 'rate_limit_weight{venue="v",class="order"} 6' in text
+    assert 'rate_limit_wait_seconds{venue="v",class="market_data"} 2' in text
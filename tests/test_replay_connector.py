@@ -0,0 +1,110 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from connectors.base import ConnectorBase
+from connectors.recording import RecordingConnector
+from connectors.replay_connector import ReplayConnector, ReplayFinished, ReplayPacer
+from storage.ticks import TickArchive, TickRecorder
+from strategies.basis import BasisStrategy
+
+
+class MovingConnector(ConnectorBase):
+    """Connector whose book drifts a little on every call."""
+
+    def __init__(self, base, step):
+        super().__init__({})
+        self.price = base
+        self.step = step
+
+    async def fetch_book(self, symbol):
+        self.price += self.step
+        return {
+            "bids": [{"price": self.price - 0.5, "size": 3.0}, {"price": self.price - 1, "size": 10.0}],
+            "asks": [{"price": self.price + 0.5, "size": 3.0}, {"price": self.price + 1, "size": 10.0}],
+        }
+
+    async def fetch_funding(self, symbol):
+        return {"funding_rate": str(self.price / 1e6)}
+
+    async def place_order(self, symbol, side, amount, price):
+        return 1
+
+    async def cancel_order(self, order_id):
+        pass
+
+    async def get_position(self, symbol):
+        return {"base_asset_amount": 0}
+
+
+class DummyEngine:
+    def __init__(self, *a, **kw):
+        pass
+
+
+def make_basis(drift, hyper):
+    config = {
+        "market": "TEST",
+        "amount": 5.0,
+        "max_slippage_bps": 100,
+        "min_profit_usd": 0.1,
+        "fees": {"drift": 0.0001, "hyperliquid": 0.0001},
+        "drift": {"market": "SOL-PERP"},
+        "hyperliquid": {"market": "SOL"},
+    }
+    with patch("strategies.base.ExecutionEngine", lambda a, b, c, clock=None: DummyEngine()):
+        return BasisStrategy(config, drift=drift, hyper=hyper)
+
+
+@pytest.mark.asyncio
+async def test_replay_reproduces_recorded_decisions(tmp_path):
+    recorder = TickRecorder(tmp_path, levels=3)
+    live = make_basis(
+        RecordingConnector(MovingConnector(100.0, 0.37), recorder, "drift"),
+        RecordingConnector(MovingConnector(101.0, 0.11), recorder, "hyperliquid"),
+    )
+    recorded = [await live.find_opportunity() for _ in range(20)]
+    recorder.close()
+    assert any(recorded) and not all(recorded)
+
+    archive = TickArchive(tmp_path)
+    replay = make_basis(
+        ReplayConnector(archive, "drift"), ReplayConnector(archive, "hyperliquid")
+    )
+    replayed = [await replay.find_opportunity() for _ in range(20)]
+
+    assert replayed == recorded
+    with pytest.raises(ReplayFinished):
+        await replay.find_opportunity()
+
+
+@pytest.mark.asyncio
+async def test_replay_pacing_scales_recorded_time(tmp_path):
+    recorder = TickRecorder(tmp_path)
+    for i in range(3):
+        recorder.record_funding("drift", "SOL-PERP", {"last_funding_rate": i}, ts=1_000_000 + i)
+    recorder.close()
+
+    conn = ReplayConnector(
+        TickArchive(tmp_path), "drift", pacer=ReplayPacer(speed=20)
+    )
+    loop = asyncio.get_running_loop()
+    t0 = loop.time()
+    rates = [(await conn.fetch_funding("SOL-PERP"))["last_funding_rate"] for _ in range(3)]
+    elapsed = loop.time() - t0
+
+    assert rates == [0.0, 1.0, 2.0]
+    assert 0.09 <= elapsed < 0.5
+
+
+@pytest.mark.asyncio
+async def test_replay_orders_update_positions(tmp_path):
+    conn = ReplayConnector(TickArchive(tmp_path), "drift")
+    await conn.place_order("SOL-PERP", "buy", 2, 10)
+    await conn.place_order("SOL-PERP", "sell", 0.5, 12)
+
+    assert await conn.get_position("SOL-PERP") == {
+        "base_asset_amount": 1.5,
+        "quote_asset_amount": -14.0,
+    }
@@ -0,0 +1,106 @@
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from storage.offset_index import OffsetIndex, iter_records, parse_ts
+from storage.report import Histogram, build_report, format_report, slippage_bps
+
+T0 = datetime(2024, 5, 1)
+
+
+def _write(path, records):
+    with path.open("a") as f:
+        for rec in records:
+            f.write(json.dumps(rec) + "\n")
+
+
+def _ts(minutes):
+    return (T0 + timedelta(minutes=minutes)).isoformat()
+
+
+def test_offset_index_seeks_and_extends(tmp_path):
+    log = tmp_path / "trades.jsonl"
+    _write(log, [{"timestamp": _ts(i), "i": i} for i in range(500)])
+
+    index = OffsetIndex(log, every_bytes=1000)
+    index.update()
+    assert index.path.exists()
+    assert len(index.ts) > 10
+
+    offset = index.seek_offset(parse_ts(_ts(300)))
+    assert 0 < offset < log.stat().st_size
+    with log.open("rb") as f:
+        f.seek(offset)
+        assert json.loads(f.readline())["i"] <= 300
+
+    # appending extends the saved index without rereading the whole file
+    _write(log, [{"timestamp": _ts(i), "i": i} for i in range(500, 600)])
+    reloaded = OffsetIndex(log)
+    before = reloaded.indexed_bytes
+    reloaded.update()
+    assert reloaded.indexed_bytes > before
+    assert reloaded.every_bytes == 1000
+
+    records = list(iter_records(log, parse_ts(_ts(550)), parse_ts(_ts(560))))
+    assert [r["i"] for _, r in records] == list(range(550, 560))
+
+
+def test_slippage_sign():
+    assert slippage_bps("buy", 100, 100.1) == pytest.approx(10)
+    assert slippage_bps("sell", 100, 100.1) == pytest.approx(-10)
+    assert slippage_bps("buy", 100, None) is None
+
+
+def test_histogram_quantiles():
+    hist = Histogram(1.0)
+    for v in range(100):
+        hist.add(v / 10)
+    summary = hist.summary()
+    assert summary["count"] == 100
+    assert summary["p50"] == pytest.approx(5.0)
+    assert summary["max"] == pytest.approx(9.9)
+    assert sum(summary["bins"].values()) == 100
+
+
+def test_build_report(tmp_path):
+    trades = tmp_path / "trades.jsonl"
+    opps = tmp_path / "opportunities.jsonl"
+    _write(
+        trades,
+        [
+            {"timestamp": _ts(5), "side_a": "buy", "side_b": "sell", "amount": 1,
+             "price_a": 100, "exec_price_a": 100.1, "price_b": 101, "exec_price_b": 101},
+            {"timestamp": _ts(70), "side_a": "sell", "side_b": "buy", "amount": 2,
+             "price_a": 100, "exec_price_a": 100.2, "price_b": 99, "exec_price_b": None},
+            {"timestamp": _ts(80), "event": "unwind", "side_a": "buy", "amount": 2,
+             "price_a": 100, "exec_price_a": 200},
+        ],
+    )
+    _write(
+        opps,
+        [
+            {"timestamp": _ts(1), "type": "Price Arbitrage", "profit": 1.5},
+            {"timestamp": _ts(2), "type": "Price Arbitrage", "profit": 2.5},
+            {"timestamp": _ts(61), "type": "Funding Rate Arbitrage", "profit": 0.2},
+        ],
+    )
+
+    report = build_report(trades, opps, bucket_sec=3600)
+    assert report["trades"] == 2
+    assert report["unwinds"] == 1
+    assert report["volume"] == 3
+    leg_a = report["slippage_bps"]["leg_a"]
+    assert leg_a["count"] == 2
+    assert leg_a["min"] == pytest.approx(-20)
+    assert leg_a["max"] == pytest.approx(10)
+    assert report["slippage_bps"]["leg_b"]["count"] == 1
+    assert report["opportunities"]["Price Arbitrage"]["count"] == 2
+    assert [b["trades"] for b in report["buckets"]] == [1, 1]
+    assert [b["opportunities"] for b in report["buckets"]] == [2, 1]
+    assert report["buckets"][1]["unwinds"] == 1
+
+    later = build_report(trades, opps, start=parse_ts(_ts(60)))
+    assert later["trades"] == 1
+    assert list(later["opportunities"]) == ["Funding Rate Arbitrage"]
+    assert "slippage" in format_report(report)
@@ -0,0 +1,87 @@
+import pytest
+
+from execution.clock import VirtualClock
+from execution.risk import RiskEngine
+
+
+def test_limits_disabled_by_default():
+    risk = RiskEngine({})
+    assert risk.check([("drift", "SOL", "buy", 1e9, 1e9)]) is None
+
+
+def test_net_delta_limit_allows_reducing_exposure():
+    risk = RiskEngine({"risk": {"max_net_delta": 2}})
+    risk.on_fill("drift", "SOL", "buy", 2, 100)
+
+    assert risk.check([("drift", "SOL", "buy", 1, 100)]).startswith("max_net_delta[drift:SOL]")
+    assert risk.check([("drift", "SOL", "sell", 1, 100)]) is None
+    assert risk.check([("hyperliquid", "SOL", "sell", 2, 100)]) is None
+    # another symbol on the same venue has its own delta
+    assert risk.check([("drift", "BTC", "buy", 2, 100)]) is None
+
+
+def test_gross_notional_is_incremental():
+    risk = RiskEngine({"risk": {"max_gross_notional": 500}})
+    risk.on_fill("drift", "SOL", "buy", 2, 100)
+    risk.on_fill("hyperliquid", "SOL", "sell", 2, 100)
+    assert risk.gross_notional == 400
+
+    assert risk.check(
+        [("drift", "SOL", "buy", 1, 100), ("hyperliquid", "SOL", "sell", 1, 100)]
+    ).startswith("max_gross_notional")
+    risk.on_fill("drift", "SOL", "sell", 2, 100)
+    assert risk.gross_notional == 200
+    assert risk.check(
+        [("drift", "SOL", "buy", 1, 100), ("hyperliquid", "SOL", "buy", 1, 100)]
+    ) is None
+
+
+def test_symbols_are_marked_at_their_own_price():
+    risk = RiskEngine({})
+    risk.on_fill("drift", "SOL", "buy", 10, 100)
+    risk.on_fill("drift", "BTC", "buy", 1, 60000)
+    assert risk.gross_notional == 61000
+
+    risk.on_fill("drift", "SOL", "buy", 10, 110)
+    assert risk.net_delta == {("drift", "SOL"): 20, ("drift", "BTC"): 1}
+    assert risk.gross_notional == 20 * 110 + 60000
+
+
+def test_closing_fills_realize_pnl_against_average_entry():
+    risk = RiskEngine({})
+    risk.on_fill("drift", "SOL", "buy", 1, 100)
+    risk.on_fill("drift", "SOL", "buy", 1, 110)
+    assert risk.on_fill("drift", "SOL", "sell", 1, 120) == pytest.approx(15)
+    # flips short at 90: closes the last long unit, opens one short
+    assert risk.on_fill("drift", "SOL", "sell", 2, 90) == pytest.approx(-15)
+    assert risk.on_fill("drift", "SOL", "buy", 1, 80) == pytest.approx(10)
+    assert risk.net_delta[("drift", "SOL")] == 0
+    assert risk.daily_pnl == pytest.approx(10)
+
+
+def test_seeded_position_counts_against_limits():
+    risk = RiskEngine({"risk": {"max_net_delta": 2, "max_gross_notional": 500}})
+    risk.seed_position("drift", "SOL", -2, 100)
+    assert risk.gross_notional == 200
+    assert risk.check([("drift", "SOL", "sell", 1, 100)]).startswith("max_net_delta[drift:SOL]")
+
+    # closing the seeded short realizes against its entry
+    assert risk.on_fill("drift", "SOL", "buy", 2, 90) == pytest.approx(20)
+    assert risk.gross_notional == 0
+
+
+@pytest.mark.asyncio
+async def test_open_orders_and_daily_loss():
+    clock = VirtualClock()
+    risk = RiskEngine({"risk": {"max_open_orders": 2, "max_daily_loss_usd": 10}}, clock=clock)
+    risk.on_orders_opened(1)
+    assert risk.check(
+        [("drift", "SOL", "buy", 1, 1), ("hyperliquid", "SOL", "sell", 1, 1)]
+    ).startswith("max_open_orders")
+    risk.on_orders_closed(1)
+    risk.on_realized_pnl(-10)
+    assert risk.check([("drift", "SOL", "buy", 1, 1)]).startswith("max_daily_loss_usd")
+
+    # next UTC day on the engine's clock resets realized PnL
+    await clock.sleep(86400)
+    assert risk.check([("drift", "SOL", "buy", 1, 1)]) is None
@@ -0,0 +1,106 @@
+import gzip
+import json
+import logging
+
+import pytest
+
+from storage import logger
+from storage.rotation import (
+    RotatingCompressedFileHandler,
+    RotationManager,
+    RotationPolicy,
+    iter_log,
+    read_manifest,
+    segments,
+)
+
+
+@pytest.fixture
+def rotation():
+    def _configure(**cfg):
+        return logger.configure_rotation({"storage": {"rotation": cfg}})
+
+    yield _configure
+    logger.configure_rotation({})
+
+
+def test_size_rotation_compresses_and_reads_back(tmp_path, rotation):
+    manager = rotation(max_bytes=300)
+    path = tmp_path / "trades.jsonl"
+    for i in range(20):
+        logger.log_trade({"i": i}, file_path=path)
+    manager.wait()
+
+    entries = read_manifest(path)
+    assert len(entries) >= 3
+    assert all(e["compressed"] and e["file"].endswith(".jsonl.gz") for e in entries)
+    assert all(e["bytes"] >= 300 for e in entries)
+    first = gzip.open(tmp_path / entries[0]["file"]).read().decode()
+    assert json.loads(first.splitlines()[0])["i"] == 0
+    assert not list(tmp_path.glob("trades.*.jsonl"))
+
+    assert [r["i"] for _, r in iter_log(path)] == list(range(20))
+
+
+def test_interval_rotation_and_keep(tmp_path):
+    manager = RotationManager(RotationPolicy(interval_sec=60, compress=False, keep=2))
+    path = tmp_path / "events.log"
+    for n in range(4):
+        path.write_text(f"segment {n}\n")
+        assert not manager.due(path, path.stat().st_size, now=1000.0 + n * 100)
+        assert manager.due(path, path.stat().st_size, now=1000.0 + n * 100 + 60)
+        manager.rotate(path, now=1000.0 + n * 100 + 60)
+
+    entries = read_manifest(path)
+    assert [e["end"] for e in entries] == [1260.0, 1360.0]
+    assert sorted(p.name for p in tmp_path.glob("events.*.log")) == sorted(e["file"] for e in entries)
+
+
+def test_segments_selects_overlapping_range(tmp_path):
+    manager = RotationManager(RotationPolicy(max_bytes=1, compress=False))
+    path = tmp_path / "opportunities.jsonl"
+    for day in range(3):
+        path.write_text("{}\n")
+        manager.rotate(path, now=86400.0 * (day + 1))
+    path.write_text("{}\n")
+
+    names = [p.name for p in segments(path, start=86400.0 * 1.5, end=86400.0 * 1.9)]
+    assert len(names) == 1 and names[0].startswith("opportunities.19700103")
+    assert segments(path, start=86400.0 * 3.5)[-1] == path
+    assert len(segments(path)) == 4
+
+
+def test_background_writer_rotates(tmp_path, rotation):
+    manager = rotation(max_bytes=100)
+    logger.start_writer({"storage": {"batch_size": 1, "flush_interval_sec": 0.01}})
+    path = tmp_path / "events.log"
+    try:
+        for i in range(30):
+            logger.log_event(f"event {i}", file_path=path)
+    finally:
+        logger.stop_writer()
+    manager.wait()
+
+    lines = []
+    for entry in read_manifest(path):
+        lines += gzip.open(tmp_path / entry["file"]).read().decode().splitlines()
+    lines += path.read_text().splitlines()
+    assert [line.split(" ", 1)[1] for line in lines] == [f"event {i}" for i in range(30)]
+
+
+def test_logging_handler_rotates(tmp_path):
+    manager = RotationManager(RotationPolicy(max_bytes=200))
+    handler = RotatingCompressedFileHandler(str(tmp_path / "bot.log"), manager)
+    log = logging.getLogger("rotation-test")
+    log.addHandler(handler)
+    log.propagate = False
+    try:
+        for i in range(20):
+            log.warning("message number %d", i)
+    finally:
+        log.removeHandler(handler)
+        handler.close()
+    manager.wait()
+
+    assert len(read_manifest(tmp_path / "bot.log")) == 1
+    assert list(tmp_path.glob("bot.*.log.gz"))
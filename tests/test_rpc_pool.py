@@ -0,0 +1,246 @@
+import asyncio
+import sys
+import types
+
+import pytest
+
+from connectors import drift_connector
+from connectors.drift_connector import DriftConnector
+from connectors.rpc_pool import Endpoint, RpcPool
+from execution.clock import VirtualClock
+from monitoring.collectors import register_rpc_pool_metrics
+from monitoring.metrics import Registry
+
+
+class FakeRpc:
+    """AsyncClient stand-in; behaviour per URL is set in ``FakeRpc.hosts``."""
+
+    hosts = {}
+    created = []
+
+    def __init__(self, url):
+        self.url = url
+        self.closed = False
+        FakeRpc.created.append(url)
+
+    async def get_slot(self):
+        host = FakeRpc.hosts[self.url]
+        await asyncio.sleep(host.get("delay", 0))
+        host["calls"] = host.get("calls", 0) + 1
+        if host.get("down") or host["calls"] > host.get("ok_calls", float("inf")):
+            raise ConnectionError(f"{self.url} down")
+        return host.get("slot", 100)
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def rpc(monkeypatch):
+    FakeRpc.hosts = {}
+    FakeRpc.created = []
+    monkeypatch.setattr("connectors.drift_connector.AsyncClient", FakeRpc)
+
+    class DummyDC:
+        def __init__(self, conn, *a, **k):
+            self.connection = conn
+            self.unsubscribed = False
+
+        async def subscribe(self):
+            return None
+
+        async def unsubscribe(self):
+            self.unsubscribed = True
+
+    class DummyKP:
+        @staticmethod
+        def from_base58_string(v):
+            return "kp"
+
+    class DummySub:
+        async def subscribe(self):
+            return None
+
+    monkeypatch.setattr("connectors.drift_connector.DriftClient", DummyDC)
+    for name in ("UserMap", "SlotSubscriber", "DLOBSubscriber"):
+        monkeypatch.setattr(f"connectors.drift_connector.{name}", lambda *a, **k: DummySub())
+    for name in ("UserMapConfig", "WebsocketConfig", "DLOBClientConfig"):
+        monkeypatch.setattr(f"connectors.drift_connector.{name}", lambda *a, **k: object())
+    monkeypatch.setattr("connectors.drift_connector.Keypair", DummyKP)
+    return FakeRpc
+
+
+def _pool(**kw):
+    return RpcPool(
+        [Endpoint("http://a", index=0), Endpoint("http://b", index=1), Endpoint("http://c", index=2)],
+        client_factory=FakeRpc,
+        **kw,
+    )
+
+
+@pytest.mark.asyncio
+async def test_pool_ranks_by_latency_and_slot_lag(rpc):
+    rpc.hosts = {
+        "http://a": {"delay": 0.03, "slot": 1000},
+        "http://b": {"delay": 0.0, "slot": 900},
+        "http://c": {"delay": 0.01, "slot": 1000},
+    }
+    pool = _pool(max_slot_lag=50)
+    await pool.probe_all()
+
+    assert [e.url for e in pool.ranked()] == ["http://c", "http://a", "http://b"]
+    b = pool.endpoints[1]
+    assert b.slot_lag == 100 and not pool.healthy(b)
+
+    rpc.hosts["http://c"]["down"] = True
+    await pool.probe_all()
+    await pool.probe_all()
+    assert pool.best().url == "http://a"
+    assert pool.snapshot()["healthy"] == {"a": 1.0, "b": 0.0, "c": 0.0}
+
+    # clients are created once per endpoint and reused between rounds
+    assert sorted(rpc.created) == ["http://a", "http://b", "http://c"]
+
+
+def test_switch_target_needs_margin_unless_unhealthy():
+    pool = _pool(switch_margin=0.3)
+    a, b, c = pool.endpoints
+    a.latency_sec, b.latency_sec, c.latency_sec = 0.010, 0.008, 0.5
+    assert pool.switch_target(a) is None
+
+    b.latency_sec = 0.005
+    assert pool.switch_target(a) is b
+
+    a.latency_sec, b.latency_sec = 0.005, 0.010
+    a.slot_lag = 100
+    assert pool.switch_target(a) is b
+    assert pool.switch_target(None) is None
+
+
+def test_pool_from_config_names_endpoints_without_secrets():
+    pool = RpcPool.from_config(
+        {
+            "rpc_url": "https://main.example/?api-key=secret",
+            "ws_url": "wss://main.example/?api-key=secret",
+            "rpc_endpoints": [
+                "https://main.example/?api-key=secret",
+                {"rpc_url": "https://backup.example/", "name": "backup"},
+            ],
+            "rpc_pool": {"max_slot_lag": 10},
+        }
+    )
+    assert [e.name for e in pool.endpoints] == ["main.example", "backup"]
+    assert pool.endpoints[0].ws_url.startswith("wss://")
+    assert pool.max_slot_lag == 10
+
+
+def test_endpoints_on_one_host_get_unique_names():
+    pool = RpcPool.from_config(
+        {
+            "rpc_url": "https://main.example/?api-key=one",
+            "rpc_endpoints": [
+                "https://main.example/?api-key=two",
+                "https://main.example/?api-key=three",
+            ],
+        }
+    )
+    assert [e.name for e in pool.endpoints] == ["main.example", "main.example-1", "main.example-2"]
+    assert len(pool.snapshot()["healthy"]) == 3
+
+
+@pytest.mark.asyncio
+async def test_connect_fails_over_without_waiting(rpc):
+    # a answers the initial probe fastest, then refuses the connect
+    rpc.hosts = {"http://a": {"ok_calls": 1}, "http://b": {"delay": 0.02}}
+    conn = DriftConnector(
+        {
+            "rpc_url": "http://a",
+            "rpc_endpoints": [{"rpc_url": "http://b"}],
+            "private_key": "key",
+            "rpc_pool": {"probe_interval_sec": 0, "retry_delay_sec": 30},
+        }
+    )
+    await asyncio.wait_for(conn.async_init(), timeout=5)
+
+    a = conn.rpc_pool.endpoints[0]
+    assert a.errors == 1 and not conn.rpc_pool.healthy(a)
+    assert conn.rpc_pool.active.url == "http://b"
+    assert conn.connection.url == "http://b"
+    assert conn._monitor_task is None
+
+
+@pytest.mark.asyncio
+async def test_degraded_endpoint_is_hot_swapped(rpc):
+    rpc.hosts = {"http://a": {"slot": 1000}, "http://b": {"delay": 0.01, "slot": 1000}}
+    conn = DriftConnector(
+        {
+            "rpc_url": "http://a",
+            "rpc_endpoints": ["http://b"],
+            "private_key": "key",
+            "rpc_pool": {"probe_interval_sec": 0.01, "max_slot_lag": 50},
+        }
+    )
+    await conn.async_init()
+    first = conn.client
+    assert conn.rpc_pool.active.url == "http://a"
+
+    registry = Registry()
+    register_rpc_pool_metrics(conn.rpc_pool, registry)
+    assert 'rpc_endpoint_active{endpoint="a"} 1' in registry.render()
+
+    rpc.hosts["http://a"]["slot"] = 800
+    for _ in range(100):
+        await asyncio.sleep(0.01)
+        if conn.rpc_pool.swaps:
+            break
+    conn._monitor_task.cancel()
+
+    assert conn.rpc_pool.active.url == "http://b"
+    assert conn.connection.url == "http://b"
+    assert first.unsubscribed and first.connection.closed
+    text = registry.render()
+    assert 'rpc_endpoint_active{endpoint="b"} 1' in text
+    assert 'rpc_endpoint_slot_lag{endpoint="a"} 200' in text
+    assert "rpc_endpoint_swaps 1" in text
+
+
+@pytest.mark.asyncio
+async def test_retry_waits_on_clock_and_error_hides_urls(rpc):
+    url = "http://a/?api-key=secret"
+    rpc.hosts = {url: {"down": True}}
+    clock = VirtualClock()
+    conn = DriftConnector(
+        {
+            "rpc_url": url,
+            "private_key": "key",
+            "rpc_pool": {"connect_attempts": 3, "retry_delay_sec": 30},
+        },
+        clock=clock,
+    )
+    with pytest.raises(RuntimeError) as err:
+        await asyncio.wait_for(conn.async_init(), timeout=5)
+
+    assert clock.time() == 60
+    assert "secret" not in str(err.value) and "endpoint a after 3 attempts" in str(err.value)
+
+
+def test_ws_routing_is_installed_once(monkeypatch):
+    drift_types = types.SimpleNamespace(get_ws_url=lambda url: url.replace("http", "ws"))
+    monkeypatch.setitem(sys.modules, "driftpy", types.SimpleNamespace(types=drift_types))
+    monkeypatch.setattr(drift_connector, "_WS_URLS", {})
+    monkeypatch.setattr(drift_connector, "_ws_routing_installed", False)
+
+    for backup in ("http://b", "http://c"):
+        conn = DriftConnector({"rpc_url": "http://a", "ws_url": "wss://a-ws"})
+        conn.rpc_pool = RpcPool.from_config(
+            {**conn.config, "rpc_endpoints": [{"rpc_url": backup, "ws_url": backup + "-ws"}]}
+        )
+        conn._route_ws_urls()
+        if backup == "http://b":
+            routed = drift_types.get_ws_url
+
+    # the second connector added its URLs without wrapping the function again
+    assert drift_types.get_ws_url is routed
+    assert routed("http://a") == "wss://a-ws"
+    assert routed("http://c") == "http://c-ws"
+    assert routed("http://d") == "ws://d"
@@ -1,5 +1,9 @@
 from unittest.mock import patch
 
+import pytest
+
+from execution.clock import VirtualClock
+
 from strategies.runner import MultiStrategyRunner
 from strategies.basis import BasisStrategy
 from strategies.funding import FundingStrategy
@@ -51,7 +55,7 @@ def test_runner_instantiates_strategies():
         },
     }
 
-    with patch("strategies.base.ExecutionEngine", lambda a, b, c: DummyEngine()):
+    with patch("strategies.base.ExecutionEngine", lambda a, b, c, clock=None: DummyEngine()):
         drift = DummyConnector()
         hyper = DummyConnector()
         runner = MultiStrategyRunner(config, drift=drift, hyper=hyper)
@@ -59,3 +63,53 @@ def test_runner_instantiates_strategies():
     types = {type(s) for s in runner.strategies}
     assert BasisStrategy in types
     assert FundingStrategy in types
+
+
+def test_runner_shares_one_engine():
+    config = {
+        "market": "TEST",
+        "amount": 1.0,
+        "drift": {"market": "D"},
+        "hyperliquid": {"market": "H"},
+        "strategies": {"basis": True, "funding": True},
+    }
+
+    runner = MultiStrategyRunner(config, drift=DummyConnector(), hyper=DummyConnector())
+
+    assert len(runner.strategies) == 2
+    assert all(s.scheduler is runner.scheduler for s in runner.strategies)
+    assert all(s.engine is runner.scheduler.engine for s in runner.strategies)
+
+
+@pytest.mark.asyncio
+async def test_strategy_overrides_apply_to_its_own_trades():
+    config = {
+        "market": "TEST",
+        "amount": 1.0,
+        "drift": {"market": "D"},
+        "hyperliquid": {"market": "H"},
+        "safe_mode": False,
+        "timeouts": {"order_submit_sec": 10},
+        "strategies": {
+            "basis": {"safe_mode": True, "timeouts": {"order_submit_sec": 0.05}},
+            "funding": True,
+        },
+    }
+    hyper = DummyConnector()
+    clock = VirtualClock()
+    runner = MultiStrategyRunner(config, drift=DummyConnector(), hyper=hyper, clock=clock)
+    basis = next(s for s in runner.strategies if isinstance(s, BasisStrategy))
+    funding = next(s for s in runner.strategies if isinstance(s, FundingStrategy))
+    engine = runner.scheduler.engine
+
+    # the position never moves: basis gives up after its own timeout
+    with engine._using(basis.execution_settings):
+        filled = await engine._wait_fill(hyper.get_position, "H", "buy", 1, {"base_asset_amount": 0})
+    assert not filled and clock.time() < 10
+
+    engine.safe_mode_triggered = True
+    assert not await engine.execute_pair_trade(
+        "H", "D", "buy", "sell", 1, 1, 1, settings=basis.execution_settings
+    )
+    assert funding.execution_settings["safe_mode"] is False
+    assert funding.execution_settings["timeouts"] == {"order_submit_sec": 10}
@@ -0,0 +1,115 @@
+import asyncio
+
+import pytest
+
+from execution.scheduler import ExecutionScheduler
+
+
+class DummyEngine:
+    safe_mode_triggered = False
+
+
+def make_scheduler(**cfg):
+    return ExecutionScheduler(DummyEngine(), {"scheduler": cfg})
+
+
+@pytest.mark.asyncio
+async def test_conflicting_jobs_run_by_priority():
+    scheduler = make_scheduler(max_wait_sec=1)
+    order = []
+    release = asyncio.Event()
+
+    def job(name, wait=False):
+        async def _run():
+            order.append(name)
+            if wait:
+                await release.wait()
+            return True
+
+        return _run
+
+    legs = [("drift", "SOL-PERP"), ("hyperliquid", "SOL")]
+    first = asyncio.create_task(scheduler.submit(job("first", wait=True), legs, priority=1))
+    await asyncio.sleep(0)
+    low = asyncio.create_task(scheduler.submit(job("low"), legs, priority=1))
+    high = asyncio.create_task(scheduler.submit(job("high"), legs, priority=5))
+    await asyncio.sleep(0)
+
+    assert scheduler.metrics()["queue_depth"] == 2
+    release.set()
+    assert await asyncio.gather(first, low, high) == [True, True, True]
+    assert order == ["first", "high", "low"]
+    metrics = scheduler.metrics()
+    assert metrics["completed"] == 3 and metrics["queue_depth"] == 0
+    assert metrics["wait_sec_max"] > 0
+
+
+@pytest.mark.asyncio
+async def test_venue_concurrency_limit_and_expiry():
+    scheduler = make_scheduler(max_concurrent_per_venue=1, max_wait_sec=0.05)
+    release = asyncio.Event()
+
+    async def blocking():
+        await release.wait()
+        return True
+
+    async def quick():
+        return True
+
+    first = asyncio.create_task(scheduler.submit(blocking, [("drift", "SOL-PERP")]))
+    await asyncio.sleep(0)
+    # different symbol on the same venue still has to wait for a free slot
+    assert not await scheduler.submit(quick, [("drift", "ETH-PERP")])
+    assert scheduler.metrics()["expired"] == 1
+
+    release.set()
+    assert await first
+    assert await scheduler.submit(quick, [("drift", "ETH-PERP")])
+
+
+@pytest.mark.asyncio
+async def test_cancelled_submit_leaves_queue():
+    scheduler = make_scheduler(max_wait_sec=5)
+    release = asyncio.Event()
+    ran = []
+
+    async def blocking():
+        await release.wait()
+        return True
+
+    async def queued():
+        ran.append("queued")
+        return True
+
+    first = asyncio.create_task(scheduler.submit(blocking, [("drift", "SOL-PERP")]))
+    await asyncio.sleep(0)
+    waiting = asyncio.create_task(scheduler.submit(queued, [("drift", "SOL-PERP")]))
+    await asyncio.sleep(0)
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    assert scheduler.metrics()["queue_depth"] == 0
+
+    release.set()
+    assert await first
+    assert ran == []
+
+
+@pytest.mark.asyncio
+async def test_stop_cancels_running_jobs_after_timeout():
+    scheduler = make_scheduler(max_wait_sec=1)
+    cancelled = []
+
+    async def stuck():
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    submit = asyncio.create_task(scheduler.submit(stuck, [("drift", "SOL-PERP")]))
+    await asyncio.sleep(0)
+    await scheduler.stop(timeout=0.01)
+    assert cancelled == [True]
+    assert not await submit
+    assert scheduler.metrics()["in_flight"] == 0
@@ -0,0 +1,141 @@
+import pytest
+
+from connectors.base import ConnectorBase
+from connectors.simulator import LatencyModel, OrderRejected, SimulatedVenue
+from execution.clock import VirtualClock
+from execution.engine import ExecutionEngine
+
+
+class StaticBook(ConnectorBase):
+    def __init__(self, book):
+        super().__init__({})
+        self.book = book
+        self.calls = 0
+
+    async def fetch_book(self, symbol):
+        self.calls += 1
+        return self.book
+
+    async def fetch_funding(self, symbol):
+        return {"funding_rate": 0.0001}
+
+    async def place_order(self, symbol, side, amount, price):
+        raise NotImplementedError
+
+    async def cancel_order(self, order_id):
+        raise NotImplementedError
+
+    async def get_position(self, symbol):
+        raise NotImplementedError
+
+
+BOOK = {
+    "bids": [{"price": 99.0, "size": 2.0}, {"price": 98.0, "size": 5.0}],
+    "asks": [{"price": 101.0, "size": 2.0}, {"price": 102.0, "size": 5.0}],
+}
+
+
+@pytest.mark.asyncio
+async def test_matching_walks_levels_and_rests_remainder():
+    clock = VirtualClock()
+    source = StaticBook(BOOK)
+    venue = SimulatedVenue({"update_interval_sec": 1.0}, source=source, clock=clock)
+    oid = await venue.place_order("SOL", "buy", 4.0, 101.5)
+
+    pos = venue._positions["SOL"]
+    # the 102 level is above the limit, so only 2 fill and 2 rest
+    assert pos["base_asset_amount"] == pytest.approx(2.0)
+    assert pos["quote_asset_amount"] == pytest.approx(-202.0)
+    assert [o["remaining"] for o in venue.open_orders()] == [pytest.approx(2.0)]
+
+    # polling within the update interval keeps the consumed book
+    for _ in range(3):
+        await venue.get_position("SOL")
+    assert source.calls == 1 and venue.open_orders()
+
+    # the next update brings a fresh 101 level that the resting order takes
+    await clock.sleep(1.0)
+    pos = await venue.get_position("SOL")
+    assert source.calls == 2
+    assert pos["base_asset_amount"] == pytest.approx(4.0)
+    assert not venue.open_orders()
+
+    await venue.cancel_order(oid)
+    assert venue.stats["cancels"] == 0
+
+
+@pytest.mark.asyncio
+async def test_unknown_size_is_unlimited_and_book_is_consumed():
+    source = StaticBook({"bids": [{"price": 99.0, "size": 0}], "asks": [{"price": 101.0, "size": 0}]})
+    venue = SimulatedVenue({}, source=source)
+    await venue.place_order("SOL", "sell", 50.0, 99.0)
+    assert (await venue.get_position("SOL"))["base_asset_amount"] == pytest.approx(-50.0)
+
+    synthetic = SimulatedVenue({"mid": 100.0, "levels": 2, "level_size": 1.0, "update_interval_sec": 60})
+    await synthetic.place_order("SOL", "buy", 1.5, 200.0)
+    book = await synthetic.fetch_book("SOL")
+    assert len(book["asks"]) == 1
+    assert book["asks"][0]["size"] == pytest.approx(0.5)
+
+
+@pytest.mark.asyncio
+async def test_synthetic_symbols_walk_independently():
+    clock = VirtualClock()
+    venue = SimulatedVenue(
+        {"mid": 100.0, "spread_bps": 0, "levels": 1, "volatility_bps": 50, "seed": 3}, clock=clock
+    )
+    await venue.fetch_book("SOL")
+    await clock.sleep(30)
+    sol = await venue.fetch_book("SOL")
+    assert sol["asks"][0]["price"] != pytest.approx(100.0)
+
+    # a symbol seen for the first time starts at mid, not where SOL went
+    eth = await venue.fetch_book("ETH")
+    assert eth["asks"][0]["price"] == pytest.approx(100.0)
+    assert (await venue.fetch_book("SOL"))["asks"][0]["price"] == sol["asks"][0]["price"]
+
+
+@pytest.mark.asyncio
+async def test_rejects_and_partial_fills_are_seeded():
+    cfg = {"seed": 7, "reject_prob": 1.0}
+    venue = SimulatedVenue(cfg, source=StaticBook(BOOK))
+    with pytest.raises(OrderRejected):
+        await venue.place_order("SOL", "buy", 1.0, 101.0)
+    assert venue.stats["rejects"] == 1
+
+    cfg = {"seed": 7, "partial_fill_prob": 1.0, "partial_fill_ratio": (0.5, 0.5)}
+    venue = SimulatedVenue(cfg, source=StaticBook(BOOK))
+    await venue.place_order("SOL", "buy", 1.0, 101.0)
+    assert venue._positions["SOL"]["base_asset_amount"] == pytest.approx(0.5)
+    assert venue.stats["partial_fills"] == 1
+
+
+def test_latency_models():
+    import random
+
+    rng = random.Random(1)
+    assert LatencyModel("constant", 20).sample(rng) == pytest.approx(0.02)
+    samples = [LatencyModel("uniform", 10, 5).sample(rng) for _ in range(100)]
+    assert all(0.005 <= s <= 0.015 for s in samples)
+    assert all(LatencyModel("normal", 1, 50).sample(rng) >= 0 for _ in range(100))
+    with pytest.raises(ValueError):
+        LatencyModel("pareto")
+
+
+@pytest.mark.asyncio
+async def test_engine_unwinds_when_one_venue_rejects(monkeypatch):
+    monkeypatch.setattr("execution.engine.log_trade", lambda *a, **k: None)
+    monkeypatch.setattr("execution.engine.log_event", lambda *a, **k: None)
+    tight = {"bids": [{"price": 100.9, "size": 5.0}], "asks": [{"price": 101.0, "size": 5.0}]}
+    latency = {"kind": "uniform", "mean_ms": 2, "jitter_ms": 1}
+    hyper = SimulatedVenue({"latency": latency, "seed": 1}, source=StaticBook(tight))
+    drift = SimulatedVenue({"reject_prob": 1.0, "seed": 1}, source=StaticBook(tight))
+    engine = ExecutionEngine(hyper, drift, {"timeouts": {"order_submit_sec": 1}})
+
+    ok = await engine.execute_pair_trade("SOL", "SOL-PERP", "buy", "sell", 1.0, 101.0, 100.9)
+
+    assert not ok
+    assert not engine.safe_mode_triggered
+    # the filled hyperliquid leg was flattened again
+    assert (await hyper.get_position("SOL"))["base_asset_amount"] == pytest.approx(0.0)
+    assert hyper.stats["orders"] == 2
@@ -55,7 +55,7 @@ def make_strategy(cls, drift_book, hyper_book, drift_funding=None, hyper_funding
         "hyperliquid": {"market": "H"},
     }
     config.update(cfg)
-    with patch("strategies.base.ExecutionEngine", lambda a, b, c: DummyEngine()):
+    with patch("strategies.base.ExecutionEngine", lambda a, b, c, clock=None: DummyEngine()):
         strat = cls(config, drift=drift, hyper=hyper)
     return strat
 
@@ -188,7 +188,7 @@ async def test_execute_passes_correct_sides(long_exchange, side_a, side_b):
         "hyperliquid": {"market": "H"},
     }
 
-    with patch("strategies.base.ExecutionEngine", lambda a, b, c: engine):
+    with patch("strategies.base.ExecutionEngine", lambda a, b, c, clock=None: engine):
         strat = BasisStrategy(config, drift=drift, hyper=hyper)
 
     opportunity = {
@@ -205,3 +205,33 @@ async def test_execute_passes_correct_sides(long_exchange, side_a, side_b):
     exp_price_a = opportunity["short_price"] if long_exchange == "drift" else opportunity["long_price"]
     exp_price_b = opportunity["long_price"] if long_exchange == "drift" else opportunity["short_price"]
     assert call == ("H", "D", side_a, side_b, 1.0, exp_price_a, exp_price_b)
+
+
+@pytest.mark.asyncio
+async def test_execute_uses_sliced_mode():
+    class SlicingEngine(CaptureEngine):
+        def __init__(self):
+            super().__init__()
+            self.sliced = []
+
+        async def execute_sliced_pair_trade(self, *args, **kwargs):
+            self.sliced.append(args)
+            return True
+
+    engine = SlicingEngine()
+    config = {
+        "market": "TEST",
+        "amount": 5.0,
+        "drift": {"market": "D"},
+        "hyperliquid": {"market": "H"},
+        "execution": {"mode": "sliced"},
+    }
+    with patch("strategies.base.ExecutionEngine", lambda a, b, c, clock=None: engine):
+        strat = BasisStrategy(config, drift=DummyConnector(), hyper=DummyConnector())
+
+    await strat.execute(
+        {"long_exchange": "drift", "short_exchange": "hyperliquid", "long_price": 10, "short_price": 11}
+    )
+
+    assert engine.sliced and not engine.calls
+    assert engine.sliced[0][4] == 5.0
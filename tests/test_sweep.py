@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from backtest import MarketData, run_backtest
+from backtest.sweep import format_table, grid, parse_space, random_sample, run_sweep
+
+BASE = {"amount": 1.0, "fees": {"drift": 0.0001, "hyperliquid": 0.0001}}
+
+
+def synthetic_data(n=5000):
+    rng = np.random.default_rng(3)
+    mid = 100 + np.cumsum(rng.normal(0, 0.02, n))
+    noise = rng.normal(0, 0.2, n)
+    ones = np.ones((n, 1))
+    return MarketData(
+        t=np.arange(n, dtype=float),
+        drift_bid_px=(mid - 0.05)[:, None], drift_bid_sz=ones,
+        drift_ask_px=(mid + 0.05)[:, None], drift_ask_sz=ones,
+        hyper_bid_px=(mid + noise - 0.05)[:, None], hyper_bid_sz=ones,
+        hyper_ask_px=(mid + noise + 0.05)[:, None], hyper_ask_sz=ones,
+        rate_drift=np.zeros(n), rate_hyper=np.zeros(n),
+    )
+
+
+def test_grid_and_random_sample():
+    assert grid({"amount": [1, 2], "min_profit_usd": [0.1]}) == [
+        {"amount": 1, "min_profit_usd": 0.1},
+        {"amount": 2, "min_profit_usd": 0.1},
+    ]
+    points = random_sample({"hold_time_sec": (10, 20), "amount": [1, 2]}, 5, seed=1)
+    assert len(points) == 5
+    assert all(10 <= p["hold_time_sec"] <= 20 and p["amount"] in (1, 2) for p in points)
+    assert parse_space(["amount=1,2", "hold_time_sec=5:50"]) == {
+        "amount": [1.0, 2.0],
+        "hold_time_sec": (5.0, 50.0),
+    }
+    with pytest.raises(ValueError):
+        parse_space(["fees=1"])
+
+
+def test_sweep_ranks_results_like_sequential_backtests():
+    data = synthetic_data()
+    candidates = grid({"min_profit_usd": [0.0, 0.1, 0.3], "hold_time_sec": [30, 120]})
+
+    rows = run_sweep(data, {**BASE, "max_slippage_bps": 50}, "basis", candidates, workers=2)
+
+    assert len(rows) == len(candidates)
+    pnls = [r["total_pnl"] for r in rows]
+    assert pnls == sorted(pnls, reverse=True)
+    best = rows[0]
+    expected = run_backtest(
+        data,
+        {**BASE, "max_slippage_bps": 50, "min_profit_usd": best["min_profit_usd"], "hold_time_sec": best["hold_time_sec"]},
+        "basis",
+    ).summary
+    assert best["total_pnl"] == pytest.approx(expected["total_pnl"])
+    assert best["trades"] == expected["trades"]
+
+    table = format_table(rows, limit=2)
+    assert len(table.splitlines()) == 3 and "max_drawdown" in table
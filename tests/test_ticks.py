@@ -0,0 +1,112 @@
+import numpy as np
+import pytest
+
+from connectors.base import ConnectorBase
+from connectors.recording import RecordingConnector
+from storage.ticks import TickArchive, TickRecorder, row_to_book, row_to_funding
+
+DAY = 1_714_521_600.0  # 2024-05-01 00:00:00 UTC
+
+
+def test_book_roundtrip_and_time_range(tmp_path):
+    rec = TickRecorder(tmp_path, levels=2, chunk_rows=2)
+    for i in range(5):
+        book = {
+            "bids": [{"price": 100 + i, "size": 1.5}],
+            "asks": [{"price": 101 + i}, {"price": 102 + i, "size": 0}],
+        }
+        rec.record_book("drift", "SOL-PERP", book, ts=DAY + i)
+    rec.close()
+
+    archive = TickArchive(tmp_path)
+    cols = archive.read("drift", "SOL-PERP", "book", start=DAY + 1, end=DAY + 4)
+
+    assert list(cols["ts"]) == [DAY + 1, DAY + 2, DAY + 3]
+    assert isinstance(cols["bid_px_0"], np.memmap)
+    assert row_to_book(cols, 0) == {
+        "bids": [{"price": 101.0, "size": 1.5}],
+        "asks": [{"price": 102.0}, {"price": 103.0, "size": 0.0}],
+    }
+
+
+def test_funding_columns_added_later_are_padded(tmp_path):
+    rec = TickRecorder(tmp_path, chunk_rows=1)
+    rec.record_funding("hyperliquid", "SOL", {"funding_rate": "0.0001"}, ts=DAY)
+    rec.record_funding("hyperliquid", "SOL", {"funding_rate": 0.0002, "premium": 3}, ts=DAY + 1)
+    rec.close()
+
+    cols = TickArchive(tmp_path).read("hyperliquid", "SOL", "funding")
+    assert row_to_funding(cols, 0) == {"funding_rate": 0.0001}
+    assert row_to_funding(cols, 1) == {"funding_rate": 0.0002, "premium": 3.0}
+
+
+def test_restart_with_other_columns_keeps_rows_aligned(tmp_path):
+    rec = TickRecorder(tmp_path)
+    rec.record_funding("drift", "SOL-PERP", {"funding_rate": 1, "premium": 5}, ts=DAY)
+    rec.close()
+    rec = TickRecorder(tmp_path)
+    rec.record_funding("drift", "SOL-PERP", {"funding_rate": 2, "oracle": 7}, ts=DAY + 1)
+    rec.record_funding("drift", "SOL-PERP", {"funding_rate": 3}, ts=DAY + 2)
+    rec.close()
+
+    cols = TickArchive(tmp_path).read("drift", "SOL-PERP", "funding")
+    assert all(len(col) == 3 for col in cols.values())
+    assert [row_to_funding(cols, i) for i in range(3)] == [
+        {"funding_rate": 1.0, "premium": 5.0},
+        {"funding_rate": 2.0, "oracle": 7.0},
+        {"funding_rate": 3.0},
+    ]
+
+
+def test_short_column_is_an_error(tmp_path):
+    rec = TickRecorder(tmp_path)
+    for i in range(3):
+        rec.record_funding("drift", "SOL-PERP", {"funding_rate": i}, ts=DAY + i)
+    rec.close()
+    column = tmp_path / "2024-05-01" / "drift" / "SOL-PERP" / "funding" / "funding_rate.f64"
+    column.write_bytes(column.read_bytes()[:8])
+
+    with pytest.raises(ValueError, match="funding_rate"):
+        TickArchive(tmp_path).read("drift", "SOL-PERP", "funding")
+
+
+def test_ranges_spanning_days_are_concatenated(tmp_path):
+    rec = TickRecorder(tmp_path)
+    rec.record_funding("drift", "SOL-PERP", {"last_funding_rate": 1}, ts=DAY - 1)
+    rec.record_funding("drift", "SOL-PERP", {"last_funding_rate": 2}, ts=DAY + 1)
+    rec.close()
+
+    archive = TickArchive(tmp_path)
+    assert archive.days() == ["2024-04-30", "2024-05-01"]
+    cols = archive.read("drift", "SOL-PERP", "funding")
+    assert list(cols["last_funding_rate"]) == [1.0, 2.0]
+
+
+@pytest.mark.asyncio
+async def test_recording_connector_archives_snapshots(tmp_path):
+    class Source(ConnectorBase):
+        async def fetch_book(self, symbol):
+            return {"bids": [{"price": 1, "size": 2}], "asks": [{"price": 3, "size": 4}]}
+
+        async def fetch_funding(self, symbol):
+            return {"funding_rate": 0.5}
+
+        async def place_order(self, symbol, side, amount, price):
+            return 1
+
+        async def cancel_order(self, order_id):
+            pass
+
+        async def get_position(self, symbol):
+            return {}
+
+    rec = TickRecorder(tmp_path)
+    conn = RecordingConnector(Source({"market": "X"}), rec, "hyperliquid")
+    book = await conn.fetch_book("SOL")
+    await conn.fetch_funding("SOL")
+    rec.close()
+
+    archive = TickArchive(tmp_path)
+    assert row_to_book(archive.read("hyperliquid", "SOL", "book"), 0) == book
+    assert list(archive.read("hyperliquid", "SOL", "funding")["funding_rate"]) == [0.5]
+    assert conn.config == {"market": "X"}
@@ -0,0 +1,123 @@
+import asyncio
+import json
+
+import pytest
+
+from connectors.base import ConnectorBase
+from execution.engine import ExecutionEngine
+from execution.scheduler import ExecutionScheduler
+from monitoring import tracing
+
+
+class FillingConnector(ConnectorBase):
+    """Orders fill as soon as they are placed."""
+
+    def __init__(self):
+        super().__init__({})
+        self.size = 0.0
+
+    async def fetch_book(self, symbol):
+        return {"bids": [{"price": 99, "size": 1}], "asks": [{"price": 101, "size": 1}]}
+
+    async def fetch_funding(self, symbol):
+        return {}
+
+    async def place_order(self, symbol, side, amount, price):
+        self.size += amount if side == "buy" else -amount
+        return f"{symbol}-1"
+
+    async def cancel_order(self, order_id):
+        return None
+
+    async def get_position(self, symbol):
+        return {"base_asset_amount": self.size}
+
+
+@pytest.fixture
+def traces(tmp_path, monkeypatch):
+    path = tmp_path / "traces.jsonl"
+    monkeypatch.setattr("execution.engine.log_trade", lambda *a, **k: None)
+    monkeypatch.setattr("execution.engine.log_event", lambda *a, **k: None)
+    monkeypatch.setattr("execution.scheduler.log_event", lambda *a, **k: None)
+    tracing.configure({"tracing": {"enabled": True, "path": str(path)}})
+    yield path
+    tracing.configure({})
+
+
+def read(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+@pytest.mark.asyncio
+async def test_pair_trade_trace_and_breakdown(traces):
+    drift, hyper = FillingConnector(), FillingConnector()
+    engine = ExecutionEngine(hyper, drift, {})
+    hyper_t = tracing.TracedConnector(hyper, "hyperliquid")
+
+    with tracing.span("iteration"):
+        with tracing.span("find_opportunity"):
+            await hyper_t.fetch_book("SOL")
+        tracing.keep_trace()
+        tracing.event("opportunity", profit=1.0)
+        assert await engine.execute_pair_trade("SOL", "SOL-PERP", "buy", "sell", 1, 101, 102)
+
+    with tracing.span("iteration"):
+        pass  # nothing found: not exported
+
+    [record] = read(traces)
+    spans = {s["name"]: s for s in record["spans"]}
+    assert {s["trace_id"] for s in record["spans"]} == {record["trace_id"]}
+    assert spans["fetch_book"]["parent_id"] == spans["find_opportunity"]["span_id"]
+    assert spans["execute_pair_trade"]["attrs"]["ok"] is True
+    assert spans["log_trade"]["parent_id"] == spans["execute_pair_trade"]["span_id"]
+    submits = [s for s in record["spans"] if s["name"] == "submit"]
+    assert {s["attrs"]["venue"] for s in submits} == {"hyperliquid", "drift"}
+    assert all(s["end_ns"] >= s["start_ns"] for s in record["spans"])
+
+    breakdown = tracing.latency_breakdown(traces)
+    assert set(breakdown) == {"drift", "hyperliquid"}
+    stats = breakdown["drift"]
+    assert stats["decision_to_ack"]["count"] == 1
+    assert stats["decision_to_fill"]["p50"] >= stats["decision_to_ack"]["p50"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_keeps_each_job_in_its_trace(traces):
+    scheduler = ExecutionScheduler(ExecutionEngine(None, None, {}), {"scheduler": {"max_wait_sec": 1}})
+    release = asyncio.Event()
+    seen = {}
+
+    def job(name, wait=False):
+        async def _run():
+            seen[name] = tracing.current().trace_id
+            if wait:
+                await release.wait()
+            return True
+
+        return _run
+
+    async def opportunity(name, wait=False):
+        with tracing.span("iteration") as root:
+            tracing.keep_trace()
+            await scheduler.submit(job(name, wait), [("drift", "SOL-PERP")])
+            return root.trace_id
+
+    first = asyncio.create_task(opportunity("first", wait=True))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(opportunity("second"))
+    await asyncio.sleep(0)
+    release.set()  # "second" is started from the task running "first"
+    ids = await asyncio.gather(first, second)
+
+    assert [seen["first"], seen["second"]] == ids
+    assert len(read(traces)) == 2
+
+
+def test_disabled_tracing_is_a_noop(tmp_path):
+    tracing.configure({"tracing": {"enabled": False, "path": str(tmp_path / "t.jsonl")}})
+    with tracing.span("iteration") as span:
+        tracing.keep_trace()
+        span.event("opportunity")
+        assert tracing.current() is None
+        assert tracing.trace_fields() == {}
+    assert not (tmp_path / "t.jsonl").exists()